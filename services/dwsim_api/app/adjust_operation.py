@@ -2,7 +2,8 @@
 Adjust and Set logical operations for flowsheet specification.
 
 Adjust: Varies a parameter on a unit operation until a target stream
-property reaches a desired value (uses Brent's method root-finding).
+property reaches a desired value (uses Chandrupatla's bracketed
+root-finding).
 
 Set: Applies a linear relationship between a source and target parameter
 before the solver runs.
@@ -10,14 +11,18 @@ before the solver runs.
 
 from __future__ import annotations
 
-import copy
-from typing import Any, Dict, List, Optional
+import dataclasses
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 from loguru import logger
-from scipy.optimize import brentq
 
 from . import schemas
-from .thermo_client import ThermoClient
+from .thermo_client import ThermoClient, get_default_client
 
 
 # ---------------------------------------------------------------------------
@@ -25,50 +30,36 @@ from .thermo_client import ThermoClient
 # ---------------------------------------------------------------------------
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
 class AdjustSpec:
     """Specification for an Adjust (controller) operation."""
 
-    def __init__(
-        self,
-        variable_unit_id: str,
-        variable_param: str,
-        variable_min: float,
-        variable_max: float,
-        target_stream_id: str,
-        target_property: str,
-        target_value: float,
-        tolerance: float = 1e-4,
-        max_iterations: int = 50,
-    ):
-        self.variable_unit_id = variable_unit_id
-        self.variable_param = variable_param
-        self.variable_min = variable_min
-        self.variable_max = variable_max
-        self.target_stream_id = target_stream_id
-        self.target_property = target_property
-        self.target_value = target_value
-        self.tolerance = tolerance
-        self.max_iterations = max_iterations
-
-
+    variable_unit_id: str
+    variable_param: str
+    variable_min: float
+    variable_max: float
+    target_stream_id: str
+    target_property: str
+    target_value: float
+    tolerance: float = 1e-4
+    max_iterations: int = 50
+    rtol: float = 0.0
+    initial_guess: Optional[float] = None
+    # Optional cheap model of the target property as a function of the
+    # variable; when given, the root is found on it instead of the flowsheet.
+    surrogate: Optional[Callable[[float], float]] = None
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class SetSpec:
     """Specification for a Set (linear constraint) operation."""
 
-    def __init__(
-        self,
-        source_unit_id: str,
-        source_param: str,
-        target_unit_id: str,
-        target_param: str,
-        multiplier: float = 1.0,
-        offset: float = 0.0,
-    ):
-        self.source_unit_id = source_unit_id
-        self.source_param = source_param
-        self.target_unit_id = target_unit_id
-        self.target_param = target_param
-        self.multiplier = multiplier
-        self.offset = offset
+    source_unit_id: str
+    source_param: str
+    target_unit_id: str
+    target_param: str
+    multiplier: float = 1.0
+    offset: float = 0.0
 
 
 # ---------------------------------------------------------------------------
@@ -76,143 +67,746 @@ class SetSpec:
 # ---------------------------------------------------------------------------
 
 _PROPERTY_MAP = {
-    "temperature_c": lambda s: s.temperature_c,
-    "pressure_kpa": lambda s: s.pressure_kpa,
-    "vapor_fraction": lambda s: s.vapor_fraction,
-    "mass_flow_kg_per_h": lambda s: s.mass_flow_kg_per_h,
-    "mole_flow_kmol_per_h": lambda s: s.mole_flow_kmol_per_h,
-    "density_kg_per_m3": lambda s: s.density_kg_per_m3,
-    "enthalpy_kj_per_kg": lambda s: s.enthalpy_kj_per_kg,
-    "molecular_weight": lambda s: s.molecular_weight,
+    name: attrgetter(name)
+    for name in (
+        "temperature_c",
+        "pressure_kpa",
+        "vapor_fraction",
+        "mass_flow_kg_per_h",
+        "mole_flow_kmol_per_h",
+        "density_kg_per_m3",
+        "enthalpy_kj_per_kg",
+        "molecular_weight",
+    )
 }
 
 
-def _extract_target_value(
-    result: schemas.SimulationResult,
-    stream_id: str,
-    prop: str,
-) -> Optional[float]:
-    """Extract a numeric property from a simulation result stream."""
-    stream = next((s for s in result.streams if s.id == stream_id), None)
-    if stream is None:
-        return None
-
+def _stream_value_getter(prop: str) -> Callable[[Any], Optional[float]]:
+    """Resolve `prop` once into a getter applied to a result stream."""
     # Check built-in property map first
     getter = _PROPERTY_MAP.get(prop)
     if getter:
-        return getter(stream)
+        return getter
 
     # Check composition by component name (e.g. "composition.benzene")
     if prop.startswith("composition."):
         comp_name = prop.split(".", 1)[1]
-        if stream.composition:
-            return stream.composition.get(comp_name)
-        return None
+
+        def _composition(stream: Any) -> Optional[float]:
+            if stream.composition:
+                return stream.composition.get(comp_name)
+            return None
+
+        return _composition
 
     # Try direct attribute access
-    val = getattr(stream, prop, None)
-    if isinstance(val, (int, float)):
-        return val
-    return None
+    def _attribute(stream: Any) -> Optional[float]:
+        val = getattr(stream, prop, None)
+        if isinstance(val, (int, float)):
+            return val
+        return None
+
+    return _attribute
+
+
+# ---------------------------------------------------------------------------
+# Root finding
+# ---------------------------------------------------------------------------
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _chandrupatla(
+    f,
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    xtol: float,
+    rtol: float = 0.0,
+    maxiter: int = 50,
+) -> float:
+    """
+    Find a root of `f` in [a, b] using Chandrupatla's method.
+
+    `fa` and `fb` are f(a) and f(b), already evaluated by the caller and
+    of opposite sign. Inverse quadratic interpolation is used whenever it
+    is safe, falling back to bisection otherwise, which typically needs
+    fewer evaluations than Brent's method on smooth monotone responses.
+    Terminates once the bracket is narrower than `xtol + rtol * |x|`.
+    """
+    x1, f1, x2, f2 = a, fa, b, fb
+    x3, f3 = x1, f1
+    t = 0.5
+
+    for _ in range(maxiter):
+        x = x1 + t * (x2 - x1)
+        fx = f(x)
+
+        # Keep [x1, x2] bracketing the root; x3 is the discarded point
+        if _sign(fx) == _sign(f1):
+            x3, f3 = x1, f1
+        else:
+            x3, f3 = x2, f2
+            x2, f2 = x1, f1
+        x1, f1 = x, fx
+
+        if abs(f1) < abs(f2):
+            xmin, fmin = x1, f1
+        else:
+            xmin, fmin = x2, f2
+        if fmin == 0:
+            return xmin
+
+        dx = abs(x2 - x1)
+        tol = xtol + rtol * abs(xmin)
+        if dx < tol:
+            return xmin
+
+        xi = (x1 - x2) / (x3 - x2)
+        phi = (f1 - f2) / (f3 - f2)
+        if 0 < xi < 1 and 1 - (1 - xi) ** 0.5 < phi < xi ** 0.5:
+            alpha = (x3 - x1) / (x2 - x1)
+            t = (
+                f1 / (f1 - f2) * f3 / (f3 - f2)
+                - alpha * f1 / (f3 - f1) * f2 / (f2 - f3)
+            )
+        else:
+            t = 0.5
+
+        # Keep the next point away from the bracket ends
+        tl = 0.5 * tol / dx
+        t = min(max(t, tl), 1 - tl)
+
+    raise RuntimeError(
+        f"Failed to converge after {maxiter} iterations, value is {xmin}"
+    )
+
+
+def _chandrupatla_batch(
+    f,
+    a: np.ndarray,
+    b: np.ndarray,
+    fa: np.ndarray,
+    fb: np.ndarray,
+    xtol: float,
+    rtol: float = 0.0,
+    maxiter: int = 50,
+) -> np.ndarray:
+    """
+    Vectorised `_chandrupatla` over independent brackets [a[i], b[i]].
+
+    `f(idx, x)` evaluates problems `idx` at points `x` and returns an array
+    of the same length; converged problems drop out of later evaluations.
+    Problems still open after `maxiter` iterations are returned as NaN.
+    """
+    x1, f1 = np.array(a, dtype=float), np.array(fa, dtype=float)
+    x2, f2 = np.array(b, dtype=float), np.array(fb, dtype=float)
+    x3, f3 = x1.copy(), f1.copy()
+    t = np.full(x1.shape, 0.5)
+    roots = np.full(x1.shape, np.nan)
+    active = np.arange(x1.size)
+
+    for _ in range(maxiter):
+        if not active.size:
+            break
+        i = active
+        x = x1[i] + t[i] * (x2[i] - x1[i])
+        fx = np.asarray(f(i, x), dtype=float)
+
+        # Keep [x1, x2] bracketing the root; x3 is the discarded point
+        same = np.sign(fx) == np.sign(f1[i])
+        x3[i] = np.where(same, x1[i], x2[i])
+        f3[i] = np.where(same, f1[i], f2[i])
+        x2[i] = np.where(same, x2[i], x1[i])
+        f2[i] = np.where(same, f2[i], f1[i])
+        x1[i], f1[i] = x, fx
+
+        smaller = np.abs(f1[i]) < np.abs(f2[i])
+        xmin = np.where(smaller, x1[i], x2[i])
+        fmin = np.where(smaller, f1[i], f2[i])
+        dx = np.abs(x2[i] - x1[i])
+        tol = xtol + rtol * np.abs(xmin)
+        done = (fmin == 0) | (dx < tol)
+        roots[i[done]] = xmin[done]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xi = (x1[i] - x2[i]) / (x3[i] - x2[i])
+            phi = (f1[i] - f2[i]) / (f3[i] - f2[i])
+            alpha = (x3[i] - x1[i]) / (x2[i] - x1[i])
+            iqi = (
+                (0 < xi) & (xi < 1)
+                & (1 - np.sqrt(1 - xi) < phi) & (phi < np.sqrt(xi))
+            )
+            t_iqi = (
+                f1[i] / (f1[i] - f2[i]) * f3[i] / (f3[i] - f2[i])
+                - alpha * f1[i] / (f3[i] - f1[i]) * f2[i] / (f2[i] - f3[i])
+            )
+            tl = 0.5 * tol / dx
+        t[i] = np.clip(np.where(iqi, t_iqi, 0.5), tl, 1 - tl)
+
+        active = i[~done]
+
+    return roots
+
+
+def _secant_from_guess(
+    f,
+    guess: float,
+    lo: float,
+    hi: float,
+    ftol: float,
+    steps: int = 3,
+) -> Tuple[Optional[float], Optional[Tuple[float, float]]]:
+    """
+    Refine `guess` with a few secant steps clamped to [lo, hi].
+
+    Returns `(root, None)` once |f| drops below `ftol`. Otherwise returns
+    `(None, bracket)` where `bracket` is the tightest pair of probed points
+    straddling zero, or None if no such pair was seen.
+    """
+    x0 = min(max(guess, lo), hi)
+    delta = 1e-3 * (hi - lo)
+    x1 = x0 + delta if x0 + delta <= hi else x0 - delta
+    f0 = f(x0)
+    if abs(f0) < ftol:
+        return x0, None
+    f1 = f(x1)
+    points = [(x0, f0), (x1, f1)]
+
+    for _ in range(steps):
+        if abs(f1) < ftol:
+            return x1, None
+        if f1 == f0:
+            break
+        x_next = x1 - f1 * (x1 - x0) / (f1 - f0)
+        x0, f0 = x1, f1
+        x1 = min(max(x_next, lo), hi)
+        f1 = f(x1)
+        points.append((x1, f1))
+
+    if abs(f1) < ftol:
+        return x1, None
+
+    bracket = None
+    for (xa, fa), (xb, fb) in itertools.combinations(points, 2):
+        if _sign(fa) * _sign(fb) < 0:
+            a, b = min(xa, xb), max(xa, xb)
+            if bracket is None or b - a < bracket[1] - bracket[0]:
+                bracket = (a, b)
+    return None, bracket
 
 
 # ---------------------------------------------------------------------------
 # Adjust solver
 # ---------------------------------------------------------------------------
 
+# Upper bound on concurrent solves for batched and grouped Adjusts
+_MAX_PARALLEL_ADJUSTS = 4
 
-def run_adjust(
+
+def _solves_concurrently(client: ThermoClient) -> bool:
+    """Whether `client` may run several flowsheet solves at once."""
+    return getattr(client, "thread_safe", False)
+
+
+def _adjust_evaluator(
     payload: schemas.FlowsheetPayload,
     adjust_spec: AdjustSpec,
-    client: Optional[ThermoClient] = None,
-) -> schemas.SimulationResult:
+    client: ThermoClient,
+    cache_size: Optional[int] = 64,
+) -> Tuple[
+    Callable[[float], schemas.SimulationResult],
+    Callable[[float], float],
+]:
     """
-    Run an Adjust operation using Brent's method.
+    Build the `simulate(x)` and `actual(x)` functions for an Adjust.
 
-    Varies `variable_param` on `variable_unit_id` within [min, max] until
-    `target_stream_id.target_property == target_value`.
+    `simulate` solves the flowsheet with the variable parameter set to `x`;
+    `actual` returns the target property of that solve and raises
+    ValueError when it cannot be extracted.
     """
-    if client is None:
-        client = ThermoClient()
-
-    warnings: List[str] = []
-
-    def _objective(param_value: float) -> float:
-        """Objective function for root-finding: actual - target."""
-        # Deep-copy payload and set the parameter
-        p = _clone_payload_with_param(
-            payload,
-            adjust_spec.variable_unit_id,
-            adjust_spec.variable_param,
-            param_value,
-        )
+    # The spec is constant for the whole run; bind what the hot closures
+    # read to locals.
+    var_param = adjust_spec.variable_param
+    tgt_stream = adjust_spec.target_stream_id
+    tgt_prop = adjust_spec.target_property
+
+    # The final solve repeats the root (and the bracket ends are reused by
+    # the fallback), so memoise flowsheet solves on the rounded parameter
+    # value. The unit being varied is fixed for the whole run; locate it once.
+    unit_index = _find_unit_index(payload, adjust_spec.variable_unit_id)
+
+    @functools.lru_cache(maxsize=cache_size)
+    def _simulate_at(param_value: float) -> schemas.SimulationResult:
+        p = _clone_with_unit_param(payload, unit_index, var_param, param_value)
         result = client.simulate_flowsheet(p)
 
         if not result.converged:
             logger.warning(
                 "Adjust: flowsheet did not converge at {}={}",
-                adjust_spec.variable_param, param_value,
+                var_param, param_value,
             )
+        return result
 
-        actual = _extract_target_value(
-            result,
-            adjust_spec.target_stream_id,
-            adjust_spec.target_property,
-        )
+    def _simulate(param_value: float) -> schemas.SimulationResult:
+        return _simulate_at(round(param_value, 12))
+
+    # The target property is fixed for the run; resolve its getter once.
+    stream_value = _stream_value_getter(tgt_prop)
+
+    # Stream order is stable across solves of the same flowsheet; remember
+    # where the target stream sits so later lookups skip the scan.
+    target_pos: Optional[int] = None
+
+    def _target_stream(result: schemas.SimulationResult) -> Any:
+        nonlocal target_pos
+        streams = result.streams
+        if (
+            target_pos is not None
+            and target_pos < len(streams)
+            and streams[target_pos].id == tgt_stream
+        ):
+            return streams[target_pos]
+        for idx, s in enumerate(streams):
+            if s.id == tgt_stream:
+                target_pos = idx
+                return s
+        return None
+
+    def _actual(param_value: float) -> float:
+        stream = _target_stream(_simulate(param_value))
+        actual = stream_value(stream) if stream is not None else None
         if actual is None:
             raise ValueError(
-                f"Could not extract '{adjust_spec.target_property}' "
-                f"from stream '{adjust_spec.target_stream_id}'"
+                f"Could not extract '{tgt_prop}' from stream '{tgt_stream}'"
             )
+        return actual
+
+    return _simulate, _actual
 
-        return actual - adjust_spec.target_value
 
+def _adjust_diagnostics(
+    adjust_spec: AdjustSpec,
+    converged_value: float,
+    target_value: float,
+) -> Dict[str, Any]:
+    return {
+        "variable_unit_id": adjust_spec.variable_unit_id,
+        "variable_param": adjust_spec.variable_param,
+        "converged_value": converged_value,
+        "target_stream_id": adjust_spec.target_stream_id,
+        "target_property": adjust_spec.target_property,
+        "target_value": target_value,
+    }
+
+
+def run_adjust(
+    payload: schemas.FlowsheetPayload,
+    adjust_spec: AdjustSpec,
+    client: Optional[ThermoClient] = None,
+) -> schemas.SimulationResult:
+    """
+    Run an Adjust operation using Chandrupatla's method.
+
+    Varies `variable_param` on `variable_unit_id` within [min, max] until
+    `target_stream_id.target_property == target_value`. If the spec has a
+    `surrogate`, the root is found on it and checked with one flowsheet
+    solve; a root the flowsheet misses by more than `tolerance` is refined
+    on the flowsheet itself, starting from the surrogate's answer.
+    """
+    if client is None:
+        client = get_default_client()
+
+    warnings: List[str] = []
+
+    _simulate, _actual = _adjust_evaluator(payload, adjust_spec, client)
+    tgt_val = adjust_spec.target_value
+    surrogate = adjust_spec.surrogate
+
+    if surrogate is not None:
+        def _objective(param_value: float) -> float:
+            """Objective function for root-finding: surrogate - target."""
+            return surrogate(param_value) - tgt_val
+    else:
+        def _objective(param_value: float) -> float:
+            """Objective function for root-finding: actual - target."""
+            return _actual(param_value) - tgt_val
+
+    lo, hi = adjust_spec.variable_min, adjust_spec.variable_max
+    fallback_value: Optional[float] = None
     try:
-        optimal_value = brentq(
-            _objective,
-            adjust_spec.variable_min,
-            adjust_spec.variable_max,
-            xtol=adjust_spec.tolerance,
-            maxiter=adjust_spec.max_iterations,
-        )
+        optimal_value = None
+        a, b = lo, hi
+        if adjust_spec.initial_guess is not None:
+            # Near-linear responses usually converge here in 2-3 solves;
+            # otherwise the probes may still tighten the bracket.
+            optimal_value, bracket = _secant_from_guess(
+                _objective, adjust_spec.initial_guess, lo, hi,
+                adjust_spec.tolerance,
+            )
+            if bracket is not None:
+                a, b = bracket
+
+        if optimal_value is None:
+            # Probe the bracket ends first; a bad bracket goes straight to
+            # the fallback without starting the iteration.
+            if surrogate is None and _solves_concurrently(client):
+                # The two ends are independent, so they are solved side by
+                # side before the (inherently serial) root-finding starts.
+                # Each call gets its own workers: grouped Adjusts and
+                # concurrent requests never queue behind each other.
+                with ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="adjust",
+                ) as pool:
+                    list(pool.map(_simulate, (a, b)))
+            f_a = _objective(a)
+            f_b = _objective(b)
+            if f_a == 0:
+                optimal_value = a
+            elif f_b == 0:
+                optimal_value = b
+            elif _sign(f_a) == _sign(f_b):
+                # The end closer to the target is already solved
+                fallback_value = a if abs(f_a) <= abs(f_b) else b
+                raise ValueError("f(a) and f(b) must have different signs")
+            else:
+                optimal_value = _chandrupatla(
+                    _objective, a, b, f_a, f_b,
+                    xtol=adjust_spec.tolerance,
+                    rtol=adjust_spec.rtol,
+                    maxiter=adjust_spec.max_iterations,
+                )
     except ValueError as exc:
-        # Brent's method requires f(a) and f(b) to have opposite signs
+        # A bracketed solver requires f(a) and f(b) to have opposite signs
         warnings.append(
             f"Adjust failed: {exc}. "
-            f"Target may not be achievable within [{adjust_spec.variable_min}, {adjust_spec.variable_max}]"
+            f"Target may not be achievable within [{lo}, {hi}]"
         )
-        # Return result at midpoint as best effort
-        mid = (adjust_spec.variable_min + adjust_spec.variable_max) / 2.0
-        final_payload = _clone_payload_with_param(
-            payload, adjust_spec.variable_unit_id,
-            adjust_spec.variable_param, mid,
-        )
-        result = client.simulate_flowsheet(final_payload)
+        # Return the best end, or the midpoint, as best effort
+        if fallback_value is None:
+            fallback_value = (lo + hi) / 2.0
+        result = _simulate(fallback_value)
         result.warnings.extend(warnings)
         return result
 
-    # Run final simulation at the converged value
-    final_payload = _clone_payload_with_param(
-        payload,
-        adjust_spec.variable_unit_id,
-        adjust_spec.variable_param,
-        optimal_value,
-    )
-    result = client.simulate_flowsheet(final_payload)
+    if surrogate is not None:
+        surrogate_value = optimal_value
+        try:
+            optimal_value = _refine_on_flowsheet(_actual, adjust_spec, optimal_value)
+        except (ValueError, RuntimeError):
+            optimal_value = None
+        if optimal_value is None:
+            result = _simulate(surrogate_value)
+            try:
+                actual = _actual(surrogate_value)
+            except ValueError:
+                actual = None
+            warnings.append(
+                f"Adjust target missed: {adjust_spec.target_stream_id}."
+                f"{adjust_spec.target_property} = {actual} "
+                f"(target {tgt_val}) at the surrogate's root"
+            )
+            result.warnings.extend(warnings)
+            return result
+
+    # Final result at the converged value (normally a cache hit)
+    result = _simulate(optimal_value)
 
     result.warnings.extend(warnings)
-    result.diagnostics["adjust"] = {
-        "variable_unit_id": adjust_spec.variable_unit_id,
-        "variable_param": adjust_spec.variable_param,
-        "converged_value": optimal_value,
-        "target_stream_id": adjust_spec.target_stream_id,
-        "target_property": adjust_spec.target_property,
-        "target_value": adjust_spec.target_value,
-    }
+    result.diagnostics["adjust"] = _adjust_diagnostics(
+        adjust_spec, optimal_value, tgt_val,
+    )
 
     return result
 
 
+def _refine_on_flowsheet(
+    actual: Callable[[float], float],
+    adjust_spec: AdjustSpec,
+    guess: float,
+) -> Optional[float]:
+    """
+    Check a surrogate root against the flowsheet, refining it if needed.
+
+    Returns `guess` when the flowsheet meets the target within `tolerance`,
+    otherwise a root found on the flowsheet from `guess` (falling back to
+    the whole [min, max] range when the probes do not bracket one), or
+    None if the flowsheet cannot meet the target there.
+    """
+    tgt_val = adjust_spec.target_value
+    lo, hi = adjust_spec.variable_min, adjust_spec.variable_max
+
+    def _objective(param_value: float) -> float:
+        return actual(param_value) - tgt_val
+
+    root, bracket = _secant_from_guess(
+        _objective, guess, lo, hi, adjust_spec.tolerance,
+    )
+    if root is not None:
+        return root
+    a, b = bracket if bracket is not None else (lo, hi)
+    f_a = _objective(a)
+    f_b = _objective(b)
+    if f_a == 0:
+        return a
+    if f_b == 0:
+        return b
+    if _sign(f_a) == _sign(f_b):
+        return None
+    return _chandrupatla(
+        _objective, a, b, f_a, f_b,
+        xtol=adjust_spec.tolerance,
+        rtol=adjust_spec.rtol,
+        maxiter=adjust_spec.max_iterations,
+    )
+
+
+def run_adjust_batch(
+    payload: schemas.FlowsheetPayload,
+    adjust_spec: AdjustSpec,
+    target_values: List[float],
+    client: Optional[ThermoClient] = None,
+) -> List[schemas.SimulationResult]:
+    """
+    Solve one Adjust for several target values at once.
+
+    Every target shares the flowsheet and the variable, so the bracket-end
+    solves are done once for all of them and each iteration's solves run
+    concurrently. `adjust_spec.target_value` is ignored in favour of
+    `target_values`; one result is returned per target, in order. With a
+    `surrogate`, each target is solved by `run_adjust` on its own, since
+    its root find needs no shared flowsheet solves.
+    """
+    if client is None:
+        client = get_default_client()
+
+    if not target_values:
+        return []
+    if len(target_values) == 1 or adjust_spec.surrogate is not None:
+        return [
+            run_adjust(
+                payload,
+                dataclasses.replace(adjust_spec, target_value=target),
+                client,
+            )
+            for target in target_values
+        ]
+
+    _simulate, _actual = _adjust_evaluator(
+        payload, adjust_spec, client, cache_size=None,
+    )
+    targets = np.asarray(target_values, dtype=float)
+    n = len(targets)
+    lo, hi = adjust_spec.variable_min, adjust_spec.variable_max
+
+    roots = np.full(n, np.nan)
+    failures: Dict[int, str] = {}
+    fallbacks: Dict[int, float] = {}
+    # A client that cannot share solves across threads gets a single worker
+    workers = min(n, _MAX_PARALLEL_ADJUSTS) if _solves_concurrently(client) else 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        def _actuals(x: np.ndarray) -> np.ndarray:
+            return np.fromiter(pool.map(_actual, x.tolist()), float, len(x))
+
+        try:
+            a_lo, a_hi = _actuals(np.array([lo, hi]))
+            f_lo = a_lo - targets
+            f_hi = a_hi - targets
+
+            roots[f_lo == 0] = lo
+            roots[(f_lo != 0) & (f_hi == 0)] = hi
+            unbracketed = (np.sign(f_lo) * np.sign(f_hi)) > 0
+            for i in np.flatnonzero(unbracketed):
+                failures[i] = "f(a) and f(b) must have different signs"
+                fallbacks[i] = lo if abs(f_lo[i]) <= abs(f_hi[i]) else hi
+
+            idx = np.flatnonzero(np.isnan(roots) & ~unbracketed)
+            if idx.size:
+                roots[idx] = _chandrupatla_batch(
+                    lambda i, x: _actuals(x) - targets[idx[i]],
+                    np.full(idx.size, float(lo)),
+                    np.full(idx.size, float(hi)),
+                    f_lo[idx],
+                    f_hi[idx],
+                    xtol=adjust_spec.tolerance,
+                    rtol=adjust_spec.rtol,
+                    maxiter=adjust_spec.max_iterations,
+                )
+                for i in idx[np.isnan(roots[idx])]:
+                    failures[i] = (
+                        f"no convergence after {adjust_spec.max_iterations} "
+                        f"iterations"
+                    )
+        except ValueError as exc:
+            for i in np.flatnonzero(np.isnan(roots)):
+                failures.setdefault(i, str(exc))
+
+    results: List[schemas.SimulationResult] = []
+    for i, target in enumerate(target_values):
+        if i in failures:
+            # Return the best end, or the midpoint, as best effort
+            base = _simulate(fallbacks.get(i, (lo + hi) / 2.0))
+            warning = (
+                f"Adjust failed: {failures[i]}. "
+                f"Target may not be achievable within [{lo}, {hi}]"
+            )
+            results.append(base.model_copy(
+                update={"warnings": [*base.warnings, warning]}
+            ))
+            continue
+
+        root = float(roots[i])
+        base = _simulate(root)
+        results.append(base.model_copy(update={
+            "diagnostics": {
+                **base.diagnostics,
+                "adjust": _adjust_diagnostics(adjust_spec, root, target),
+            },
+        }))
+
+    return results
+
+
+def _adjust_groups(
+    payload: schemas.FlowsheetPayload,
+    adjust_specs: List[AdjustSpec],
+) -> List[List[int]]:
+    """
+    Partition Adjust specs into groups that must be solved in sequence.
+
+    Two specs belong together when they vary the same unit, or when one
+    spec's variable unit is upstream of the other's target stream. Within
+    a group, upstream variables come first.
+    """
+    reach = {
+        spec.variable_unit_id: _downstream_units(payload, spec.variable_unit_id)
+        for spec in adjust_specs
+    }
+    stream_source = {s.id: s.source for s in payload.streams}
+
+    parent = list(range(len(adjust_specs)))
+
+    def _root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in itertools.permutations(range(len(adjust_specs)), 2):
+        unit = adjust_specs[i].variable_unit_id
+        source = stream_source.get(adjust_specs[j].target_stream_id)
+        if (
+            unit == adjust_specs[j].variable_unit_id
+            or source == unit
+            or source in reach[unit]
+        ):
+            parent[_root(j)] = _root(i)
+
+    groups: Dict[int, List[int]] = {}
+    for idx in range(len(adjust_specs)):
+        groups.setdefault(_root(idx), []).append(idx)
+    # A unit upstream of another reaches strictly more of the flowsheet
+    return [
+        sorted(g, key=lambda i: -len(reach[adjust_specs[i].variable_unit_id]))
+        for g in groups.values()
+    ]
+
+
+def run_adjusts(
+    payload: schemas.FlowsheetPayload,
+    adjust_specs: List[AdjustSpec],
+    client: Optional[ThermoClient] = None,
+) -> schemas.SimulationResult:
+    """
+    Run several Adjust operations, solving independent ones concurrently.
+
+    Specs that vary the same unit, or whose variable unit feeds another
+    spec's target stream, are chained (upstream first), each starting
+    from the values the previous ones converged to. Unrelated groups run
+    in parallel. The converged values are then applied together, the
+    flowsheet is solved once more and every target is checked again.
+    """
+    if client is None:
+        client = get_default_client()
+
+    if not adjust_specs:
+        return client.simulate_flowsheet(payload)
+    if len(adjust_specs) == 1:
+        return run_adjust(payload, adjust_specs[0], client)
+
+    groups = _adjust_groups(payload, adjust_specs)
+
+    results: List[Optional[schemas.SimulationResult]] = [None] * len(adjust_specs)
+
+    def _run_group(indices: List[int]) -> None:
+        p = payload
+        for idx in indices:
+            spec = adjust_specs[idx]
+            result = run_adjust(p, spec, client)
+            results[idx] = result
+            converged = result.diagnostics.get("adjust", {}).get("converged_value")
+            if converged is not None:
+                p = _clone_payload_with_param(
+                    p, spec.variable_unit_id, spec.variable_param, converged,
+                )
+
+    workers = min(len(groups), _MAX_PARALLEL_ADJUSTS)
+    if not _solves_concurrently(client):
+        workers = 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(_run_group, g) for g in groups]:
+            future.result()
+
+    # Combine every converged value into one flowsheet and solve it
+    combined = payload
+    adjust_diagnostics: List[Dict[str, Any]] = []
+    warnings: List[str] = []
+    for spec, result in zip(adjust_specs, results):
+        for w in result.warnings:
+            if w not in warnings:
+                warnings.append(w)
+        diag = result.diagnostics.get("adjust")
+        if diag is None:
+            continue
+        adjust_diagnostics.append(diag)
+        combined = _clone_payload_with_param(
+            combined, spec.variable_unit_id, spec.variable_param,
+            diag["converged_value"],
+        )
+
+    final = client.simulate_flowsheet(combined)
+
+    # Applying every value at once can move a target another spec reached
+    # on its own; flag any that ended up further off than it did alone.
+    for spec, result in zip(adjust_specs, results):
+        if "adjust" not in result.diagnostics:
+            continue
+        achieved = _target_value(result, spec)
+        actual = _target_value(final, spec)
+        allowed = spec.tolerance
+        if achieved is not None:
+            allowed = max(allowed, abs(achieved - spec.target_value))
+        if actual is None or abs(actual - spec.target_value) > allowed:
+            warnings.append(
+                f"Adjust target missed: {spec.target_stream_id}."
+                f"{spec.target_property} = {actual} "
+                f"(target {spec.target_value})"
+            )
+
+    for w in warnings:
+        if w not in final.warnings:
+            final.warnings.append(w)
+    if adjust_diagnostics:
+        final.diagnostics["adjust"] = adjust_diagnostics[-1]
+    final.diagnostics["adjusts"] = adjust_diagnostics
+
+    return final
+
+
 # ---------------------------------------------------------------------------
 # Set operation
 # ---------------------------------------------------------------------------
@@ -228,21 +822,33 @@ def apply_set_specs(
     For each SetSpec, reads source_param from source_unit and writes
     target_param = source_param * multiplier + offset to target_unit.
     """
-    payload_dict = payload.model_dump()
-    units_by_id = {u["id"]: u for u in payload_dict["units"]}
+    if not set_specs:
+        return payload
 
+    # Resolve against the typed payload; only dump it once there is
+    # actually something to write.
+    units = payload.units
+    index_by_id = {u.id: idx for idx, u in enumerate(units)}
+
+    # Pass 1: resolve every write.  Pending writes are consulted first so
+    # that chained specs (A -> B, B -> C) see the value written earlier.
+    writes: Dict[Tuple[int, str], float] = {}
     for spec in set_specs:
-        source = units_by_id.get(spec.source_unit_id)
-        target = units_by_id.get(spec.target_unit_id)
+        source_idx = index_by_id.get(spec.source_unit_id)
+        target_idx = index_by_id.get(spec.target_unit_id)
 
-        if source is None:
+        if source_idx is None:
             logger.warning("Set: source unit '{}' not found", spec.source_unit_id)
             continue
-        if target is None:
+        if target_idx is None:
             logger.warning("Set: target unit '{}' not found", spec.target_unit_id)
             continue
 
-        source_val = source.get("parameters", {}).get(spec.source_param)
+        source_key = (source_idx, spec.source_param)
+        if source_key in writes:
+            source_val = writes[source_key]
+        else:
+            source_val = units[source_idx].parameters.get(spec.source_param)
         if source_val is None:
             logger.warning(
                 "Set: source param '{}' not found on unit '{}'",
@@ -251,16 +857,32 @@ def apply_set_specs(
             continue
 
         new_val = float(source_val) * spec.multiplier + spec.offset
-        target.setdefault("parameters", {})[spec.target_param] = new_val
+        writes[(target_idx, spec.target_param)] = new_val
 
-        logger.info(
+        logger.debug(
             "Set: {}.{} = {}.{} * {} + {} = {}",
             spec.target_unit_id, spec.target_param,
             spec.source_unit_id, spec.source_param,
             spec.multiplier, spec.offset, new_val,
         )
 
-    return schemas.FlowsheetPayload(**payload_dict)
+    if not writes:
+        return payload
+
+    # Pass 2: apply all writes.  The payload is already validated and only
+    # numeric parameters change, so copy just the touched units instead of
+    # dumping and re-validating the whole payload.
+    updates: Dict[int, Dict[str, float]] = {}
+    for (idx, param), value in writes.items():
+        updates.setdefault(idx, {})[param] = value
+
+    new_units = list(units)
+    for idx, params in updates.items():
+        unit = new_units[idx]
+        new_units[idx] = unit.model_copy(
+            update={"parameters": {**unit.parameters, **params}}
+        )
+    return payload.model_copy(update={"units": new_units})
 
 
 # ---------------------------------------------------------------------------
@@ -268,16 +890,77 @@ def apply_set_specs(
 # ---------------------------------------------------------------------------
 
 
+def _find_unit_index(
+    payload: schemas.FlowsheetPayload,
+    unit_id: str,
+) -> Optional[int]:
+    """Return the position of `unit_id` in ``payload.units`` (or None)."""
+    for idx, unit in enumerate(payload.units):
+        if unit.id == unit_id:
+            return idx
+    return None
+
+
+def _downstream_units(
+    payload: schemas.FlowsheetPayload,
+    unit_id: str,
+) -> Set[str]:
+    """Return the ids of every unit fed, directly or not, by `unit_id`."""
+    successors: Dict[str, List[str]] = {}
+    for stream in payload.streams:
+        if stream.source and stream.target:
+            successors.setdefault(stream.source, []).append(stream.target)
+
+    seen: Set[str] = set()
+    pending = list(successors.get(unit_id, ()))
+    while pending:
+        unit = pending.pop()
+        if unit not in seen:
+            seen.add(unit)
+            pending.extend(successors.get(unit, ()))
+    return seen
+
+
+def _target_value(
+    result: schemas.SimulationResult,
+    adjust_spec: AdjustSpec,
+) -> Optional[float]:
+    """Read an Adjust's target property from a solved flowsheet (or None)."""
+    for stream in result.streams:
+        if stream.id == adjust_spec.target_stream_id:
+            return _stream_value_getter(adjust_spec.target_property)(stream)
+    return None
+
+
+def _clone_with_unit_param(
+    payload: schemas.FlowsheetPayload,
+    unit_index: Optional[int],
+    param: str,
+    value: float,
+) -> schemas.FlowsheetPayload:
+    """Return a copy of a payload with one unit parameter changed.
+
+    Copy-on-write: the payload and its ``units`` list are shallow-copied
+    and only the mutated unit (and its ``parameters`` dict) is new; every
+    other unit and stream is shared with the original.  This is safe
+    because the solver copies unit parameters before using them.
+    """
+    units = list(payload.units)
+    if unit_index is not None:
+        unit = units[unit_index]
+        units[unit_index] = unit.model_copy(
+            update={"parameters": {**unit.parameters, param: value}}
+        )
+    return payload.model_copy(update={"units": units})
+
+
 def _clone_payload_with_param(
     payload: schemas.FlowsheetPayload,
     unit_id: str,
     param: str,
     value: float,
 ) -> schemas.FlowsheetPayload:
-    """Deep-copy a payload and set a specific unit parameter."""
-    data = payload.model_dump()
-    for unit in data["units"]:
-        if unit["id"] == unit_id:
-            unit["parameters"][param] = value
-            break
-    return schemas.FlowsheetPayload(**data)
+    """Return a copy of a payload with a specific unit parameter set."""
+    return _clone_with_unit_param(
+        payload, _find_unit_index(payload, unit_id), param, value,
+    )
@@ -7,82 +7,549 @@ falls back to a deterministic mock so the rest of the app still works.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import importlib
 import os
-import random
-import sys
+import platform
+import re
+import shutil
 import tempfile
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+import pydantic_core
 from loguru import logger
 
 from . import schemas
 
 
+_SYSTEM = platform.system()
+
+
+# Common Windows DWSIM installation paths
+_WINDOWS_DEFAULT_PATHS = (
+    'C:/Program Files/DWSIM',
+    'C:/Program Files (x86)/DWSIM',
+    os.path.expanduser('~/DWSIM'),
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _dir_contents(path: str) -> Optional[frozenset]:
+    """File names in `path` from one scandir, or None if it isn't a directory."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_lib_path() -> Path:
+    """Platform-specific default DWSIM installation directory (probed once)."""
+    if _SYSTEM == 'Windows':
+        return Path(next(
+            (p for p in _WINDOWS_DEFAULT_PATHS if 'DWSIM.Automation.dll' in (_dir_contents(p) or ())),
+            _WINDOWS_DEFAULT_PATHS[0],
+        ))
+    if _SYSTEM == 'Darwin':  # macOS
+        return Path('/Applications/DWSIM.app/Contents/MonoBundle')
+    return Path('/usr/lib/dwsim')  # Common Linux path
+
+
+# Map JSON unit types to DWSIM unit operation types
+_UNIT_TYPE_MAP = MappingProxyType({
+    "distillationColumn": "DistillationColumn",
+    "packedColumn": "PackedColumn",
+    "absorber": "AbsorptionColumn",
+    "stripper": "StrippingColumn",
+    "flashDrum": "FlashDrum",
+    "separator": "Separator",
+    "separator3p": "ThreePhaseSeparator",
+    "tank": "Tank",
+    "heaterCooler": "Heater",
+    "shellTubeHX": "HeatExchanger",
+    "airCooler": "AirCooler",
+    "kettleReboiler": "KettleReboiler",
+    "firedHeater": "FiredHeater",
+    "cstr": "CSTR",
+    "pfr": "PFR",
+    "gibbsReactor": "GibbsReactor",
+    "equilibriumReactor": "EquilibriumReactor",
+    "conversionReactor": "ConversionReactor",
+    "pump": "Pump",
+    "compressor": "Compressor",
+    "turbine": "Turbine",
+    "valve": "Valve",
+    "mixer": "Mixer",
+    "splitter": "Splitter",
+    "filter": "Filter",
+    "cyclone": "Cyclone",
+    "adsorber": "Adsorber",
+    "membrane": "Membrane",
+    "boiler": "Boiler",
+    "condenser": "Condenser",
+})
+
+# Map property package names to DWSIM types
+# Avoid ThermoCPropertyPackage as it may have missing dependencies
+_PACKAGE_MAP = MappingProxyType({
+    "Peng-Robinson": "Peng-Robinson",
+    "PR": "Peng-Robinson",
+    "Soave-Redlich-Kwong": "Soave-Redlich-Kwong",
+    "SRK": "Soave-Redlich-Kwong",
+    "NRTL": "NRTL",
+    "UNIFAC": "UNIFAC",
+    "UNIQUAC": "UNIQUAC",
+    "Lee-Kesler-Plöcker": "Lee-Kesler-Plöcker",
+    "IAPWS-IF97": "IAPWS-IF97",
+    "Chao-Seader": "Chao-Seader",
+    "Grayson-Streed": "Grayson-Streed",
+})
+
+
+# Unit parameters written by _configure_units: unit type -> ((param key, DWSIM property), ...)
+_CONFIG_HANDLERS = MappingProxyType({
+    "distillationColumn": (("stages", "NumberOfStages"), ("reflux_ratio", "RefluxRatio")),
+    "pump": (("pressure_rise", "PressureIncrease"), ("efficiency", "Efficiency")),
+    "compressor": (("pressure_rise", "PressureIncrease"), ("efficiency", "Efficiency")),
+    "heaterCooler": (("duty", "HeatFlow"),),
+    "shellTubeHX": (("duty", "HeatFlow"),),
+})
+
+
+_TYPE_NAME_STRIP = str.maketrans('', '', ' -_')
+
+
+def _canonical_type_name(name: str) -> str:
+    """'Material Stream', 'material_stream' and 'MaterialStream' compare equal."""
+    return name.translate(_TYPE_NAME_STRIP).lower()
+
+
+# Assemblies Automation3 and the property packages need, loaded in order.
+_REQUIRED_DLLS = (
+    'DWSIM.Automation.dll',
+    'DWSIM.Interfaces.dll',
+    'DWSIM.SharedClasses.dll',
+    'DWSIM.MathOps.dll',
+    'DWSIM.Thermodynamics.dll',
+    'DWSIM.UnitOperations.dll',
+)
+
+# Assemblies never needed for headless automation. ThermoCS.dll is known to
+# raise FileNotFoundException on some systems.
+_SKIP_DLLS = frozenset({'ThermoCS.dll'})
+_SKIP_DLL_PATTERNS = ('UI', 'Editor', 'Forms', 'WPF', '.resources', '.Interop')
+# Native runtime and .NET framework DLLs that ship next to DWSIM (lowercase).
+# None of them is referenced eagerly; the app-local framework packages are
+# still resolved on demand when the runtime's own probing misses them.
+_SKIP_DLL_PREFIXES = (
+    'vcruntime', 'msvcp', 'api-ms-', 'ucrtbase',
+    'system.', 'microsoft.', 'mscorlib', 'windowsbase', 'presentationcore',
+)
+
+
+def _is_skipped_dll(name: str) -> bool:
+    return (
+        name in _SKIP_DLLS
+        or name.lower().startswith(_SKIP_DLL_PREFIXES)
+        or any(pattern in name for pattern in _SKIP_DLL_PATTERNS)
+    )
+
+
+def _assembly_resolver(lib_path: Path, load_from: Callable[[str], object]) -> Callable:
+    """
+    Build an AppDomain.AssemblyResolve handler for the DWSIM directory.
+
+    The handler maps a requested assembly name ("DWSIM.MathOps, Version=...")
+    to a sibling DLL in `lib_path` and loads it with `load_from`. It only
+    runs once the runtime's own probing has failed, so any sibling is
+    loaded, including ones `_is_skipped_dll` keeps out of eager loading
+    (System.Memory, Microsoft.*, UI assemblies core ones reference). Names
+    not in the directory resolve to None.
+    """
+    contents = _dir_contents(str(lib_path)) or frozenset()
+
+    def resolve(sender, args):
+        file_name = str(args.Name).split(',', 1)[0].strip() + '.dll'
+        if file_name not in contents:
+            return None
+        try:
+            assembly = load_from(str(lib_path / file_name))
+            _REFERENCED_ASSEMBLIES.add(file_name[:-4])
+            return assembly
+        except Exception as exc:
+            logger.debug("Could not resolve assembly {}: {}", file_name, exc)
+            return None
+
+    return resolve
+
+
+# Port handles look like "in-2-left"; the first number is the 1-based port.
+_PORT_NUMBER_RE = re.compile(r'(\d+)')
+_PORT_FASTPATH = {None: 0, "": 0, "in": 0, "out": 0}
+
+
+@functools.lru_cache(maxsize=256)
+def _port_index(handle: str) -> int:
+    # "in-2-left" / "port_3": the number right after the first separator
+    for sep in ('-', '_'):
+        middle = handle.partition(sep)[2].partition(sep)[0]
+        if middle.isdigit():
+            return int(middle) - 1
+    match = _PORT_NUMBER_RE.search(handle)
+    return int(match.group(1)) - 1 if match else 0
+
+
+# Candidate DWSIM API calls, in order of likelihood.  Which one a flowsheet
+# supports is resolved once per flowsheet type (see `_call_resolved`).
+_PROPERTY_PACKAGE_SETTERS = (
+    lambda fs, pkg: setattr(fs, 'PropertyPackage', pkg),
+    lambda fs, pkg: fs.SetPropertyPackage(pkg),
+    lambda fs, pkg: fs.SetPropertyPackageName(pkg),
+    lambda fs, pkg: fs.SetThermoPackage(pkg),
+)
+
+_COMPONENT_ADDERS = (
+    lambda fs, c: fs.AddComponent(c),
+    lambda fs, c: fs.AddCompound(c),
+    lambda fs, c: fs.AddChemical(c),
+    lambda fs, c: fs.AddComponentToFlowsheet(c),
+)
+
+
+# Mock property values for calculate_properties, drawn once so the mock path
+# (used by health probes and dev) only indexes into preallocated arrays. The
+# slot is chosen from the (1 K, 10 kPa) state bin, so repeated requests get
+# repeated values.
+_POOL_MASK = 4095
+_ENTHALPY_POOL = np.random.default_rng(42).uniform(-500, 2000, _POOL_MASK + 1)
+_DENSITY_POOL = np.random.default_rng(43).uniform(200, 900, _POOL_MASK + 1)
+
+# pythonnet can only load a runtime once per process and Automation3 keeps
+# static state on the CLR side, so a single instance is shared by every
+# client. The lock guards its creation and serialises CalculateFlowsheet.
+# importlib.reload re-executes this module in its existing namespace; the
+# CLR cannot unload what it has loaded, so the live state is carried over
+# instead of paying for a second initialisation.
+_AUTOMATION_LOCK = globals().get('_AUTOMATION_LOCK') or threading.RLock()
+_AUTOMATION_SINGLETON = globals().get('_AUTOMATION_SINGLETON')
+_AUTOMATION_LOADED = globals().get('_AUTOMATION_LOADED', False)
+_ASSEMBLY_RESOLVER = globals().get('_ASSEMBLY_RESOLVER')
+# Simple names of assemblies already referenced or resolved in this process
+_REFERENCED_ASSEMBLIES: set = globals().get('_REFERENCED_ASSEMBLIES', set())
+
+# A systemic DWSIM failure (licence, missing package) raises the same error on
+# every request; full tracebacks are logged at most once per interval for each
+# exception signature so formatting them can't dominate the CPU.
+_EXC_LOG_INTERVAL_S = 1.0
+_EXC_LOG_MAX_SIGNATURES = 1024
+_last_exc_ts: Dict[str, float] = {}
+
+
+def _sampled_exception(exc: BaseException, message: str, *args) -> None:
+    """`logger.exception` rate-limited per exception type and message."""
+    sig = f"{type(exc).__name__}:{str(exc)[:64]}"
+    now = time.monotonic()
+    last = _last_exc_ts.get(sig)
+    if last is not None and now - last < _EXC_LOG_INTERVAL_S:
+        logger.opt(depth=1).debug(message, *args)
+        return
+    if len(_last_exc_ts) >= _EXC_LOG_MAX_SIGNATURES:
+        _last_exc_ts.clear()
+    _last_exc_ts[sig] = now
+    logger.opt(depth=1, exception=exc).error(message, *args)
+
+
+def _as_number(val):
+    """Return a float if val looks numeric; otherwise None."""
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    if isinstance(val, str):
+        stripped = val.strip()
+        if stripped == "":
+            return None
+        try:
+            return float(stripped)
+        except ValueError:
+            return None
+    return None
+
+
+def _env_int(name: str, default: int) -> int:
+    """Integer environment setting; a malformed value logs and uses `default`."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Ignoring {}={!r}: not an integer, using {}", name, raw, default)
+        return default
+
+
+def _mock_pool_index(temperature, pressure) -> int:
+    """Pool slot for the (1 K, 10 kPa) bin of a requested state."""
+    bins = []
+    for value, width in ((temperature, 1.0), (pressure, 10.0)):
+        number = _as_number(value)
+        try:
+            bins.append(round(number / width) if number is not None else 0)
+        except (ValueError, OverflowError):  # nan / inf
+            bins.append(0)
+    return hash(tuple(bins)) & _POOL_MASK
+
+
+# One private copy of the current template version per process. DWSIM loads
+# it in place, so runs don't copy the (often multi-MB) file again. The copy
+# lives in one long-lived directory, removed at exit, and a new version
+# replaces it atomically.
+_TEMPLATE_COPY_LOCK = threading.Lock()
+_template_copy: Optional[Tuple[Tuple[str, int, int], Path]] = None
+_template_dir: Optional[Path] = None
+
+
+def _template_copy_for(template: Path, key: Tuple[str, int, int]) -> Path:
+    """Path of the private template copy for `key`, copying on first use."""
+    global _template_copy, _template_dir
+    with _TEMPLATE_COPY_LOCK:
+        current = _template_copy
+        if current is not None and current[0] == key and current[1].exists():
+            return current[1]
+        if _template_dir is None or not _template_dir.is_dir():
+            _template_dir = Path(tempfile.mkdtemp(prefix='dwsim-template-'))
+            atexit.register(shutil.rmtree, _template_dir, ignore_errors=True)
+        # Each version gets its own file name: a copy still open by a load
+        # cannot be replaced (or removed) on Windows.
+        _, mtime_ns, size = key
+        copy = _template_dir / f'{template.stem}-{mtime_ns}-{size}{template.suffix}'
+        staging = _template_dir / f'.{copy.name}.tmp'
+        shutil.copyfile(template, staging)
+        os.replace(staging, copy)
+        if current is not None and current[1] != copy:
+            try:
+                current[1].unlink(missing_ok=True)
+            except OSError:
+                # Still in use; the directory is removed at exit
+                pass
+        _template_copy = (key, copy)
+        return copy
+
+
 class DWSIMClient:
+    # Unit string DWSIM's SetProp accepted for each stream property. It only
+    # depends on the DWSIM build, so it is shared by all clients.
+    _SETPROP_UNITS: Dict[str, str] = {}
+    # (unit type name, bulk connect method) -> whether the type exposes it
+    _BULK_CONNECT: Dict[Tuple[str, str], bool] = {}
+    # unit type name -> properties its GetPropList reports (None if unknown)
+    _UNIT_PROPS: Dict[str, Optional[frozenset]] = {}
+    # DWSIM object type name -> ObjectType enum value (None if unavailable)
+    _OBJECT_TYPE_VALUES: Dict[str, object] = {}
+    # (flowsheet type name, object type) -> creation signature that worked
+    _CREATE_METHODS: Dict[Tuple[str, str], str] = {}
+    # (flowsheet type name, kind) -> candidate that worked (see _call_resolved)
+    _RESOLVED_METHODS: Dict[Tuple[str, str], Callable] = {}
+
     def __init__(self) -> None:
-        self._rng = random.Random(42)
+        self._rng = np.random.default_rng(42)
         self._automation = None
         self._object_type_enum = None
-        self._object_type_cache = {}
         self._last_flowsheet = None
         self._last_stream_map = {}
         self._active_property_package = None
-        
-        # Detect platform and set appropriate default path
-        import platform
-        system = platform.system()
-        if system == 'Windows':
-            # Common Windows DWSIM installation paths
-            default_paths = [
-                Path('C:/Program Files/DWSIM'),
-                Path('C:/Program Files (x86)/DWSIM'),
-                Path(os.path.expanduser('~/DWSIM')),
-            ]
-            default_path = next((p for p in default_paths if p.exists()), Path('C:/Program Files/DWSIM'))
-        elif system == 'Darwin':  # macOS
-            default_path = Path('/Applications/DWSIM.app/Contents/MonoBundle')
-        else:  # Linux
-            default_path = Path('/usr/lib/dwsim')  # Common Linux path
-        
-        self._lib_path = Path(os.getenv('DWSIM_LIB_PATH', str(default_path)))
-        self._template_path = os.getenv('DWSIM_TEMPLATE_PATH')
-        self._try_initialize_automation()
+        # LRU cache of DWSIM results keyed on a payload hash; 0 disables it
+        self._sim_cache: OrderedDict[bytes, schemas.SimulationResult] = OrderedDict()
+        self._sim_cache_size = _env_int('DWSIM_SIM_CACHE_SIZE', 128)
+        self._sim_cache_lock = threading.Lock()
+        # Read matched streams and units concurrently when extracting DWSIM
+        # results (opt-in: not every DWSIM build is safe to read in parallel)
+        self._parallel_extract = os.getenv('DWSIM_PARALLEL_EXTRACT', '').lower() in ('1', 'true', 'yes')
+        # Where DWSIM can clone flowsheets, a loaded template prototype keyed
+        # on (path, mtime_ns, size)
+        self._template_prototype = None
+
+    # Environment-derived settings are resolved on first use, so clients that
+    # only ever serve mock results never read them or stat the filesystem.
+    @functools.cached_property
+    def _lib_path(self) -> Path:
+        # An explicit DWSIM_LIB_PATH skips probing the default install locations
+        env_lib_path = os.environ.get('DWSIM_LIB_PATH')
+        return Path(env_lib_path) if env_lib_path else _default_lib_path()
+
+    @functools.cached_property
+    def _template_path(self) -> Optional[str]:
+        return os.getenv('DWSIM_TEMPLATE_PATH')
+
+    @functools.cached_property
+    def _automation_available(self) -> bool:
+        # Loading pythonnet and the DWSIM assemblies is slow; only check that
+        # they could be loaded here and defer the work to _get_automation.
+        return self._detect_automation_available()
+
+    @functools.cached_property
+    def _new_flowsheet(self) -> Callable:
+        # Resolved once: a missing method would otherwise surface as an
+        # AttributeError raised through pythonnet on every simulation.
+        return getattr(self._automation, 'CreateFlowsheet', None) or self._automation.NewFlowsheet
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def simulate_flowsheet(self, payload: schemas.FlowsheetPayload) -> schemas.SimulationResult:
-        if self._automation:
+        if self._get_automation():
+            key = self._sim_cache_key(payload)
+            cached = self._sim_cache_get(key)
+            if cached is not None:
+                return cached
             try:
-                return self._run_dwsim(payload)
+                result = self._run_dwsim(payload)
             except Exception as exc:  # pragma: no cover - diagnostics only
-                logger.exception("DWSIM automation error, falling back to mock: %s", exc)
+                _sampled_exception(exc, "DWSIM automation error, falling back to mock: {}", exc)
+            else:
+                # A failed CalculateFlowsheet still returns "ok"/"empty"
+                # streams; only fully calculated results are reused.
+                if result.status == "ok" and not any(
+                    w.startswith("Calculation error") for w in result.warnings
+                ):
+                    self._sim_cache_put(key, result)
+                return result
 
         return self._mock_result(payload)
 
+    def simulate_flowsheet_json(self, payload: schemas.FlowsheetPayload) -> bytes:
+        """
+        Run `simulate_flowsheet` and return the result as JSON bytes.
+
+        Serialises straight from the model with pydantic-core's encoder, for
+        callers that forward the body as-is (e.g. a raw `Response`) instead
+        of letting FastAPI dump and re-encode it.
+        """
+        return pydantic_core.to_json(self.simulate_flowsheet(payload))
+
     def calculate_properties(self, request: schemas.PropertyRequest) -> schemas.PropertyResult:
-        if self._automation:
+        if self._get_automation():
             try:
                 props = self._simple_property_flash(request)
                 return schemas.PropertyResult(properties=props, warnings=[])
             except Exception as exc:  # pragma: no cover
-                logger.exception("DWSIM property flash failed, returning mock values: %s", exc)
+                _sampled_exception(exc, "DWSIM property flash failed, returning mock values: {}", exc)
 
+        temperature = request.stream.properties.get("temperature", 150)
+        pressure = request.stream.properties.get("pressure", 101.3)
+        i = _mock_pool_index(temperature, pressure)
         properties = {
-            "temperature_c": request.stream.properties.get("temperature", 150),
-            "pressure_kpa": request.stream.properties.get("pressure", 101.3),
-            "enthalpy_kj_per_kg": self._rng.uniform(-500, 2000),
-            "density_kg_per_m3": self._rng.uniform(200, 900),
+            "temperature_c": temperature,
+            "pressure_kpa": pressure,
+            "enthalpy_kj_per_kg": float(_ENTHALPY_POOL[i]),
+            "density_kg_per_m3": float(_DENSITY_POOL[i]),
         }
         return schemas.PropertyResult(properties=properties, warnings=["DWSIM automation unavailable"])
 
+    def calculate_properties_batch(self, requests: List[schemas.PropertyRequest]) -> List[schemas.PropertyResult]:
+        """
+        `calculate_properties` for several requests at once.
+
+        The mock path gathers every request's pool values with one NumPy
+        fancy-index instead of one lookup per request.
+        """
+        if self._get_automation():
+            return [self.calculate_properties(request) for request in requests]
+
+        states = [
+            (request.stream.properties.get("temperature", 150), request.stream.properties.get("pressure", 101.3))
+            for request in requests
+        ]
+        idx = np.fromiter((_mock_pool_index(t, p) for t, p in states), dtype=np.intp, count=len(states))
+        return [
+            schemas.PropertyResult(
+                properties={
+                    "temperature_c": temperature,
+                    "pressure_kpa": pressure,
+                    "enthalpy_kj_per_kg": enthalpy,
+                    "density_kg_per_m3": density,
+                },
+                warnings=["DWSIM automation unavailable"],
+            )
+            for (temperature, pressure), enthalpy, density in zip(
+                states, _ENTHALPY_POOL[idx].tolist(), _DENSITY_POOL[idx].tolist()
+            )
+        ]
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+    def _sim_cache_key(self, payload: schemas.FlowsheetPayload) -> bytes:
+        """Stable content hash of a payload (and the template it builds on)."""
+        digest = hashlib.blake2b(payload.model_dump_json().encode(), digest_size=16)
+        if self._template_path:
+            # Editing the template changes what the same payload produces
+            try:
+                digest.update(str(os.stat(self._template_path).st_mtime_ns).encode())
+            except OSError:
+                pass
+        return digest.digest()
+
+    def _sim_cache_get(self, key: bytes) -> Optional[schemas.SimulationResult]:
+        with self._sim_cache_lock:
+            result = self._sim_cache.get(key)
+            if result is None:
+                return None
+            self._sim_cache.move_to_end(key)
+        # Callers may mutate the result (e.g. append warnings); hand out a copy
+        return result.model_copy(deep=True)
+
+    def _sim_cache_put(self, key: bytes, result: schemas.SimulationResult) -> None:
+        if self._sim_cache_size <= 0:
+            return
+        with self._sim_cache_lock:
+            self._sim_cache[key] = result.model_copy(deep=True)
+            self._sim_cache.move_to_end(key)
+            while len(self._sim_cache) > self._sim_cache_size:
+                self._sim_cache.popitem(last=False)
+
     # ------------------------------------------------------------------
     # DWSIM hooks
     # ------------------------------------------------------------------
-    def _try_initialize_automation(self) -> None:
+    def _get_automation(self):
+        """Return the shared DWSIM Automation3 instance, loading it on first use."""
+        global _AUTOMATION_SINGLETON, _AUTOMATION_LOADED
+        if self._automation is not None or not self._automation_available:
+            return self._automation
+        if not _AUTOMATION_LOADED:
+            with _AUTOMATION_LOCK:
+                if not _AUTOMATION_LOADED:
+                    _AUTOMATION_SINGLETON = self._initialize_automation_now()
+                    _AUTOMATION_LOADED = True
+        self._automation = _AUTOMATION_SINGLETON
+        return self._automation
+
+    async def ensure_ready(self) -> bool:
+        """
+        Load DWSIM automation on a worker thread and report whether it is usable.
+
+        Intended for async startup hooks: the pythonnet/CLR bootstrap can take
+        several seconds and must not run on the event loop. Later calls to
+        `simulate_flowsheet` reuse the loaded instance.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_automation) is not None
+
+    def _detect_automation_available(self) -> bool:
         """
-        Attempt to initialize DWSIM automation via pythonnet.
+        Cheaply check whether DWSIM automation could be loaded.
         
         IMPORTANT: DWSIM.Automation.dll requires .NET Framework/Mono with System.Windows.Forms.
         On macOS (especially Apple Silicon), this WILL NOT WORK due to:
@@ -95,40 +562,49 @@ class DWSIMClient:
         See DWSIM_RUNTIME_ISSUES.md for details and alternatives.
         """
         # Check if we're on macOS - if so, skip automation attempt (known to not work)
-        import platform
-        if platform.system() == 'Darwin':
+        if _SYSTEM == 'Darwin':
             logger.info(
                 "Skipping DWSIM automation initialization on macOS - not supported. "
                 "DWSIM automation requires .NET Framework/Mono with System.Windows.Forms, "
                 "which is not available on macOS. Using mock backend. "
                 "For real DWSIM automation, use Windows or Linux. See DWSIM_RUNTIME_ISSUES.md"
             )
-            self._automation = None
-            return
-        
-        try:
-            if not self._lib_path.exists():
-                logger.warning(
-                    "DWSIM library path %s not found; keeping mock backend.\n"
-                    "On Windows, set DWSIM_LIB_PATH to your DWSIM installation directory "
-                    "(e.g., 'C:\\Program Files\\DWSIM' or wherever DWSIM.Automation.dll is located).",
-                    self._lib_path
-                )
-                return
-            
-            # Check if DWSIM.Automation.dll exists
-            automation_dll = self._lib_path / 'DWSIM.Automation.dll'
-            if not automation_dll.exists():
-                logger.warning(
-                    "DWSIM.Automation.dll not found in %s; keeping mock backend.\n"
-                    "Please set DWSIM_LIB_PATH to the directory containing DWSIM.Automation.dll.",
-                    self._lib_path
-                )
-                return
+            return False
+
+        contents = _dir_contents(str(self._lib_path))
+        if contents is None:
+            logger.warning(
+                "DWSIM library path {} not found; keeping mock backend.\n"
+                "On Windows, set DWSIM_LIB_PATH to your DWSIM installation directory "
+                "(e.g., 'C:\\Program Files\\DWSIM' or wherever DWSIM.Automation.dll is located).",
+                self._lib_path
+            )
+            return False
+
+        # Check if DWSIM.Automation.dll exists
+        if 'DWSIM.Automation.dll' not in contents:
+            logger.warning(
+                "DWSIM.Automation.dll not found in {}; keeping mock backend.\n"
+                "Please set DWSIM_LIB_PATH to the directory containing DWSIM.Automation.dll.",
+                self._lib_path
+            )
+            return False
+        return True
 
+    def _initialize_automation_now(self):
+        """
+        Load pythonnet and the DWSIM assemblies and create Automation3.
+
+        Returns the instance, or None on failure so clients keep the mock
+        backend. See `_detect_automation_available` for platform caveats.
+        """
+        try:
             # Don't set DOTNET_SYSTEM_GLOBALIZATION_INVARIANT - DWSIM needs culture support
-            if str(self._lib_path) not in sys.path:
-                sys.path.append(str(self._lib_path))
+            # Assemblies are referenced by absolute path below, so the DWSIM
+            # directory stays off sys.path; Windows still needs it on the
+            # native DLL search path for the solvers' unmanaged dependencies.
+            if hasattr(os, 'add_dll_directory'):
+                os.add_dll_directory(str(self._lib_path))
 
             # pythonnet 3.x exposes pythonnet.load; 2.5.x exposes clr only.
             try:
@@ -137,84 +613,93 @@ class DWSIMClient:
             except ImportError:
                 pythonnet = None
                 pythonnet_version = "not-installed"
-            import platform
-            system = platform.system()
-
             # On Windows, prefer .NET Framework: just importing clr is usually enough with pythonnet 2.5.x
-            if system == 'Windows':
+            if _SYSTEM == 'Windows':
                 # Clear DOTNET_ROOT to avoid CoreCLR
                 os.environ.pop('DOTNET_ROOT', None)
                 if pythonnet and hasattr(pythonnet, "load"):
                     try:
                         pythonnet.load()
-                        logger.info("Loaded .NET Framework runtime via pythonnet (v%s)", pythonnet_version)
+                        logger.info("Loaded .NET Framework runtime via pythonnet (v{})", pythonnet_version)
                     except Exception as auto_exc:
-                        logger.debug("pythonnet.load failed on Windows: %s", auto_exc)
+                        logger.debug("pythonnet.load failed on Windows: {}", auto_exc)
                 else:
-                    logger.info("Using clr import directly (pythonnet v%s)", pythonnet_version)
-            elif system == 'Darwin':
-                if pythonnet and hasattr(pythonnet, "load"):
-                    os.environ['PYTHONNET_RUNTIME'] = 'mono'
-                    pythonnet.load("mono")
+                    logger.info("Using clr import directly (pythonnet v{})", pythonnet_version)
             else:
+                # macOS and Linux both go through Mono
                 if pythonnet and hasattr(pythonnet, "load"):
                     os.environ['PYTHONNET_RUNTIME'] = 'mono'
                     pythonnet.load("mono")
 
             import clr  # type: ignore
 
-            # Add all DLLs in the DWSIM directory to resolve dependencies
-            # DWSIM has many interdependent DLLs (e.g., ThermoCS.dll, property packages, etc.)
-            # Loading all DLLs ensures all dependencies are available
-            # Load DWSIM.Automation.dll first, then other DLLs
+            # Only DWSIM.Automation.dll and the core assemblies it and the
+            # property packages need are referenced up front. Every other
+            # dependency is loaded by the AssemblyResolve handler the first
+            # time the runtime asks for it, so startup no longer reflects over
+            # the whole installation directory.
+            self._register_assembly_resolver()
+
             automation_dll = self._lib_path / 'DWSIM.Automation.dll'
-            if automation_dll.exists():
+            if automation_dll.stem not in _REFERENCED_ASSEMBLIES:
                 try:
                     clr.AddReference(str(automation_dll))
-                    logger.debug(f"Added reference to {automation_dll.name}")
                 except Exception as e:
-                    logger.warning(f"Failed to add reference to {automation_dll.name}: {e}")
+                    logger.warning("Failed to add reference to {}: {}", automation_dll.name, e)
                     raise
-            
-            # Load other DLLs (but skip ones that are known to cause issues)
-            skip_dlls = {
-                'DWSIM.Automation.dll',  # Already loaded
-                'ThermoCS.dll',  # Known to cause FileNotFoundException on some systems
-            }
-            for dll_file in self._lib_path.glob('*.dll'):
-                if dll_file.name in skip_dlls:
+                _REFERENCED_ASSEMBLIES.add(automation_dll.stem)
+
+            # Assemblies the runtime already has (pulled in by the Automation
+            # reference, or referenced by an earlier initialisation attempt)
+            # don't need another AddReference.
+            try:
+                from System import AppDomain  # type: ignore
+                already_loaded = {asm.GetName().Name for asm in AppDomain.CurrentDomain.GetAssemblies()}
+            except Exception:
+                already_loaded = set()
+
+            # The directory listing from the availability check is reused,
+            # so no file below needs its own stat.
+            contents = _dir_contents(str(self._lib_path)) or frozenset()
+            loaded, failed = 0, []
+            for name in _REQUIRED_DLLS[1:]:
+                dll_file = self._lib_path / name
+                if (
+                    name not in contents
+                    or _is_skipped_dll(name)
+                    or dll_file.stem in already_loaded
+                    or dll_file.stem in _REFERENCED_ASSEMBLIES
+                ):
                     continue
                 try:
                     clr.AddReference(str(dll_file))
-                    logger.debug(f"Added reference to {dll_file.name}")
-                except Exception as e:
-                    # Some DLLs may fail to load (e.g., native dependencies, UI components, missing dependencies), which is OK
-                    # ThermoCS.dll may fail to load due to missing dependencies - this is expected and handled gracefully
-                    if 'ThermoCS' in dll_file.name:
-                        logger.debug(f"ThermoCS.dll not available (expected on some systems): {e}")
-                    else:
-                        logger.debug(f"Could not add reference to {dll_file.name}: {e}")
+                    _REFERENCED_ASSEMBLIES.add(dll_file.stem)
+                    loaded += 1
+                except Exception:
+                    failed.append(name)
+            logger.debug(
+                "Added {} core DWSIM assembly references ({} failed: {})",
+                loaded, len(failed), ", ".join(failed) or "none",
+            )
 
             from DWSIM.Automation import Automation3  # type: ignore
 
             # Attempt to instantiate - this may fail on macOS due to System.Windows.Forms dependency
             try:
-                self._automation = Automation3()
-                logger.info("Loaded DWSIM automation from %s", self._lib_path)
+                automation = Automation3()
+                logger.info("Loaded DWSIM automation from {}", self._lib_path)
+                return automation
             except Exception as inst_exc:
-                logger.error("Failed to instantiate Automation3: %s", inst_exc, exc_info=True)
+                logger.error("Failed to instantiate Automation3: {}", inst_exc, exc_info=True)
                 raise
         except Exception as exc:  # pragma: no cover - env-specific failures
-            import platform
-            system = platform.system()
-            
             # Log the full exception details first
             logger.exception("Exception during DWSIM automation initialization:")
             
-            if system == 'Windows':
+            if _SYSTEM == 'Windows':
                 logger.warning(
                     "Failed to load DWSIM automation on Windows.\n"
-                    f"Full error: {exc}\n"
+                    "Full error: {}\n"
                     "Troubleshooting:\n"
                     "1. Ensure DWSIM_LIB_PATH points to your DWSIM installation directory\n"
                     "2. Verify DWSIM.Automation.dll exists in that directory\n"
@@ -223,32 +708,52 @@ class DWSIMClient:
                     "5. Try running as Administrator if permission issues occur\n"
                     "6. Make sure you're NOT using CoreCLR - DWSIM needs .NET Framework\n"
                     "Example: set DWSIM_LIB_PATH='C:\\Program Files\\DWSIM'",
+                    exc,
                     exc_info=True
                 )
-            elif system == 'Darwin':
+            elif _SYSTEM == 'Darwin':
                 logger.warning(
-                    f"Failed to load DWSIM automation on macOS: {exc}\n"
+                    "Failed to load DWSIM automation on macOS: {}\n"
                     "Note: DWSIM automation may not work on macOS due to System.Windows.Forms dependency. "
                     "See DWSIM_RUNTIME_ISSUES.md for alternatives.",
+                    exc,
                     exc_info=True
                 )
             else:
                 logger.warning(
-                    f"Failed to load DWSIM automation on Linux: {exc}\n"
+                    "Failed to load DWSIM automation on Linux: {}\n"
                     "Ensure Mono is installed and DWSIM_LIB_PATH is set correctly.",
+                    exc,
                     exc_info=True
                 )
-            self._automation = None
+            return None
+
+    def _register_assembly_resolver(self) -> None:
+        """Hook AppDomain.AssemblyResolve so DWSIM dependencies load on demand."""
+        global _ASSEMBLY_RESOLVER
+        with _AUTOMATION_LOCK:
+            if _ASSEMBLY_RESOLVER is not None:
+                return
+            try:
+                from System import AppDomain, ResolveEventHandler  # type: ignore
+                from System.Reflection import Assembly  # type: ignore
+            except Exception as exc:
+                logger.debug("AssemblyResolve hook unavailable: {}", exc)
+                return
+            resolver = _assembly_resolver(self._lib_path, Assembly.LoadFrom)
+            AppDomain.CurrentDomain.AssemblyResolve += ResolveEventHandler(resolver)
+            # Held at module level so the delegate's target is never collected
+            _ASSEMBLY_RESOLVER = resolver
 
     # ------------------------------------------------------------------
     # DWSIM type helpers
     # ------------------------------------------------------------------
+
     def _resolve_object_type_enum(self):
         """Locate DWSIM's ObjectType enum so AddObject can use the correct signature."""
         if self._object_type_enum is not None:
             return self._object_type_enum
         
-        import importlib
         candidates = [
             ("DWSIM.Interfaces.Enums.GraphicObjects", ["ObjectType", "GraphicObjectType"]),
             ("DWSIM.Interfaces.Enums", ["GraphicObjectType", "ObjectType"]),
@@ -263,7 +768,7 @@ class DWSIMClient:
                 enum_type = getattr(module, name, None)
                 if enum_type:
                     self._object_type_enum = enum_type
-                    logger.debug("Using DWSIM ObjectType enum: %s.%s", module_path, name)
+                    logger.debug("Using DWSIM ObjectType enum: {}.{}", module_path, name)
                     return enum_type
         
         logger.debug("Could not locate DWSIM ObjectType enum; will rely on string-based AddObject calls")
@@ -272,54 +777,82 @@ class DWSIMClient:
 
     def _get_object_type_value(self, object_name: str):
         """Return the enum value for a DWSIM object type if available."""
-        if object_name in self._object_type_cache:
-            return self._object_type_cache[object_name]
-        
-        enum_type = self._resolve_object_type_enum()
-        if not enum_type:
-            self._object_type_cache[object_name] = None
+        cache = DWSIMClient._OBJECT_TYPE_VALUES
+        if not cache:
+            # Resolve every type the client creates in one pass, so stream
+            # and unit creation is a plain dict lookup from then on.
+            for name in ("MaterialStream", *_UNIT_TYPE_MAP.values()):
+                cache[name] = self._lookup_object_type(name)
+        try:
+            return cache[object_name]
+        except KeyError:
+            value = cache[object_name] = self._lookup_object_type(object_name)
+            return value
+
+    def _lookup_object_type(self, object_name: str):
+        """Find `object_name` on the ObjectType enum, ignoring case, spaces, '-' and '_'."""
+        member = self._object_type_members.get(_canonical_type_name(object_name))
+        if member is None:
+            logger.debug("No enum value found for object type '{}'", object_name)
             return None
-        
-        variants = {
-            object_name,
-            object_name.replace(" ", ""),
-            object_name.replace("-", ""),
-            object_name.replace("_", ""),
-        }
-        for variant in variants:
-            if hasattr(enum_type, variant):
-                value = getattr(enum_type, variant)
-                self._object_type_cache[object_name] = value
-                return value
-            pascal = variant[:1].upper() + variant[1:]
-            if hasattr(enum_type, pascal):
-                value = getattr(enum_type, pascal)
-                self._object_type_cache[object_name] = value
-                return value
-        
-        self._object_type_cache[object_name] = None
-        logger.debug("No enum value found for object type '%s'", object_name)
-        return None
+        return getattr(self._object_type_enum, member)
+
+    @functools.cached_property
+    def _object_type_members(self) -> Dict[str, str]:
+        # One dir() of the enum instead of probing each spelling variant
+        # with getattr across pythonnet
+        enum_type = self._resolve_object_type_enum()
+        if enum_type is None:
+            return {}
+        return {_canonical_type_name(name): name for name in dir(enum_type) if not name.startswith('_')}
+
+    def _call_resolved(self, kind: str, candidates, flowsheet, arg) -> bool:
+        """
+        Call the first of `candidates` that `flowsheet` supports.
+
+        The winning candidate is remembered per flowsheet type for the whole
+        process, so later calls (from any client) skip the AttributeError/
+        TypeError probing across pythonnet. Any other
+        exception means the method exists but rejected `arg`; it is still
+        remembered, then re-raised. Returns False if no candidate applies.
+        """
+        key = (type(flowsheet).__name__, kind)
+        resolved = DWSIMClient._RESOLVED_METHODS
+        cached = resolved.get(key)
+        if cached is not None:
+            try:
+                cached(flowsheet, arg)
+                return True
+            except (AttributeError, TypeError):
+                resolved.pop(key, None)
+
+        for method in candidates:
+            if method is cached:
+                continue
+            try:
+                method(flowsheet, arg)
+            except (AttributeError, TypeError):
+                continue
+            except Exception:
+                resolved[key] = method
+                raise
+            resolved[key] = method
+            return True
+        return False
 
     def _run_dwsim(self, payload: schemas.FlowsheetPayload) -> schemas.SimulationResult:
         """Create and run a DWSIM flowsheet from JSON payload."""
         assert self._automation
 
-        # Create a new flowsheet (or load template as base)
-        # Try CreateFlowsheet() first (confirmed working in tests), fallback to NewFlowsheet()
+        # Create a new flowsheet (or load template as base) with
+        # CreateFlowsheet() (confirmed working in tests) or NewFlowsheet()
         if self._template_path:
             flowsheet = self._load_template_flowsheet()
             if flowsheet is None:
                 logger.warning("Template not found, creating blank flowsheet")
-                try:
-                    flowsheet = self._automation.CreateFlowsheet()
-                except (AttributeError, TypeError):
-                    flowsheet = self._automation.NewFlowsheet()
+                flowsheet = self._new_flowsheet()
         else:
-            try:
-                flowsheet = self._automation.CreateFlowsheet()
-            except (AttributeError, TypeError):
-                flowsheet = self._automation.NewFlowsheet()
+            flowsheet = self._new_flowsheet()
 
         # Keep a reference for debugging/inspection
         self._last_flowsheet = flowsheet
@@ -348,7 +881,7 @@ class DWSIMClient:
             if connection_warnings:
                 logger.warning("Stream connection warnings (DWSIM may infer connections automatically):")
                 for warning in connection_warnings:
-                    logger.warning("  %s", warning)
+                    logger.warning("  {}", warning)
                     warnings.append(warning)
             
             # Step 6: Configure unit parameters
@@ -370,22 +903,23 @@ class DWSIMClient:
                             try:
                                 temp = stream_obj.GetProp('temperature', 'overall', None, '', 'K')
                                 if temp and len(temp) > 0:
-                                    logger.info("Stream %s: Temperature = %f K (after setting)", stream_spec.id, temp[0])
+                                    logger.info("Stream {}: Temperature = {:f} K (after setting)", stream_spec.id, temp[0])
                                 else:
-                                    logger.warning("Stream %s: Temperature not readable (may not have been set)", stream_spec.id)
+                                    logger.warning("Stream {}: Temperature not readable (may not have been set)", stream_spec.id)
                             except Exception as e:
-                                logger.debug("Stream %s: Could not read temperature: %s", stream_spec.id, e)
+                                logger.debug("Stream {}: Could not read temperature: {}", stream_spec.id, e)
                     except Exception as e:
-                        logger.debug("Error verifying stream %s: %s", stream_spec.id, e)
+                        logger.debug("Error verifying stream {}: {}", stream_spec.id, e)
             
             # Step 9: Run simulation (DWSIM may infer connections from stream properties and unit config)
-            logger.info("Running DWSIM simulation for flowsheet: %s", payload.name)
+            logger.info("Running DWSIM simulation for flowsheet: {}", payload.name)
             logger.info("Note: If connections failed, DWSIM may infer them from stream properties and unit configuration")
             try:
-                self._automation.CalculateFlowsheet(flowsheet, None)
+                with _AUTOMATION_LOCK:
+                    self._automation.CalculateFlowsheet(flowsheet, None)
                 logger.info("CalculateFlowsheet completed")
             except Exception as calc_exc:
-                logger.error("CalculateFlowsheet failed: %s", calc_exc)
+                logger.error("CalculateFlowsheet failed: {}", calc_exc)
                 warnings.append(f"Calculation error: {str(calc_exc)}")
             
             # Step 9: Extract results
@@ -433,10 +967,10 @@ class DWSIMClient:
                             prop_info["has_getprop"] = self._has_method(stream_obj, "GetProp")
                             prop_info["stream_type"] = str(type(stream_obj))
                             prop_info["dotnet_type"] = self._get_dotnet_type(stream_obj)
-                            logger.info("Diagnostics: Casted stream %s to MaterialStream for diagnostics", stream_spec.id)
+                            logger.info("Diagnostics: Casted stream {} to MaterialStream for diagnostics", stream_spec.id)
                     
                     if not hasattr(stream_obj, "SetProp"):
-                        logger.warning("Diagnostics: Stream %s doesn't have SetProp, attempting re-resolution", stream_spec.id)
+                        logger.warning("Diagnostics: Stream {} doesn't have SetProp, attempting re-resolution", stream_spec.id)
                         try:
                             if hasattr(flowsheet, "MaterialStreams"):
                                 all_streams = list(self._iterate_collection(flowsheet.MaterialStreams))
@@ -447,7 +981,7 @@ class DWSIMClient:
                                         resolved_item = self._as_material_stream(item) or item
                                         stream_obj = resolved_item
                                         stream_map[stream_spec.id] = stream_obj  # Update map
-                                        logger.info("✓ Re-resolved stream %s to MaterialStream during diagnostics", stream_spec.id)
+                                        logger.info("✓ Re-resolved stream {} to MaterialStream during diagnostics", stream_spec.id)
                                         # Update diagnostics with resolved object
                                         prop_info["has_setprop"] = True
                                         prop_info["has_getprop"] = self._has_method(stream_obj, "GetProp")
@@ -455,7 +989,7 @@ class DWSIMClient:
                                         prop_info["dotnet_type"] = self._get_dotnet_type(stream_obj)
                                         break
                         except Exception as e:
-                            logger.debug("Re-resolution during diagnostics failed: %s", e)
+                            logger.debug("Re-resolution during diagnostics failed: {}", e)
                     
                     # Try to find MaterialStream in collections for comparison
                     try:
@@ -588,7 +1122,7 @@ class DWSIMClient:
                 diagnostics=diagnostics,
             )
         except Exception as exc:
-            logger.exception("Error creating/running DWSIM flowsheet: %s", exc)
+            _sampled_exception(exc, "Error creating/running DWSIM flowsheet: {}", exc)
             warnings.append(f"DWSIM error: {str(exc)}")
             # Return partial results if available
             try:
@@ -609,38 +1143,50 @@ class DWSIMClient:
         if not self._template_path:
             return None
         template = Path(self._template_path)
-        if not template.exists():
-            logger.warning("Configured DWSIM template %s does not exist", template)
+        try:
+            stat = template.stat()
+        except OSError:
+            logger.warning("Configured DWSIM template {} does not exist", template)
             return None
+        key = (str(template), stat.st_mtime_ns, stat.st_size)
+
+        # Builds that can deep-copy a flowsheet keep one loaded prototype per
+        # template version and skip the disk round-trip and XML parse. The
+        # prototype is only touched under the automation lock, so a run on
+        # another thread never sees it half-cloned.
+        with _AUTOMATION_LOCK:
+            prototype = self._template_prototype
+            if prototype is None or prototype[0] != key:
+                flowsheet = self._load_template_copy(template, key)
+                clone = self._template_cloner()
+                if clone is None:
+                    return flowsheet
+                prototype = (key, flowsheet, clone)
+                self._template_prototype = prototype
+            logger.info("Running cloned DWSIM template {}", template)
+            return prototype[2](prototype[1])
+
+    def _template_cloner(self) -> Optional[Callable]:
+        """
+        Return Automation3's flowsheet deep copy, or None if this build lacks it.
+
+        A flowsheet's own Clone/GetClone may be memberwise; objects a run
+        adds to such a copy would accumulate in the shared prototype, so
+        without the Automation-level clone every run reloads the template.
+        """
+        return getattr(self._automation, "CloneFlowsheet", None)
 
-        # Copy to a temp file to avoid mutating the original flowsheet.
-        tmp_dir = Path(tempfile.mkdtemp(prefix='dwsim-run-'))
-        tmp_file = tmp_dir / template.name
-        tmp_file.write_bytes(template.read_bytes())
-        logger.info("Running DWSIM template %s", tmp_file)
+    def _load_template_copy(self, template: Path, key: Tuple[str, int, int]):
+        """Load the process's private copy of the template, so the original is never mutated."""
+        tmp_file = _template_copy_for(template, key)
+        logger.info("Running DWSIM template {}", tmp_file)
         return self._automation.LoadFlowsheet(str(tmp_file))
 
     def _configure_property_package(self, flowsheet, thermo: schemas.ThermoConfig, warnings: List[str]) -> None:
         """Configure the property package in DWSIM."""
         try:
-            # Map property package names to DWSIM types
-            # Avoid ThermoCPropertyPackage as it may have missing dependencies
-            package_map = {
-                "Peng-Robinson": "Peng-Robinson",
-                "PR": "Peng-Robinson",
-                "Soave-Redlich-Kwong": "Soave-Redlich-Kwong",
-                "SRK": "Soave-Redlich-Kwong",
-                "NRTL": "NRTL",
-                "UNIFAC": "UNIFAC",
-                "UNIQUAC": "UNIQUAC",
-                "Lee-Kesler-Plöcker": "Lee-Kesler-Plöcker",
-                "IAPWS-IF97": "IAPWS-IF97",
-                "Chao-Seader": "Chao-Seader",
-                "Grayson-Streed": "Grayson-Streed",
-            }
-            
             package_name = thermo.package or "Peng-Robinson"
-            dwsim_package = package_map.get(package_name, "Peng-Robinson")
+            dwsim_package = _PACKAGE_MAP.get(package_name, "Peng-Robinson")
             
             # Avoid problematic property packages
             if "ThermoC" in dwsim_package or "ThermoCS" in dwsim_package:
@@ -652,44 +1198,32 @@ class DWSIMClient:
                 warnings.append(f"Property package '{package_name}' mapped to '{dwsim_package}'")
             
             # Set property package (DWSIM API method)
-            # Try multiple method names in order of likelihood
-            set_methods = [
-                lambda: setattr(flowsheet, 'PropertyPackage', dwsim_package),
-                lambda: flowsheet.SetPropertyPackage(dwsim_package),
-                lambda: flowsheet.SetPropertyPackageName(dwsim_package),
-                lambda: flowsheet.SetThermoPackage(dwsim_package),
-            ]
-            
             success = False
             last_error = None
-            for method in set_methods:
-                try:
-                    method()
+            try:
+                success = self._call_resolved(
+                    'property_package', _PROPERTY_PACKAGE_SETTERS, flowsheet, dwsim_package
+                )
+                if success:
                     logger.info("Set property package to: {}", dwsim_package)
-                    success = True
                     self._active_property_package = dwsim_package
-                    break
-                except (AttributeError, TypeError) as e:
-                    last_error = e
-                    continue
-                except Exception as e:
-                    last_error = e
-                    # Check if it's a FileNotFoundException for ThermoCS.dll
-                    error_str = str(e).lower()
-                    if "thermocs" in error_str or "filenotfound" in error_str:
-                        logger.warning("ThermoC property package dependency missing, trying Peng-Robinson")
-                        dwsim_package = "Peng-Robinson"
-                        try:
-                            setattr(flowsheet, 'PropertyPackage', dwsim_package)
-                            logger.info("Set property package to: Peng-Robinson (fallback)")
-                            success = True
-                            self._active_property_package = dwsim_package
-                            warnings.append("ThermoC property package unavailable, using Peng-Robinson")
-                            break
-                        except Exception:
-                            pass
-                    logger.debug("Property package method failed: %s", e)
-                    continue
+            except Exception as e:
+                last_error = e
+                # Check if it's a FileNotFoundException for ThermoCS.dll
+                error_str = str(e).lower()
+                if "thermocs" in error_str or "filenotfound" in error_str:
+                    logger.warning("ThermoC property package dependency missing, trying Peng-Robinson")
+                    dwsim_package = "Peng-Robinson"
+                    try:
+                        setattr(flowsheet, 'PropertyPackage', dwsim_package)
+                        logger.info("Set property package to: Peng-Robinson (fallback)")
+                        success = True
+                        self._active_property_package = dwsim_package
+                        warnings.append("ThermoC property package unavailable, using Peng-Robinson")
+                    except Exception:
+                        pass
+                else:
+                    logger.debug("Property package method failed: {}", e)
             
             if not success:
                 error_msg = f"Could not set property package '{dwsim_package}'"
@@ -698,7 +1232,7 @@ class DWSIMClient:
                 warnings.append(error_msg)
                 self._active_property_package = None
         except Exception as exc:
-            logger.warning("Failed to configure property package: %s", exc)
+            logger.warning("Failed to configure property package: {}", exc)
             warnings.append(f"Property package configuration error: {str(exc)}")
 
     def _add_components(self, flowsheet, components: List[str], warnings: List[str]) -> None:
@@ -708,43 +1242,38 @@ class DWSIMClient:
             components = ["Water", "Methane", "Ethane"]  # Default fallback
         
         try:
-            # Try multiple method names for adding components
-            add_methods = [
-                lambda c: flowsheet.AddComponent(c),
-                lambda c: flowsheet.AddCompound(c),
-                lambda c: flowsheet.AddChemical(c),
-                lambda c: flowsheet.AddComponentToFlowsheet(c),
-            ]
-            
             for comp in components:
-                success = False
-                for method in add_methods:
-                    try:
-                        method(comp)
-                        logger.debug("Added component: %s", comp)
-                        success = True
-                        break
-                    except (AttributeError, TypeError):
-                        continue
-                    except Exception as comp_exc:
-                        # If method exists but component not found, that's different
-                        logger.warning("Failed to add component '%s': %s", comp, comp_exc)
-                        warnings.append(f"Component '{comp}' not found in DWSIM database")
-                        success = True  # Method worked, component just not found
-                        break
+                try:
+                    success = self._call_resolved('add_component', _COMPONENT_ADDERS, flowsheet, comp)
+                    if success:
+                        logger.debug("Added component: {}", comp)
+                except Exception as comp_exc:
+                    # If method exists but component not found, that's different
+                    logger.warning("Failed to add component '{}': {}", comp, comp_exc)
+                    warnings.append(f"Component '{comp}' not found in DWSIM database")
+                    success = True  # Method worked, component just not found
                 
                 if not success:
-                    logger.warning("Could not find method to add component '%s'", comp)
+                    logger.warning("Could not find method to add component '{}'", comp)
                     warnings.append(f"Could not add component '{comp}' - run test_api_methods.py to discover correct method")
         except Exception as exc:
-            logger.warning("Failed to add components: %s", exc)
+            logger.warning("Failed to add components: {}", exc)
             warnings.append(f"Component addition error: {str(exc)}")
 
     def _create_streams(self, flowsheet, streams: List[schemas.StreamSpec], warnings: List[str]) -> dict:
         """Create material streams in DWSIM."""
         stream_map = {}  # Maps stream.id -> DWSIM stream object
         stream_enum = self._get_object_type_value("MaterialStream")
-        
+        # Probe the flowsheet API once, not once per stream; every hasattr
+        # on a CLR object is a reflection round-trip.
+        has_api = {name: hasattr(flowsheet, name) for name in (
+            'CreateMaterialStream', 'AddMaterialStream', 'NewMaterialStream',
+            'AddFlowsheetObject', 'AddSimulationObject', 'AddGraphicObject', 'AddObject',
+        )}
+        # Creation signature that last worked on this flowsheet type; tried
+        # first, so normally each stream costs one CLR call
+        create_key = (type(flowsheet).__name__, "MaterialStream")
+
         for stream_spec in streams:
             stream_obj = None
             stream_name = stream_spec.id or stream_spec.name or f"stream_{len(stream_map)}"
@@ -755,61 +1284,65 @@ class DWSIMClient:
             method_attempts = []
 
             # Prefer stream-specific helpers first
-            if hasattr(flowsheet, 'CreateMaterialStream'):
+            if has_api['CreateMaterialStream']:
                 method_attempts.append(("CreateMaterialStream", lambda sn=stream_name, x_coord=x, y_coord=y: flowsheet.CreateMaterialStream(sn, x_coord, y_coord)))
-            if hasattr(flowsheet, 'AddMaterialStream'):
+            if has_api['AddMaterialStream']:
                 method_attempts.append(("AddMaterialStream", lambda sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddMaterialStream(sn, x_coord, y_coord)))
-            if hasattr(flowsheet, 'NewMaterialStream'):
+            if has_api['NewMaterialStream']:
                 method_attempts.append(("NewMaterialStream", lambda sn=stream_name, x_coord=x, y_coord=y: flowsheet.NewMaterialStream(sn, x_coord, y_coord)))
 
             # Known working signature on Windows builds
-            if hasattr(flowsheet, 'AddFlowsheetObject'):
+            if has_api['AddFlowsheetObject']:
                 method_attempts.append(("AddFlowsheetObject('Material Stream')", lambda sn=stream_name: flowsheet.AddFlowsheetObject("Material Stream", sn)))
 
             for type_name in ["Material Stream", "MaterialStream"]:
-                if hasattr(flowsheet, 'AddFlowsheetObject'):
+                if has_api['AddFlowsheetObject']:
                     method_attempts.extend([
                         (f"AddFlowsheetObject('{type_name}', coords)", lambda tn=type_name, sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddFlowsheetObject(tn, sn, x_coord, y_coord)),
                         (f"AddFlowsheetObject('{type_name}')", lambda tn=type_name, sn=stream_name: flowsheet.AddFlowsheetObject(tn, sn)),
                     ])
-                if hasattr(flowsheet, 'AddSimulationObject'):
+                if has_api['AddSimulationObject']:
                     method_attempts.extend([
                         (f"AddSimulationObject('{type_name}', coords)", lambda tn=type_name, sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddSimulationObject(tn, sn, x_coord, y_coord)),
                         (f"AddSimulationObject('{type_name}')", lambda tn=type_name, sn=stream_name: flowsheet.AddSimulationObject(tn, sn)),
                     ])
-                if hasattr(flowsheet, 'AddGraphicObject'):
+                if has_api['AddGraphicObject']:
                     method_attempts.extend([
                         (f"AddGraphicObject('{type_name}', coords)", lambda tn=type_name, sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddGraphicObject(tn, sn, x_coord, y_coord)),
                         (f"AddGraphicObject('{type_name}')", lambda tn=type_name, sn=stream_name: flowsheet.AddGraphicObject(tn, sn)),
                     ])
                 method_attempts.extend([
                     (f"AddObject('{type_name}', coords)", lambda tn=type_name, sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddObject(tn, float(x_coord), float(y_coord), sn)),
-                    (f"AddObject('{type_name}')", lambda tn=type_name, sn=stream_name: flowsheet.AddObject(tn, sn) if hasattr(flowsheet, 'AddObject') else None),
+                    (f"AddObject('{type_name}')", lambda tn=type_name, sn=stream_name: flowsheet.AddObject(tn, sn) if has_api['AddObject'] else None),
                 ])
 
             if stream_enum is not None:
                 method_attempts.extend([
                     ("AddObject(enum, coords)", lambda sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddObject(stream_enum, float(x_coord), float(y_coord), sn)),
-                    ("AddObject(enum)", lambda sn=stream_name: flowsheet.AddObject(stream_enum, sn) if hasattr(flowsheet, 'AddObject') else None),
+                    ("AddObject(enum)", lambda sn=stream_name: flowsheet.AddObject(stream_enum, sn) if has_api['AddObject'] else None),
                 ])
-                if hasattr(flowsheet, 'AddFlowsheetObject'):
+                if has_api['AddFlowsheetObject']:
                     method_attempts.extend([
                         ("AddFlowsheetObject(enum, coords)", lambda sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddFlowsheetObject(stream_enum, sn, float(x_coord), float(y_coord))),
                         ("AddFlowsheetObject(enum)", lambda sn=stream_name: flowsheet.AddFlowsheetObject(stream_enum, sn)),
                     ])
-                if hasattr(flowsheet, 'AddSimulationObject'):
+                if has_api['AddSimulationObject']:
                     method_attempts.extend([
                         ("AddSimulationObject(enum, coords)", lambda sn=stream_name, x_coord=x, y_coord=y: flowsheet.AddSimulationObject(stream_enum, sn, float(x_coord), float(y_coord))),
                         ("AddSimulationObject(enum)", lambda sn=stream_name: flowsheet.AddSimulationObject(stream_enum, sn)),
                     ])
 
             method_attempts.append(("MaterialStreams collection fallback", lambda: self._create_stream_via_collection(flowsheet, stream_name, x, y)))
-            
+            preferred = self._CREATE_METHODS.get(create_key)
+            if preferred is not None:
+                method_attempts.sort(key=lambda attempt: attempt[0] != preferred)
+
             for desc, method in method_attempts:
                 try:
                     result = method()
                     if result is not None:
                         stream_obj = result
+                        DWSIMClient._CREATE_METHODS[create_key] = desc
                         logger.debug("Created stream '{}' via {}", stream_name, desc)
                         break
                     logger.debug("Stream creation method {} returned None", desc)
@@ -844,10 +1377,10 @@ class DWSIMClient:
                                     item_type = str(type(item)).lower()
                                     if "materialstream" in item_type:
                                         stream_obj = item
-                                        logger.debug("Found MaterialStream via direct lookup: %s", stream_name)
+                                        logger.debug("Found MaterialStream via direct lookup: {}", stream_name)
                                         break
                     except Exception as e:
-                        logger.debug("Direct MaterialStreams lookup failed: %s", e)
+                        logger.debug("Direct MaterialStreams lookup failed: {}", e)
                 
                 stream_map[stream_spec.id] = stream_obj
                 
@@ -858,14 +1391,14 @@ class DWSIMClient:
                     elif hasattr(stream_obj, "GraphicObject") and hasattr(stream_obj.GraphicObject, "Tag"):
                         stream_obj.GraphicObject.Tag = stream_name
                 except Exception:
-                    logger.debug("Could not set name/tag for stream %s", stream_name)
+                    logger.debug("Could not set name/tag for stream {}", stream_name)
                 
                 # Try to upgrade ISimulationObject to actual MaterialStream (cast exposes SetProp)
                 cast_stream = self._as_material_stream(stream_obj)
                 if cast_stream and cast_stream is not stream_obj:
                     stream_obj = cast_stream
                     stream_map[stream_spec.id] = stream_obj
-                    logger.info("✓ Casted stream %s to MaterialStream (SetProp available)", stream_spec.id)
+                    logger.info("✓ Casted stream {} to MaterialStream (SetProp available)", stream_spec.id)
 
                 # Bind the active property package to the stream so property setters can work
                 pkg_assigned = self._assign_property_package_to_stream(stream_obj, flowsheet)
@@ -902,19 +1435,19 @@ class DWSIMClient:
                                 if attached and hasattr(attached, "SetProp"):
                                     stream_obj = attached
                                     stream_map[stream_spec.id] = stream_obj
-                                    logger.info("✓ Resolved MaterialStream via GraphicObject.%s for %s", attr, stream_spec.id)
+                                    logger.info("✓ Resolved MaterialStream via GraphicObject.{} for {}", attr, stream_spec.id)
                                     break
                     except Exception as e:
-                        logger.debug("GraphicObject resolution attempt failed: %s", e)
+                        logger.debug("GraphicObject resolution attempt failed: {}", e)
                 
                 if not hasattr(stream_obj, "SetProp"):
-                    logger.warning("Stream %s doesn't have SetProp, attempting MaterialStream lookup from collection", stream_spec.id)
+                    logger.warning("Stream {} doesn't have SetProp, attempting MaterialStream lookup from collection", stream_spec.id)
                     resolved = False
                     try:
                         if hasattr(flowsheet, "MaterialStreams"):
                             # Get all streams and find the one we just created
                             all_streams = list(self._iterate_collection(flowsheet.MaterialStreams))
-                            logger.info("Found %d streams in MaterialStreams collection", len(all_streams))
+                            logger.info("Found {} streams in MaterialStreams collection", len(all_streams))
                             
                             if len(all_streams) == 0:
                                 logger.warning("MaterialStreams collection is empty!")
@@ -927,13 +1460,13 @@ class DWSIMClient:
                                 item_name = getattr(item, "Name", None)
                                 item_tag = getattr(getattr(item, "GraphicObject", None), "Tag", None)
                                 has_setprop = hasattr(item, "SetProp")
-                                logger.info("Stream %d in collection: name='%s', tag='%s', type=%s, dotnet_type=%s, has_SetProp=%s", 
+                                logger.info("Stream {} in collection: name='{}', tag='{}', type={}, dotnet_type={}, has_SetProp={}", 
                                            idx, item_name, item_tag, item_type, dotnet_item_type, has_setprop)
                                 ms_candidate = self._as_material_stream(item)
                                 if ms_candidate and hasattr(ms_candidate, "SetProp"):
                                     streams_with_setprop.append((idx, ms_candidate, item_name, item_tag))
                             
-                            logger.info("Found %d streams with SetProp method", len(streams_with_setprop))
+                            logger.info("Found {} streams with SetProp method", len(streams_with_setprop))
                             
                             # PRIORITY 1: Match by name/tag AND has SetProp (this is the actual MaterialStream)
                             for idx, item, item_name, item_tag in streams_with_setprop:
@@ -975,7 +1508,6 @@ class DWSIMClient:
                                 
                     except Exception as e:
                         logger.warning("MaterialStream collection lookup failed: {}", e)
-                        import traceback
                         logger.error("Traceback: {}", traceback.format_exc())
                     
                     # Final check - if we still don't have SetProp, log a critical error
@@ -1029,12 +1561,12 @@ class DWSIMClient:
                 temp = props.get("temperature")
                 temp_set = False
                 if temp is not None:
-                    if self._set_stream_prop(stream_obj, "temperature", "overall", None, "", "K", temp + 273.15):
+                    temp_options = (("K", temp + 273.15), ("C", temp))
+                    temp_unit = self._set_stream_prop_in_units(stream_obj, "temperature", temp_options)
+                    if temp_unit is not None:
                         temp_set = True
-                        logger.info("✓ Set temperature for {}: {} K", stream_spec.id, temp + 273.15)
-                    elif self._set_stream_prop(stream_obj, "temperature", "overall", None, "", "C", temp):
-                        temp_set = True
-                        logger.info("✓ Set temperature for {}: {} C", stream_spec.id, temp)
+                        logger.info("✓ Set temperature for {}: {} {}", stream_spec.id,
+                                    dict(temp_options)[temp_unit], temp_unit)
                     else:
                         logger.error("✗ Failed to set temperature for {}", stream_spec.id)
                         warnings.append(f"Stream {stream_spec.id}: Could not set temperature")
@@ -1054,18 +1586,21 @@ class DWSIMClient:
                 # Mass flow (convert kg/h to kg/s)
                 flow = props.get("flow_rate") or props.get("mass_flow")
                 if flow is not None:
-                    if not self._set_stream_prop(stream_obj, "totalflow", "overall", None, "", "kg/s", flow / 3600.0):
-                        if not self._set_stream_prop(stream_obj, "totalflow", "overall", None, "", "kg/h", flow):
-                            warnings.append(f"Stream {stream_spec.id}: Could not set flow rate")
+                    flow_options = (("kg/s", flow / 3600.0), ("kg/h", flow))
+                    if self._set_stream_prop_in_units(stream_obj, "totalflow", flow_options) is None:
+                        warnings.append(f"Stream {stream_spec.id}: Could not set flow rate")
                 
                 # Composition (mole fractions)
                 composition = props.get("composition", {})
                 if composition:
-                    total = sum(composition.values())
+                    comp_names = list(composition)
+                    fractions = np.fromiter(composition.values(), dtype=np.float64, count=len(comp_names))
+                    total = fractions.sum()
                     if total > 0:
+                        fractions /= total
+                        normalized = dict(zip(comp_names, fractions.tolist()))
                         composition_set = False
-                        for comp, frac in composition.items():
-                            normalized_frac = frac / total
+                        for comp, normalized_frac in normalized.items():
                             # Try SetProp-style first; if not available, skip silently (some builds expose composition elsewhere)
                             if self._set_stream_prop(stream_obj, "molefraction", "overall", comp, "", "", normalized_frac):
                                 composition_set = True
@@ -1075,8 +1610,7 @@ class DWSIMClient:
                             # Try alternative composition setting methods
                             try:
                                 if hasattr(stream_obj, "SetOverallComposition"):
-                                    comp_dict = {comp: frac / total for comp, frac in composition.items()}
-                                    stream_obj.SetOverallComposition(comp_dict)
+                                    stream_obj.SetOverallComposition(normalized)
                                     composition_set = True
                                     logger.debug("Set composition via SetOverallComposition for {}", stream_spec.id)
                             except Exception as e:
@@ -1115,44 +1649,16 @@ class DWSIMClient:
     def _create_units(self, flowsheet, units: List[schemas.UnitSpec], warnings: List[str]) -> dict:
         """Create unit operations in DWSIM."""
         unit_map = {}  # Maps unit.id -> DWSIM unit object
-        
-        # Map JSON unit types to DWSIM unit operation types
-        type_map = {
-            "distillationColumn": "DistillationColumn",
-            "packedColumn": "PackedColumn",
-            "absorber": "AbsorptionColumn",
-            "stripper": "StrippingColumn",
-            "flashDrum": "FlashDrum",
-            "separator": "Separator",
-            "separator3p": "ThreePhaseSeparator",
-            "tank": "Tank",
-            "heaterCooler": "Heater",
-            "shellTubeHX": "HeatExchanger",
-            "airCooler": "AirCooler",
-            "kettleReboiler": "KettleReboiler",
-            "firedHeater": "FiredHeater",
-            "cstr": "CSTR",
-            "pfr": "PFR",
-            "gibbsReactor": "GibbsReactor",
-            "equilibriumReactor": "EquilibriumReactor",
-            "conversionReactor": "ConversionReactor",
-            "pump": "Pump",
-            "compressor": "Compressor",
-            "turbine": "Turbine",
-            "valve": "Valve",
-            "mixer": "Mixer",
-            "splitter": "Splitter",
-            "filter": "Filter",
-            "cyclone": "Cyclone",
-            "adsorber": "Adsorber",
-            "membrane": "Membrane",
-            "boiler": "Boiler",
-            "condenser": "Condenser",
-        }
-        
+        # Probe the flowsheet API once, not once per unit (see _create_streams)
+        has_api = {name: hasattr(flowsheet, name) for name in (
+            'AddFlowsheetObject', 'AddSimulationObject', 'AddGraphicObject', 'AddObject',
+        )}
+        # Creation signatures that worked per DWSIM type are tried first
+        flowsheet_type = type(flowsheet).__name__
+
         for unit_spec in units:
             unit_obj = None
-            dwsim_type = type_map.get(unit_spec.type)
+            dwsim_type = _UNIT_TYPE_MAP.get(unit_spec.type)
             if not dwsim_type:
                 warnings.append(f"Unit type '{unit_spec.type}' not supported in DWSIM - skipping")
                 continue
@@ -1167,62 +1673,66 @@ class DWSIMClient:
             # Try multiple method signatures and approaches
             method_attempts = []
             # Prioritize the working signature observed on Windows: AddFlowsheetObject("Pump", name)
-            method_attempts.append(("AddFlowsheetObject(str)", lambda ut=dwsim_type, uid=unit_spec.id: flowsheet.AddFlowsheetObject(ut, uid) if hasattr(flowsheet, 'AddFlowsheetObject') else None))
+            method_attempts.append(("AddFlowsheetObject(str)", lambda ut=dwsim_type, uid=unit_spec.id: flowsheet.AddFlowsheetObject(ut, uid) if has_api['AddFlowsheetObject'] else None))
             if unit_enum is not None:
                 method_attempts.extend([
                     ("AddObject(enum, coords)", lambda ut=unit_enum, uid=unit_spec.id, x_coord=x, y_coord=y: flowsheet.AddObject(ut, float(x_coord), float(y_coord), uid)),
-                    ("AddObject(enum)", lambda ut=unit_enum, uid=unit_spec.id: flowsheet.AddObject(ut, uid) if hasattr(flowsheet, 'AddObject') else None),
+                    ("AddObject(enum)", lambda ut=unit_enum, uid=unit_spec.id: flowsheet.AddObject(ut, uid) if has_api['AddObject'] else None),
                 ])
-                if hasattr(flowsheet, 'AddFlowsheetObject'):
+                if has_api['AddFlowsheetObject']:
                     method_attempts.extend([
                         ("AddFlowsheetObject(enum, coords)", lambda ut=unit_enum, uid=unit_spec.id, x_coord=x, y_coord=y: flowsheet.AddFlowsheetObject(ut, uid, float(x_coord), float(y_coord))),
                         ("AddFlowsheetObject(enum)", lambda ut=unit_enum, uid=unit_spec.id: flowsheet.AddFlowsheetObject(ut, uid)),
                     ])
-                if hasattr(flowsheet, 'AddSimulationObject'):
+                if has_api['AddSimulationObject']:
                     method_attempts.extend([
                         ("AddSimulationObject(enum, coords)", lambda ut=unit_enum, uid=unit_spec.id, x_coord=x, y_coord=y: flowsheet.AddSimulationObject(ut, uid, float(x_coord), float(y_coord))),
                         ("AddSimulationObject(enum)", lambda ut=unit_enum, uid=unit_spec.id: flowsheet.AddSimulationObject(ut, uid)),
                     ])
             
-            if hasattr(flowsheet, 'AddFlowsheetObject'):
+            if has_api['AddFlowsheetObject']:
                 method_attempts.extend([
                     ("AddFlowsheetObject(str, coords)", lambda ut=dwsim_type, uid=unit_spec.id, x_coord=x, y_coord=y: flowsheet.AddFlowsheetObject(ut, uid, x_coord, y_coord)),
                     ("AddFlowsheetObject(str)", lambda ut=dwsim_type, uid=unit_spec.id: flowsheet.AddFlowsheetObject(ut, uid)),
                 ])
-            if hasattr(flowsheet, 'AddSimulationObject'):
+            if has_api['AddSimulationObject']:
                 method_attempts.extend([
                     ("AddSimulationObject(str, coords)", lambda ut=dwsim_type, uid=unit_spec.id, x_coord=x, y_coord=y: flowsheet.AddSimulationObject(ut, uid, x_coord, y_coord)),
                     ("AddSimulationObject(str)", lambda ut=dwsim_type, uid=unit_spec.id: flowsheet.AddSimulationObject(ut, uid)),
                 ])
-            if hasattr(flowsheet, 'AddGraphicObject'):
+            if has_api['AddGraphicObject']:
                 method_attempts.extend([
                     ("AddGraphicObject(str, coords)", lambda ut=dwsim_type, uid=unit_spec.id, x_coord=x, y_coord=y: flowsheet.AddGraphicObject(ut, uid, x_coord, y_coord)),
                     ("AddGraphicObject(str)", lambda ut=dwsim_type, uid=unit_spec.id: flowsheet.AddGraphicObject(ut, uid)),
                 ])
             method_attempts.extend([
                 ("AddObject(str, coords)", lambda ut=dwsim_type, uid=unit_spec.id, x_coord=x, y_coord=y: flowsheet.AddObject(ut, x_coord, y_coord, uid)),
-                ("AddObject(str)", lambda ut=dwsim_type, uid=unit_spec.id: flowsheet.AddObject(ut, uid) if hasattr(flowsheet, 'AddObject') else None),
+                ("AddObject(str)", lambda ut=dwsim_type, uid=unit_spec.id: flowsheet.AddObject(ut, uid) if has_api['AddObject'] else None),
                 ("Type-specific method", lambda: self._create_unit_via_method(flowsheet, dwsim_type, unit_spec.id, x, y)),
                 ("Collection-based creation", lambda: self._create_unit_via_collection(flowsheet, dwsim_type, unit_spec.id, x, y)),
             ])
-            
+            preferred = self._CREATE_METHODS.get((flowsheet_type, dwsim_type))
+            if preferred is not None:
+                method_attempts.sort(key=lambda attempt: attempt[0] != preferred)
+
             for desc, method in method_attempts:
                 try:
                     result = method()
                     if result is not None:
                         unit_obj = result
-                        logger.debug("Created unit '%s' (type: %s) via %s", unit_spec.id, dwsim_type, desc)
+                        DWSIMClient._CREATE_METHODS[(flowsheet_type, dwsim_type)] = desc
+                        logger.debug("Created unit '{}' (type: {}) via {}", unit_spec.id, dwsim_type, desc)
                         break
-                    logger.debug("Unit creation method %s returned None for '%s'", desc, unit_spec.id)
+                    logger.debug("Unit creation method {} returned None for '{}'", desc, unit_spec.id)
                 except (TypeError, AttributeError) as e:
-                    logger.debug("Unit creation method %s failed for '%s': %s", desc, unit_spec.id, e)
+                    logger.debug("Unit creation method {} failed for '{}': {}", desc, unit_spec.id, e)
                     continue
                 except Exception as e:
-                    logger.debug("Unit creation %s failed for '%s' with error: %s", desc, unit_spec.id, e)
+                    logger.debug("Unit creation {} failed for '{}' with error: {}", desc, unit_spec.id, e)
                     continue
             
             if unit_obj is None:
-                logger.warning("Failed to create unit '%s' (type: %s) - all methods failed", unit_spec.id, dwsim_type)
+                logger.warning("Failed to create unit '{}' (type: {}) - all methods failed", unit_spec.id, dwsim_type)
                 warnings.append(f"Failed to create unit '{unit_spec.id}' (type: {unit_spec.type}) - DWSIM API method signature issue.")
                 continue
             
@@ -1237,146 +1747,164 @@ class DWSIMClient:
                     elif hasattr(unit_obj, "GraphicObject") and hasattr(unit_obj.GraphicObject, "Tag"):
                         unit_obj.GraphicObject.Tag = unit_spec.id
                 except Exception:
-                    logger.debug("Could not set name/tag for unit %s", unit_spec.id)
+                    logger.debug("Could not set name/tag for unit {}", unit_spec.id)
                 
                 unit_map[unit_spec.id] = unit_obj
-                logger.debug("Created unit: %s (type: %s)", unit_spec.id, dwsim_type)
+                logger.debug("Created unit: {} (type: {})", unit_spec.id, dwsim_type)
             except Exception as exc:
-                logger.warning("Failed to store unit %s: %s", unit_spec.id, exc)
+                logger.warning("Failed to store unit {}: {}", unit_spec.id, exc)
                 warnings.append(f"Failed to store unit '{unit_spec.id}': {str(exc)}")
         
         return unit_map
 
     def _connect_streams(self, flowsheet, streams: List[schemas.StreamSpec], stream_map: dict, unit_map: dict, warnings: List[str]) -> None:
-        """Connect material streams to unit operations."""
+        """Connect material streams to unit operations.
+
+        Streams are grouped per unit in one pass so each unit is resolved
+        once and, where it exposes a bulk ``ConnectInlets``/``ConnectOutlets``
+        API, wired up with a single CLR call.
+        """
+        # unit_id -> [(port, stream_id, stream_obj)]
+        inlets: Dict[str, List[Tuple[int, str, object]]] = {}
+        outlets: Dict[str, List[Tuple[int, str, object]]] = {}
         for stream_spec in streams:
             stream_obj = stream_map.get(stream_spec.id)
             if not stream_obj:
                 warnings.append(f"Stream '{stream_spec.id}' not found for connection")
                 continue
-            
-            # Connect to target unit (inlet) - for feed streams or intermediate streams
+
+            # Handle missing handles gracefully (use default port 0)
             if stream_spec.target:
-                target_unit = unit_map.get(stream_spec.target)
-                if target_unit:
-                    # Resolve the actual unit object (might need to get from collection)
-                    target_unit = self._resolve_unit_object(flowsheet, stream_spec.target, target_unit)
-                    
-                    # Handle missing targetHandle gracefully (use default port 0)
-                    target_handle = getattr(stream_spec, 'targetHandle', None)
-                    port = self._map_port_to_index(target_handle, stream_spec.target)
-                    
-                    # Try multiple connection methods
-                    connected = False
-                    stream_graphic = getattr(stream_obj, "GraphicObject", None)
-                    unit_graphic = getattr(target_unit, "GraphicObject", None)
-                    
-                    connection_methods = [
-                        # Direct unit methods
-                        ("SetInletStream", lambda: target_unit.SetInletStream(port, stream_obj)),
-                        ("SetInletMaterialStream", lambda: target_unit.SetInletMaterialStream(port, stream_obj)),
-                        ("ConnectInlet", lambda: target_unit.ConnectInlet(port, stream_obj)),
-                        ("AddInletStream", lambda: target_unit.AddInletStream(port, stream_obj)),
-                        # Property-based connections
-                        ("InletStreams[index]", lambda: setattr(target_unit, f"InletStreams[{port}]", stream_obj) if hasattr(target_unit, "InletStreams") else None),
-                        ("InletMaterialStreams[index]", lambda: setattr(target_unit, f"InletMaterialStreams[{port}]", stream_obj) if hasattr(target_unit, "InletMaterialStreams") else None),
-                        # Try without port index
-                        ("SetInletStream(no port)", lambda: target_unit.SetInletStream(stream_obj) if hasattr(target_unit, "SetInletStream") else None),
-                        ("SetInletMaterialStream(no port)", lambda: target_unit.SetInletMaterialStream(stream_obj) if hasattr(target_unit, "SetInletMaterialStream") else None),
-                        # GraphicObject-based connections
-                        ("GraphicObject.Connections", lambda: self._connect_via_graphic_object(stream_graphic, unit_graphic, port, True) if stream_graphic and unit_graphic else None),
-                        ("GraphicObject.InputConnections", lambda: self._connect_via_graphic_input(unit_graphic, stream_obj, port) if unit_graphic else None),
-                        # Flowsheet-level connection
-                        ("Flowsheet.ConnectObjects", lambda: flowsheet.ConnectObjects(stream_obj, target_unit) if hasattr(flowsheet, "ConnectObjects") else None),
-                        ("Flowsheet.ConnectObject", lambda: flowsheet.ConnectObject(stream_obj, target_unit) if hasattr(flowsheet, "ConnectObject") else None),
-                        ("Flowsheet.ConnectStreamToUnit", lambda: flowsheet.ConnectStreamToUnit(stream_obj, target_unit, port) if hasattr(flowsheet, "ConnectStreamToUnit") else None),
-                        # Direct attribute-based
-                        ("Unit attribute inlet setters", lambda: self._set_unit_stream_attr(target_unit, ["InletStream", "InletMaterialStream", "FeedStream", "InputStream", "InletObject", "Inlet"], stream_obj, port)),
-                        ("Unit collection inlet setters", lambda: self._set_unit_stream_attr(target_unit, ["InletStreams", "InletMaterialStreams", "InputStreams", "FeedStreams", "InletObjects", "Inlets"], stream_obj, port)),
-                    ]
-                    
-                    for method_name, method in connection_methods:
-                        try:
-                            result = method()
-                            if result is not None or not hasattr(method, '__call__'):
-                                logger.debug("Connected stream %s to unit %s via %s (port %s)", stream_spec.id, stream_spec.target, method_name, port)
-                                connected = True
-                                break
-                        except (AttributeError, TypeError) as e:
-                            logger.debug("Connection method %s failed: %s", method_name, e)
-                            continue
-                        except Exception as e:
-                            logger.debug("Connection method %s error: %s", method_name, e)
-                            continue
-                    
-                    if not connected:
-                        warnings.append(f"Failed to connect stream '{stream_spec.id}' to unit '{stream_spec.target}' - tried all connection methods")
+                if stream_spec.target in unit_map:
+                    port = self._map_port_to_index(getattr(stream_spec, 'targetHandle', None), stream_spec.target)
+                    inlets.setdefault(stream_spec.target, []).append((port, stream_spec.id, stream_obj))
                 else:
                     warnings.append(f"Target unit '{stream_spec.target}' not found for stream '{stream_spec.id}'")
-            
-            # Connect from source unit (outlet) - for product streams or intermediate streams
+
             if stream_spec.source:
-                source_unit = unit_map.get(stream_spec.source)
-                if source_unit:
-                    # Resolve the actual unit object
-                    source_unit = self._resolve_unit_object(flowsheet, stream_spec.source, source_unit)
-                    
-                    # Handle missing sourceHandle gracefully (use default port 0)
-                    source_handle = getattr(stream_spec, 'sourceHandle', None)
-                    port = self._map_port_to_index(source_handle, stream_spec.source)
-                    
-                    # Try multiple connection methods
-                    connected = False
-                    stream_graphic = getattr(stream_obj, "GraphicObject", None)
-                    unit_graphic = getattr(source_unit, "GraphicObject", None)
-                    
-                    connection_methods = [
-                        # Direct unit methods
-                        ("SetOutletStream", lambda: source_unit.SetOutletStream(port, stream_obj)),
-                        ("SetOutletMaterialStream", lambda: source_unit.SetOutletMaterialStream(port, stream_obj)),
-                        ("ConnectOutlet", lambda: source_unit.ConnectOutlet(port, stream_obj)),
-                        ("AddOutletStream", lambda: source_unit.AddOutletStream(port, stream_obj)),
-                        # Property-based connections
-                        ("OutletStreams[index]", lambda: setattr(source_unit, f"OutletStreams[{port}]", stream_obj) if hasattr(source_unit, "OutletStreams") else None),
-                        ("OutletMaterialStreams[index]", lambda: setattr(source_unit, f"OutletMaterialStreams[{port}]", stream_obj) if hasattr(source_unit, "OutletMaterialStreams") else None),
-                        # Try without port index
-                        ("SetOutletStream(no port)", lambda: source_unit.SetOutletStream(stream_obj) if hasattr(source_unit, "SetOutletStream") else None),
-                        ("SetOutletMaterialStream(no port)", lambda: source_unit.SetOutletMaterialStream(stream_obj) if hasattr(source_unit, "SetOutletMaterialStream") else None),
-                        # GraphicObject-based connections
-                        ("GraphicObject.Connections", lambda: self._connect_via_graphic_object(unit_graphic, stream_graphic, port, False) if stream_graphic and unit_graphic else None),
-                        ("GraphicObject.OutputConnections", lambda: self._connect_via_graphic_output(unit_graphic, stream_obj, port) if unit_graphic else None),
-                        # Flowsheet-level connection
-                        ("Flowsheet.ConnectObjects", lambda: flowsheet.ConnectObjects(source_unit, stream_obj) if hasattr(flowsheet, "ConnectObjects") else None),
-                        ("Flowsheet.ConnectObject", lambda: flowsheet.ConnectObject(source_unit, stream_obj) if hasattr(flowsheet, "ConnectObject") else None),
-                        ("Flowsheet.ConnectUnitToStream", lambda: flowsheet.ConnectUnitToStream(source_unit, stream_obj, port) if hasattr(flowsheet, "ConnectUnitToStream") else None),
-                        # Direct attribute-based
-                        ("Unit attribute outlet setters", lambda: self._set_unit_stream_attr(source_unit, ["OutletStream", "OutletMaterialStream", "ProductStream", "OutputStream"], stream_obj, port)),
-                        ("Unit collection outlet setters", lambda: self._set_unit_stream_attr(source_unit, ["OutletStreams", "OutletMaterialStreams", "OutputStreams", "ProductStreams"], stream_obj, port)),
-                    ]
-                    
-                    for method_name, method in connection_methods:
-                        try:
-                            result = method()
-                            if result is not None or not hasattr(method, '__call__'):
-                                logger.debug("Connected stream %s from unit %s via %s (port %s)", stream_spec.id, stream_spec.source, method_name, port)
-                                connected = True
-                                break
-                        except (AttributeError, TypeError) as e:
-                            logger.debug("Connection method %s failed: %s", method_name, e)
-                            continue
-                        except Exception as e:
-                            logger.debug("Connection method %s error: %s", method_name, e)
-                            continue
-                    
-                    if not connected:
-                        warnings.append(f"Failed to connect stream '{stream_spec.id}' from unit '{stream_spec.source}' - tried all connection methods")
+                if stream_spec.source in unit_map:
+                    port = self._map_port_to_index(getattr(stream_spec, 'sourceHandle', None), stream_spec.source)
+                    outlets.setdefault(stream_spec.source, []).append((port, stream_spec.id, stream_obj))
                 else:
                     warnings.append(f"Source unit '{stream_spec.source}' not found for stream '{stream_spec.id}'")
-            
+
             # Warn if stream has no connections at all
             if not stream_spec.source and not stream_spec.target:
                 warnings.append(f"Stream '{stream_spec.id}' has no source or target - it will not be connected")
 
+        resolved_units: Dict[str, object] = {}
+        for is_inlet, grouped in ((True, inlets), (False, outlets)):
+            for unit_id, connections in grouped.items():
+                unit = resolved_units.get(unit_id)
+                if unit is None:
+                    # Resolve the actual unit object (might need to get from collection)
+                    unit = self._resolve_unit_object(flowsheet, unit_id, unit_map[unit_id])
+                    resolved_units[unit_id] = unit
+                if self._connect_bulk(unit, unit_id, connections, is_inlet):
+                    continue
+                for port, stream_id, stream_obj in connections:
+                    self._connect_port(flowsheet, unit, unit_id, stream_id, stream_obj, port, is_inlet, warnings)
+
+    def _connect_bulk(self, unit, unit_id: str, connections: List[Tuple[int, str, object]], is_inlet: bool) -> bool:
+        """Connect all of a unit's ports in one call if its type supports it.
+
+        Whether a unit type has ``ConnectInlets``/``ConnectOutlets`` is
+        remembered in `_BULK_CONNECT` so the lookup happens once per type.
+        """
+        method_name = "ConnectInlets" if is_inlet else "ConnectOutlets"
+        key = (type(unit).__name__, method_name)
+        supported = self._BULK_CONNECT.get(key)
+        if supported is None:
+            supported = hasattr(unit, method_name)
+            DWSIMClient._BULK_CONNECT[key] = supported
+        # A port dictionary would silently drop streams sharing a port.
+        if not supported or len({port for port, _, _ in connections}) != len(connections):
+            return False
+        try:
+            from System import Int32, Object  # type: ignore
+            from System.Collections.Generic import Dictionary  # type: ignore
+
+            ports = Dictionary[Int32, Object]()
+            for port, _, stream_obj in connections:
+                ports[port] = stream_obj
+            getattr(unit, method_name)(ports)
+        except Exception as exc:
+            logger.debug("Bulk {} failed on unit {}: {}", method_name, unit_id, exc)
+            return False
+        logger.debug("Connected {} streams to unit {} via {}", len(connections), unit_id, method_name)
+        return True
+
+    def _connect_port(self, flowsheet, unit, unit_id: str, stream_id: str, stream_obj, port: int, is_inlet: bool, warnings: List[str]) -> None:
+        """Connect one stream to one unit port, trying each known API in turn."""
+        # Try multiple connection methods
+        stream_graphic = getattr(stream_obj, "GraphicObject", None)
+        unit_graphic = getattr(unit, "GraphicObject", None)
+
+        if is_inlet:
+            connection_methods = [
+                # Direct unit methods
+                ("SetInletStream", lambda: unit.SetInletStream(port, stream_obj)),
+                ("SetInletMaterialStream", lambda: unit.SetInletMaterialStream(port, stream_obj)),
+                ("ConnectInlet", lambda: unit.ConnectInlet(port, stream_obj)),
+                ("AddInletStream", lambda: unit.AddInletStream(port, stream_obj)),
+                # Property-based connections
+                ("InletStreams[index]", lambda: setattr(unit, f"InletStreams[{port}]", stream_obj) if hasattr(unit, "InletStreams") else None),
+                ("InletMaterialStreams[index]", lambda: setattr(unit, f"InletMaterialStreams[{port}]", stream_obj) if hasattr(unit, "InletMaterialStreams") else None),
+                # Try without port index
+                ("SetInletStream(no port)", lambda: unit.SetInletStream(stream_obj) if hasattr(unit, "SetInletStream") else None),
+                ("SetInletMaterialStream(no port)", lambda: unit.SetInletMaterialStream(stream_obj) if hasattr(unit, "SetInletMaterialStream") else None),
+                # GraphicObject-based connections
+                ("GraphicObject.Connections", lambda: self._connect_via_graphic_object(stream_graphic, unit_graphic, port, True) if stream_graphic and unit_graphic else None),
+                ("GraphicObject.InputConnections", lambda: self._connect_via_graphic_input(unit_graphic, stream_obj, port) if unit_graphic else None),
+                # Flowsheet-level connection
+                ("Flowsheet.ConnectObjects", lambda: flowsheet.ConnectObjects(stream_obj, unit) if hasattr(flowsheet, "ConnectObjects") else None),
+                ("Flowsheet.ConnectObject", lambda: flowsheet.ConnectObject(stream_obj, unit) if hasattr(flowsheet, "ConnectObject") else None),
+                ("Flowsheet.ConnectStreamToUnit", lambda: flowsheet.ConnectStreamToUnit(stream_obj, unit, port) if hasattr(flowsheet, "ConnectStreamToUnit") else None),
+                # Direct attribute-based
+                ("Unit attribute inlet setters", lambda: self._set_unit_stream_attr(unit, ["InletStream", "InletMaterialStream", "FeedStream", "InputStream", "InletObject", "Inlet"], stream_obj, port)),
+                ("Unit collection inlet setters", lambda: self._set_unit_stream_attr(unit, ["InletStreams", "InletMaterialStreams", "InputStreams", "FeedStreams", "InletObjects", "Inlets"], stream_obj, port)),
+            ]
+        else:
+            connection_methods = [
+                # Direct unit methods
+                ("SetOutletStream", lambda: unit.SetOutletStream(port, stream_obj)),
+                ("SetOutletMaterialStream", lambda: unit.SetOutletMaterialStream(port, stream_obj)),
+                ("ConnectOutlet", lambda: unit.ConnectOutlet(port, stream_obj)),
+                ("AddOutletStream", lambda: unit.AddOutletStream(port, stream_obj)),
+                # Property-based connections
+                ("OutletStreams[index]", lambda: setattr(unit, f"OutletStreams[{port}]", stream_obj) if hasattr(unit, "OutletStreams") else None),
+                ("OutletMaterialStreams[index]", lambda: setattr(unit, f"OutletMaterialStreams[{port}]", stream_obj) if hasattr(unit, "OutletMaterialStreams") else None),
+                # Try without port index
+                ("SetOutletStream(no port)", lambda: unit.SetOutletStream(stream_obj) if hasattr(unit, "SetOutletStream") else None),
+                ("SetOutletMaterialStream(no port)", lambda: unit.SetOutletMaterialStream(stream_obj) if hasattr(unit, "SetOutletMaterialStream") else None),
+                # GraphicObject-based connections
+                ("GraphicObject.Connections", lambda: self._connect_via_graphic_object(unit_graphic, stream_graphic, port, False) if stream_graphic and unit_graphic else None),
+                ("GraphicObject.OutputConnections", lambda: self._connect_via_graphic_output(unit_graphic, stream_obj, port) if unit_graphic else None),
+                # Flowsheet-level connection
+                ("Flowsheet.ConnectObjects", lambda: flowsheet.ConnectObjects(unit, stream_obj) if hasattr(flowsheet, "ConnectObjects") else None),
+                ("Flowsheet.ConnectObject", lambda: flowsheet.ConnectObject(unit, stream_obj) if hasattr(flowsheet, "ConnectObject") else None),
+                ("Flowsheet.ConnectUnitToStream", lambda: flowsheet.ConnectUnitToStream(unit, stream_obj, port) if hasattr(flowsheet, "ConnectUnitToStream") else None),
+                # Direct attribute-based
+                ("Unit attribute outlet setters", lambda: self._set_unit_stream_attr(unit, ["OutletStream", "OutletMaterialStream", "ProductStream", "OutputStream"], stream_obj, port)),
+                ("Unit collection outlet setters", lambda: self._set_unit_stream_attr(unit, ["OutletStreams", "OutletMaterialStreams", "OutputStreams", "ProductStreams"], stream_obj, port)),
+            ]
+
+        direction = "to" if is_inlet else "from"
+        for method_name, method in connection_methods:
+            try:
+                result = method()
+                if result is not None or not hasattr(method, '__call__'):
+                    logger.debug("Connected stream {} {} unit {} via {} (port {})", stream_id, direction, unit_id, method_name, port)
+                    return
+            except (AttributeError, TypeError) as e:
+                logger.debug("Connection method {} failed: {}", method_name, e)
+                continue
+            except Exception as e:
+                logger.debug("Connection method {} error: {}", method_name, e)
+                continue
+
+        warnings.append(f"Failed to connect stream '{stream_id}' {direction} unit '{unit_id}' - tried all connection methods")
+
     def _try_flowsheet_connections(self, flowsheet, streams: List[schemas.StreamSpec], stream_map: dict, unit_map: dict, warnings: List[str]) -> None:
         """Try alternative connection methods through the flowsheet object."""
         for stream_spec in streams:
@@ -1392,30 +1920,30 @@ class DWSIMClient:
                     if target_unit and hasattr(flowsheet, "ConnectObjects"):
                         try:
                             flowsheet.ConnectObjects(stream_obj, target_unit)
-                            logger.debug("Connected stream %s to unit %s via flowsheet.ConnectObjects", stream_spec.id, stream_spec.target)
+                            logger.debug("Connected stream {} to unit {} via flowsheet.ConnectObjects", stream_spec.id, stream_spec.target)
                         except Exception as e:
-                            logger.debug("flowsheet.ConnectObjects failed: %s", e)
+                            logger.debug("flowsheet.ConnectObjects failed: {}", e)
                     elif target_unit and hasattr(flowsheet, "ConnectObject"):
                         try:
                             flowsheet.ConnectObject(stream_obj, target_unit)
-                            logger.debug("Connected stream %s to unit %s via flowsheet.ConnectObject", stream_spec.id, stream_spec.target)
+                            logger.debug("Connected stream {} to unit {} via flowsheet.ConnectObject", stream_spec.id, stream_spec.target)
                         except Exception as e:
-                            logger.debug("flowsheet.ConnectObject failed: %s", e)
+                            logger.debug("flowsheet.ConnectObject failed: {}", e)
                 
                 if stream_spec.source:
                     source_unit = unit_map.get(stream_spec.source)
                     if source_unit and hasattr(flowsheet, "ConnectObjects"):
                         try:
                             flowsheet.ConnectObjects(source_unit, stream_obj)
-                            logger.debug("Connected stream %s from unit %s via flowsheet.ConnectObjects", stream_spec.id, stream_spec.source)
+                            logger.debug("Connected stream {} from unit {} via flowsheet.ConnectObjects", stream_spec.id, stream_spec.source)
                         except Exception as e:
-                            logger.debug("flowsheet.ConnectObjects failed: %s", e)
+                            logger.debug("flowsheet.ConnectObjects failed: {}", e)
                     elif source_unit and hasattr(flowsheet, "ConnectObject"):
                         try:
                             flowsheet.ConnectObject(source_unit, stream_obj)
-                            logger.debug("Connected stream %s from unit %s via flowsheet.ConnectObject", stream_spec.id, stream_spec.source)
+                            logger.debug("Connected stream {} from unit {} via flowsheet.ConnectObject", stream_spec.id, stream_spec.source)
                         except Exception as e:
-                            logger.debug("flowsheet.ConnectObject failed: %s", e)
+                            logger.debug("flowsheet.ConnectObject failed: {}", e)
                 
                 # Method 2: Try setting connections through GraphicObjects after calculation prep
                 # This might work if DWSIM needs objects to be fully initialized first
@@ -1433,25 +1961,21 @@ class DWSIMClient:
                                         stream_graphic.OutputConnections.Add(unit_graphic)
                                         logger.debug("Connected via stream GraphicObject.OutputConnections")
                             except Exception as e:
-                                logger.debug("GraphicObject connection attempt failed: %s", e)
+                                logger.debug("GraphicObject connection attempt failed: {}", e)
                 
             except Exception as e:
-                logger.debug("Alternative connection method failed for stream %s: %s", stream_spec.id, e)
+                logger.debug("Alternative connection method failed for stream {}: {}", stream_spec.id, e)
 
     def _map_port_to_index(self, handle: Optional[str], unit_id: str) -> int:
         """Map port handle name to DWSIM port index."""
         # Simplified mapping - actual implementation depends on DWSIM API
         # Most units use 0 for first inlet/outlet
-        if not handle:
-            return 0
-        
-        # Extract number from handle if present (e.g., "in-1-left" -> 0, "in-2-left" -> 1)
-        import re
-        match = re.search(r'(\d+)', handle)
-        if match:
-            return int(match.group(1)) - 1
+        if handle in _PORT_FASTPATH:
+            return _PORT_FASTPATH[handle]
         
-        return 0  # Default to first port
+        # Extract number from handle if present (e.g., "in-1-left" -> 0, "in-2-left" -> 1);
+        # handles repeat across streams and requests, so results are memoised.
+        return _port_index(handle)
 
     def _connect_via_graphic_object(self, from_graphic, to_graphic, port: int, is_inlet: bool):
         """Connect streams via GraphicObject connections."""
@@ -1579,46 +2103,38 @@ class DWSIMClient:
                 params = unit_spec.parameters or {}
                 
                 # Configure based on unit type
-                if unit_spec.type == "distillationColumn":
-                    if "stages" in params:
-                        try:
-                            unit_obj.SetProp("NumberOfStages", params["stages"])
-                        except Exception:
-                            pass
-                    if "reflux_ratio" in params:
-                        try:
-                            unit_obj.SetProp("RefluxRatio", params["reflux_ratio"])
-                        except Exception:
-                            pass
-                
-                elif unit_spec.type in ["pump", "compressor"]:
-                    if "pressure_rise" in params:
-                        target = self._resolve_unit_object(flowsheet, unit_spec.id, unit_obj)
-                        try:
-                            target.SetProp("PressureIncrease", params["pressure_rise"])
-                        except Exception:
-                            pass
-                    if "efficiency" in params:
-                        target = self._resolve_unit_object(flowsheet, unit_spec.id, unit_obj)
-                        try:
-                            target.SetProp("Efficiency", params["efficiency"])
-                        except Exception:
-                            pass
-                
-                elif unit_spec.type in ["heaterCooler", "shellTubeHX"]:
-                    if "duty" in params:
-                        target = self._resolve_unit_object(flowsheet, unit_spec.id, unit_obj)
+                settings = [(prop, params[key]) for key, prop in _CONFIG_HANDLERS.get(unit_spec.type, ()) if key in params]
+                if settings:
+                    target = self._resolve_unit_object(flowsheet, unit_spec.id, unit_obj)
+                    # Skip properties the unit doesn't have rather than
+                    # letting SetProp throw across the CLR boundary
+                    known = self._unit_props(target)
+                    for prop, value in settings:
+                        if known is not None and prop not in known:
+                            logger.debug("Unit {} has no property {}; skipping", unit_spec.id, prop)
+                            continue
                         try:
-                            target.SetProp("HeatFlow", params["duty"])
+                            target.SetProp(prop, value)
                         except Exception:
                             pass
                 
                 # Add more unit-specific configurations as needed
-                logger.debug("Configured unit: %s", unit_spec.id)
+                logger.debug("Configured unit: {}", unit_spec.id)
             except Exception as exc:
-                logger.warning("Failed to configure unit %s: %s", unit_spec.id, exc)
+                logger.warning("Failed to configure unit {}: {}", unit_spec.id, exc)
                 warnings.append(f"Failed to configure unit '{unit_spec.id}': {str(exc)}")
 
+    def _unit_props(self, unit) -> Optional[frozenset]:
+        """Property names a unit's type exposes, from one GetPropList call per type."""
+        key = type(unit).__name__
+        if key not in self._UNIT_PROPS:
+            try:
+                props = frozenset(str(name) for name in unit.GetPropList())
+            except Exception:
+                props = None
+            DWSIMClient._UNIT_PROPS[key] = props
+        return self._UNIT_PROPS[key]
+
     def _create_stream_via_collection(self, flowsheet, stream_name: str, x: float, y: float):
         """Try to create stream via MaterialStreams collection."""
         try:
@@ -1925,6 +2441,22 @@ class DWSIMClient:
             return None
         return None
 
+    def _set_stream_prop_in_units(self, stream_obj, prop_name, options) -> Optional[str]:
+        """
+        Set an overall stream property, trying `(unit, value)` options in order.
+
+        The unit that worked is remembered in `_SETPROP_UNITS` and tried first
+        for every later stream. Returns the unit used, or None if all failed.
+        """
+        preferred = self._SETPROP_UNITS.get(prop_name)
+        if preferred is not None:
+            options = sorted(options, key=lambda option: option[0] != preferred)
+        for unit, value in options:
+            if self._set_stream_prop(stream_obj, prop_name, "overall", None, "", unit, value):
+                DWSIMClient._SETPROP_UNITS[prop_name] = unit
+                return unit
+        return None
+
     def _set_stream_prop(self, stream_obj, prop_name, phase, comp, basis, unit, value) -> bool:
         """Attempt to set a property on a stream object using multiple APIs."""
         setters = []
@@ -1936,13 +2468,13 @@ class DWSIMClient:
         if hasattr(stream_obj, "SetProp"):
             setprop_method = getattr(stream_obj, "SetProp")
             setters.append(lambda: setprop_method(prop_name, phase, comp, basis, unit, value))
-            logger.debug("Using SetProp method for property '%s' (direct)", prop_name)
+            logger.debug("Using SetProp method for property '{}' (direct)", prop_name)
         else:
             # Try reflection even if pythonnet doesn't expose SetProp
             setprop_method = self._get_dotnet_method(stream_obj, "SetProp")
             if setprop_method:
                 setters.append(lambda: setprop_method.Invoke(stream_obj, [prop_name, phase, comp, basis, unit, value]))
-                logger.debug("Using SetProp via reflection for property '%s'", prop_name)
+                logger.debug("Using SetProp via reflection for property '{}'", prop_name)
 
         # Property-specific strong setters (SI-based)
         pname_lower = prop_name.lower()
@@ -2031,7 +2563,7 @@ class DWSIMClient:
                                 method = getattr(pp, method_name)
                                 setters.append(lambda m=method, pn=prop_name, v=value, so=stream_obj: m(so, pn, v))
                 except Exception as e:
-                    logger.debug("PropertyPackage access failed: %s", e)
+                    logger.debug("PropertyPackage access failed: {}", e)
         for meth in ("SetPropertyValue", "SetPropertyValue2"):
             if hasattr(stream_obj, meth):
                 setter = getattr(stream_obj, meth)
@@ -2051,7 +2583,7 @@ class DWSIMClient:
                 setters.append(lambda a=attr: setattr(stream_obj, a, value))
 
         # Log what we're about to try
-        logger.info("Attempting to set property '%s' = %s on stream %s (type: %s, has_SetProp: %s, has_SetPropertyValue: %s, %d methods to try)", 
+        logger.info("Attempting to set property '{}' = {} on stream {} (type: {}, has_SetProp: {}, has_SetPropertyValue: {}, {} methods to try)", 
                    prop_name, value, getattr(stream_obj, "Name", "unknown"), 
                    type(stream_obj).__name__, 
                    self._has_method(stream_obj, "SetProp"), 
@@ -2062,7 +2594,7 @@ class DWSIMClient:
             try:
                 result = setter()
                 # Some setters might return a value, others return None - both are OK
-                logger.info("✓ Successfully set property '%s' using method %d (value: %s, result: %s, stream: %s)", 
+                logger.info("✓ Successfully set property '{}' using method {} (value: {}, result: {}, stream: {})", 
                           prop_name, idx, value, result, 
                           getattr(stream_obj, "Name", "unknown"))
                 
@@ -2070,12 +2602,12 @@ class DWSIMClient:
                 try:
                     if hasattr(stream_obj, "GetPropertyValue"):
                         read_back = stream_obj.GetPropertyValue(prop_name)
-                        logger.info("  Read-back value: %s", read_back)
+                        logger.info("  Read-back value: {}", read_back)
                     if hasattr(stream_obj, "GetProp"):
                         read_back = stream_obj.GetProp(prop_name, phase, comp, basis, unit)
-                        logger.info("  Read-back via GetProp: %s", read_back)
+                        logger.info("  Read-back via GetProp: {}", read_back)
                 except Exception as e:
-                    logger.debug("  Read-back verification failed: %s", e)
+                    logger.debug("  Read-back verification failed: {}", e)
                 
                 return True
             except Exception as e:
@@ -2083,12 +2615,12 @@ class DWSIMClient:
                 # Log all errors for debugging - we need to see what's failing
                 # Only log first few attempts to avoid spam, but log all for critical properties
                 if idx < 5 or prop_name.lower() in ["temperature", "pressure"]:
-                    logger.warning("✗ Property setter %d failed for '%s' (value: %s): %s", 
+                    logger.warning("✗ Property setter {} failed for '{}' (value: {}): {}", 
                                  idx, prop_name, value, error_msg[:300])
                 continue
         
         # If all setters failed, try one more thing: check if we can access the actual MaterialStream type
-        logger.error("All %d property setters failed for '%s' (value: %s, stream type: %s, has_SetProp: %s, has_SetPropertyValue: %s)", 
+        logger.error("All {} property setters failed for '{}' (value: {}, stream type: {}, has_SetProp: {}, has_SetPropertyValue: {})", 
                      len(setters), prop_name, value, type(stream_obj).__name__, 
                      hasattr(stream_obj, "SetProp"), 
                      hasattr(stream_obj, "SetPropertyValue"))
@@ -2097,7 +2629,7 @@ class DWSIMClient:
         try:
             all_methods = [m for m in dir(stream_obj) if not m.startswith('_') and callable(getattr(stream_obj, m, None))]
             prop_methods = [m for m in all_methods if 'prop' in m.lower() or 'set' in m.lower() or 'temp' in m.lower() or 'press' in m.lower()]
-            logger.warning("Available property-related methods on stream object: %s", prop_methods[:10])
+            logger.warning("Available property-related methods on stream object: {}", prop_methods[:10])
             
             # Try .NET casting to MaterialStream if pythonnet supports it
             try:
@@ -2132,11 +2664,11 @@ class DWSIMClient:
                             logger.info("✓ SetProp on cast MaterialStream succeeded!")
                             return True
                     except Exception as e:
-                        logger.debug("Casting to MaterialStream failed: %s", e)
+                        logger.debug("Casting to MaterialStream failed: {}", e)
             except Exception as e:
-                logger.debug("NET casting attempt failed: %s", e)
+                logger.debug("NET casting attempt failed: {}", e)
         except Exception as e:
-            logger.debug("Method discovery failed: %s", e)
+            logger.debug("Method discovery failed: {}", e)
         
         return False
 
@@ -2145,7 +2677,7 @@ class DWSIMClient:
         # If the current object already exposes SetProp (or can be cast), use it
         ms_candidate = self._as_material_stream(stream_obj)
         if ms_candidate:
-            logger.debug("Stream '%s' already exposes SetProp (or was cast) during resolution", stream_name)
+            logger.debug("Stream '{}' already exposes SetProp (or was cast) during resolution", stream_name)
             return ms_candidate
 
         # Keep a fallback to the incoming object if nothing better is found
@@ -2161,10 +2693,10 @@ class DWSIMClient:
             candidate = self._get_collection_item(coll, stream_name)
             ms_candidate = self._as_material_stream(candidate)
             if ms_candidate:
-                logger.debug("Resolved stream '%s' via %s collection to MaterialStream", stream_name, attr)
+                logger.debug("Resolved stream '{}' via {} collection to MaterialStream", stream_name, attr)
                 return ms_candidate
             if candidate and (hasattr(candidate, "SetProp") or hasattr(candidate, "SetPropertyValue")):
-                logger.debug("Resolved stream '%s' via %s collection to object with property setters", stream_name, attr)
+                logger.debug("Resolved stream '{}' via {} collection to object with property setters", stream_name, attr)
                 return candidate
             
             # Try name/tag matching over all items
@@ -2175,38 +2707,38 @@ class DWSIMClient:
                 ms_candidate = self._as_material_stream(item)
                 if name == stream_name or tag == stream_name:
                     if ms_candidate:
-                        logger.debug("Resolved stream '%s' via %s collection (name/tag match to MaterialStream)", stream_name, attr)
+                        logger.debug("Resolved stream '{}' via {} collection (name/tag match to MaterialStream)", stream_name, attr)
                         return ms_candidate
                     if hasattr(item, "SetProp") or hasattr(item, "SetPropertyValue"):
-                        logger.debug("Resolved stream '%s' via %s collection (name/tag match)", stream_name, attr)
+                        logger.debug("Resolved stream '{}' via {} collection (name/tag match)", stream_name, attr)
                         return item
             
             # Fallback: first MaterialStream with SetProp
             for item in self._iterate_collection(coll):
                 ms_candidate = self._as_material_stream(item)
                 if ms_candidate:
-                    logger.debug("Resolved stream '%s' via %s collection (first MaterialStream with SetProp)", stream_name, attr)
+                    logger.debug("Resolved stream '{}' via {} collection (first MaterialStream with SetProp)", stream_name, attr)
                     return ms_candidate
             
             # Fallback: first item with SetProp
             for item in self._iterate_collection(coll):
                 if hasattr(item, "SetProp"):
-                    logger.debug("Resolved stream '%s' via %s collection (first SetProp)", stream_name, attr)
+                    logger.debug("Resolved stream '{}' via {} collection (first SetProp)", stream_name, attr)
                     return item
             
             # Fallback: first item whose type looks like a stream
             for item in self._iterate_collection(coll):
                 item_type = str(type(item)).lower()
                 if "materialstream" in item_type or "stream" in item_type:
-                    logger.debug("Resolved stream '%s' via %s collection (type contains 'stream')", stream_name, attr)
+                    logger.debug("Resolved stream '{}' via {} collection (type contains 'stream')", stream_name, attr)
                     return item
         
         # If we reach here, we could not find a MaterialStream with SetProp
         if hasattr(fallback_obj, "SetPropertyValue"):
-            logger.debug("Stream '%s' lacks SetProp but has SetPropertyValue; keeping fallback object", stream_name)
+            logger.debug("Stream '{}' lacks SetProp but has SetPropertyValue; keeping fallback object", stream_name)
             return fallback_obj
 
-        logger.debug("Stream '%s' could not be resolved to MaterialStream, using original object", stream_name)
+        logger.debug("Stream '{}' could not be resolved to MaterialStream, using original object", stream_name)
         return stream_obj
 
     def _resolve_unit_object(self, flowsheet, unit_name: str, unit_obj):
@@ -2219,7 +2751,7 @@ class DWSIMClient:
                 continue
             candidate = self._get_collection_item(coll, unit_name)
             if candidate and (hasattr(candidate, "SetProp") or hasattr(candidate, "SetPropertyValue") or hasattr(candidate, "SetPropertyValue2")):
-                logger.debug("Resolved unit '%s' via %s collection to object with SetProp", unit_name, attr)
+                logger.debug("Resolved unit '{}' via {} collection to object with SetProp", unit_name, attr)
                 return candidate
             for item in self._iterate_collection(coll):
                 if not (hasattr(item, "SetProp") or hasattr(item, "SetPropertyValue") or hasattr(item, "SetPropertyValue2")):
@@ -2227,18 +2759,18 @@ class DWSIMClient:
                 name = getattr(item, "Name", None)
                 tag = getattr(getattr(item, "GraphicObject", None), "Tag", None)
                 if name == unit_name or tag == unit_name:
-                    logger.debug("Resolved unit '%s' via %s collection (name/tag match)", unit_name, attr)
+                    logger.debug("Resolved unit '{}' via {} collection (name/tag match)", unit_name, attr)
                     return item
             for item in self._iterate_collection(coll):
                 if hasattr(item, "SetProp") or hasattr(item, "SetPropertyValue") or hasattr(item, "SetPropertyValue2"):
-                    logger.debug("Resolved unit '%s' via %s collection (first SetProp)", unit_name, attr)
+                    logger.debug("Resolved unit '{}' via {} collection (first SetProp)", unit_name, attr)
                     return item
             # Fallback: first item whose type name contains the requested type
             for item in self._iterate_collection(coll):
                 if unit_name.lower() in str(type(item)).lower():
-                    logger.debug("Resolved unit '%s' via %s collection (type match)", unit_name, attr)
+                    logger.debug("Resolved unit '{}' via {} collection (type match)", unit_name, attr)
                     return item
-        logger.debug("Unit '%s' has no SetProp and no resolvable collection target", unit_name)
+        logger.debug("Unit '{}' has no SetProp and no resolvable collection target", unit_name)
         return unit_obj
 
     def _create_unit_via_method(self, flowsheet, dwsim_type: str, unit_id: str, x: float, y: float):
@@ -2296,7 +2828,7 @@ class DWSIMClient:
                     sim_objects = flowsheet.MaterialStreams
                     logger.debug("Retrieved streams via MaterialStreams property")
             except Exception as e:
-                logger.debug("MaterialStreams property access failed: %s", e)
+                logger.debug("MaterialStreams property access failed: {}", e)
         
         # Fallback: use SimulationObjects collection
         if sim_objects is None:
@@ -2305,7 +2837,7 @@ class DWSIMClient:
                     sim_objects = flowsheet.SimulationObjects
                     logger.debug("Retrieved streams via SimulationObjects fallback")
             except Exception as e:
-                logger.debug("SimulationObjects access failed: %s", e)
+                logger.debug("SimulationObjects access failed: {}", e)
         
         if sim_objects is None:
             logger.warning("Could not retrieve streams from flowsheet")
@@ -2313,67 +2845,48 @@ class DWSIMClient:
         
         # Diagnostic: Log all streams found in flowsheet for debugging
         logger.info("=== Stream Extraction Diagnostics ===")
-        logger.info("Payload streams: %s", [s.id for s in payload.streams])
+        logger.info("Payload streams: {}", [s.id for s in payload.streams])
+
+        # Walk the CLR collection and read each Name/Tag once; both the
+        # diagnostics and the matching below reuse them.
+        stream_list = []
         try:
-            all_streams = []
             if hasattr(sim_objects, '__iter__') and not isinstance(sim_objects, str):
                 for item in self._iterate_collection(sim_objects):
-                    all_streams.append(item)
+                    stream_list.append(item)
             else:
-                all_streams = [sim_objects] if sim_objects else []
-            
-            logger.info("Found %d streams in flowsheet", len(all_streams))
-            for idx, stream in enumerate(all_streams):
+                stream_list = [sim_objects] if sim_objects else []
+        except Exception:
+            stream_list = [sim_objects]
+        stream_names = [self._name_or_tag(stream, "") for stream in stream_list]
+
+        try:
+            logger.info("Found {} streams in flowsheet", len(stream_list))
+            for idx, stream in enumerate(stream_list):
                 try:
-                    stream_name = self._name_or_tag(stream, f"stream_{idx}")
-                    logger.info("  Stream %d: name='%s', type=%s", idx, stream_name, type(stream).__name__)
+                    stream_name = stream_names[idx] or f"stream_{idx}"
+                    logger.info("  Stream {}: name='{}', type={}", idx, stream_name, type(stream).__name__)
                     # Try to read a property to see if it has values
                     try:
-                        if hasattr(stream, "GetProp"):
-                            temp = stream.GetProp('temperature', 'overall', None, '', 'K')
+                        get_prop = getattr(stream, "GetProp", None)
+                        if get_prop is not None:
+                            temp = get_prop('temperature', 'overall', None, '', 'K')
                             if temp and len(temp) > 0 and temp[0]:
-                                logger.info("    Temperature: %f K", temp[0])
+                                logger.info("    Temperature: {:f} K", temp[0])
                     except Exception:
                         pass
                 except Exception as e:
-                    logger.debug("Error inspecting stream %d: %s", idx, e)
+                    logger.debug("Error inspecting stream {}: {}", idx, e)
         except Exception as e:
-            logger.debug("Error in stream diagnostics: %s", e)
+            logger.debug("Error in stream diagnostics: {}", e)
         
         try:
-            # Handle both iterable collections and single objects
-            stream_list = []
-            try:
-                if hasattr(sim_objects, '__iter__') and not isinstance(sim_objects, str):
-                    for item in self._iterate_collection(sim_objects):
-                        stream_list.append(item)
-                else:
-                    stream_list = [sim_objects] if sim_objects else []
-            except Exception:
-                stream_list = [sim_objects]
-
-            def _as_number(val):
-                """Return a float if val looks numeric; otherwise None."""
-                if val is None:
-                    return None
-                if isinstance(val, (int, float)):
-                    return float(val)
-                if isinstance(val, str):
-                    stripped = val.strip()
-                    if stripped == "":
-                        return None
-                    try:
-                        return float(stripped)
-                    except ValueError:
-                        return None
-                return None
-
             # Map DWSIM streams to payload stream IDs
             stream_id_map = {}  # Maps DWSIM stream object -> payload stream ID
             
-            for stream in stream_list:
+            for stream, stream_name in zip(stream_list, stream_names):
                 try:
-                    stream_name = self._name_or_tag(stream, "stream")
+                    stream_name = stream_name or "stream"
                     type_str = str(type(stream)).lower()
                     
                     # Check if this stream matches any payload stream by ID or name
@@ -2403,292 +2916,310 @@ class DWSIMClient:
                             # This might be a stream we created but with a different name
                             # Try to match by position or connection
                             # For now, we'll skip unmatched streams to avoid confusion
-                            logger.debug("Skipping unmatched stream: %s", stream_name)
+                            logger.debug("Skipping unmatched stream: {}", stream_name)
                             continue
                 except Exception:
                     logger.debug("Error checking stream name, skipping")
                     continue
 
             # Log matching results
-            logger.info("Matched %d streams: %s", len(stream_id_map), list(stream_id_map.values()))
+            logger.info("Matched {} streams: {}", len(stream_id_map), list(stream_id_map.values()))
             if len(stream_id_map) == 0:
-                logger.warning("No streams matched! Available stream names: %s", 
-                             [self._name_or_tag(s, "unknown") for s in stream_list[:10]])
+                logger.warning("No streams matched! Available stream names: {}", 
+                             [name or "unknown" for name in stream_names[:10]])
             
             # Extract properties only for matched streams
-            for stream, payload_stream_id in stream_id_map.items():
+            matched = [(stream, payload_stream_ids[stream_id]) for stream, stream_id in stream_id_map.items()]
+            if self._parallel_extract and len(matched) > 1:
+                # CLR property reads release the GIL, so they overlap well
+                with ThreadPoolExecutor(max_workers=min(8, len(matched)), thread_name_prefix="dwsim-extract") as pool:
+                    fetched = list(pool.map(lambda item: self._fetch_stream(item[0], item[1], payload), matched))
+            else:
+                fetched = [self._fetch_stream(stream, payload_stream, payload) for stream, payload_stream in matched]
+            results.extend(result for result in fetched if result is not None)
+        except Exception as exc:
+            logger.warning("Failed to extract DWSIM streams: {}", exc)
+        return results
+
+    def _fetch_stream(self, stream, payload_stream: schemas.StreamSpec, payload: schemas.FlowsheetPayload) -> Optional[schemas.StreamResult]:  # pragma: no cover - pythonnet objects
+        """Read one matched DWSIM stream into a StreamResult (None on failure)."""
+        payload_stream_id = payload_stream.id
+        try:
+            # Bind the CLR getters once; each attribute lookup on a
+            # pythonnet object is an interop round-trip.
+            get_prop = getattr(stream, "GetProp", None)
+            get_value = getattr(stream, "GetPropertyValue", None)
+            t = p = flow = None
+            vapor_frac = None
+            composition = {}
+            
+            # Try GetPropertyValue first
+            if get_value is not None:
                 try:
-                    payload_stream = payload_stream_ids[payload_stream_id]
-                    t = p = flow = None
-                    vapor_frac = None
-                    composition = {}
-                    
-                    # Try GetPropertyValue first
-                    if hasattr(stream, "GetPropertyValue"):
-                        try:
-                            t_raw = stream.GetPropertyValue("temperature")
-                            t = t_raw - 273.15 if t_raw is not None else None
-                        except Exception:
-                            pass
-                        try:
-                            p = stream.GetPropertyValue("pressure")
-                        except Exception:
-                            pass
-                        try:
-                            flow_raw = stream.GetPropertyValue("totalflow")
-                            flow = flow_raw * 3600 if flow_raw is not None else None
-                        except Exception:
-                            pass
+                    t_raw = get_value("temperature")
+                    t = t_raw - 273.15 if t_raw is not None else None
+                except Exception:
+                    pass
+                try:
+                    p = get_value("pressure")
+                except Exception:
+                    pass
+                try:
+                    flow_raw = get_value("totalflow")
+                    flow = flow_raw * 3600 if flow_raw is not None else None
+                except Exception:
+                    pass
+                try:
+                    vapor_frac = get_value("vaporfraction")
+                except Exception:
+                    pass
+            
+            # Try GetProp as fallback
+            if t is None and get_prop is not None:
+                try:
+                    t_raw = get_prop('temperature', 'overall', None, '', 'K')[0]
+                    t = t_raw - 273.15 if t_raw is not None else None
+                except Exception:
+                    pass
+                try:
+                    p = get_prop('pressure', 'overall', None, '', 'kPa')[0]
+                except Exception:
+                    pass
+                try:
+                    flow_raw = get_prop('totalflow', 'overall', None, '', 'kg/s')[0]
+                    flow = flow_raw * 3600 if flow_raw is not None else None
+                except Exception:
+                    pass
+                try:
+                    vapor_frac = get_prop('vaporfraction', 'overall', None, '', '')[0]
+                except Exception:
+                    pass
+                # Each getter is looked up once: hasattr() followed by a call
+                # would cross the interop boundary twice.
+                try:
+                    get_mass_flow = getattr(stream, "GetMassFlow", None) if flow is None else None
+                    if get_mass_flow is not None:
+                        mf = get_mass_flow()
+                        flow = mf * 3600 if mf is not None else None
+                except Exception:
+                    pass
+                try:
+                    get_pressure = getattr(stream, "GetPressure", None) if p is None else None
+                    if get_pressure is not None:
+                        p_val = get_pressure()
+                        p = _as_number(p_val)
+                except Exception:
+                    pass
+                try:
+                    get_overall = getattr(stream, "GetOverallProp", None)
+                    if get_overall is not None:
+                        if t is None:
+                            t_overall = get_overall("temperature")
+                            if t_overall is not None:
+                                t_overall = _as_number(t_overall)
+                                if t_overall is not None:
+                                    t = t_overall - 273.15 if t_overall > 100 else t_overall
+                        if p is None:
+                            p_overall = get_overall("pressure")
+                            p = _as_number(p_overall)
+                        if flow is None:
+                            mf_overall = get_overall("massflow")
+                            if mf_overall is not None:
+                                mf_overall = _as_number(mf_overall)
+                                if mf_overall is not None:
+                                    flow = mf_overall * 3600 if mf_overall < 1e3 else mf_overall
+                except Exception:
+                    pass
+            
+            # Direct attributes fallback
+            if t is None:
+                t_attr = getattr(stream, 'Temperature', None)
+                if t_attr is not None:
+                    t = t_attr - 273.15 if t_attr > 100 else t_attr
+                elif hasattr(self, "_read_phase_property"):
+                    try:
+                        t_phase = self._read_phase_property(stream, "temperature")
+                        if t_phase is not None:
+                            t_phase = float(t_phase)
+                            t = t_phase - 273.15 if t_phase > 100 else t_phase
+                    except Exception:
+                        pass
+            if p is None:
+                p = getattr(stream, 'Pressure', None)
+                if p is None and hasattr(self, "_read_phase_property"):
+                    try:
+                        p_phase = self._read_phase_property(stream, "pressure")
+                        if p_phase is not None:
+                            p = float(p_phase) / 1000.0 if p_phase > 1000 else float(p_phase)
+                    except Exception:
+                        pass
+            if flow is None:
+                flow_attr = getattr(stream, 'MassFlow', None) or getattr(stream, 'TotalFlow', None)
+                if flow_attr is not None:
+                    flow = flow_attr * 3600 if flow_attr < 1e3 else flow_attr
+                elif hasattr(self, "_read_phase_property"):
+                    try:
+                        mf_phase = self._read_phase_property(stream, "massflow")
+                        if mf_phase is not None:
+                            mf_phase = float(mf_phase)
+                            flow = mf_phase * 3600 if mf_phase < 1e3 else mf_phase
+                    except Exception:
+                        pass
+            if vapor_frac is None:
+                vapor_frac = getattr(stream, 'VaporFraction', None)
+            
+            # Fallback to payload-specified values if still missing
+            try:
+                props_payload = getattr(payload_stream, "properties", {}) or {}
+                if t is None and props_payload.get("temperature") is not None:
+                    t = _as_number(props_payload.get("temperature"))
+                if p is None and props_payload.get("pressure") is not None:
+                    p = _as_number(props_payload.get("pressure"))
+                if flow is None:
+                    flow_val = props_payload.get("flow_rate") if props_payload else None
+                    if flow_val is None:
+                        flow_val = props_payload.get("mass_flow") if props_payload else None
+                    if flow_val is not None:
+                        flow = _as_number(flow_val)
+            except Exception:
+                pass
+
+            # Final sanity defaults: convert None to 0.0 if nothing could be read
+            if t is None and props_payload.get("temperature") is not None:
+                t = _as_number(props_payload.get("temperature"))
+            if p is None and props_payload.get("pressure") is not None:
+                p = _as_number(props_payload.get("pressure"))
+            if flow is None and props_payload.get("flow_rate") is not None:
+                flow = _as_number(props_payload.get("flow_rate"))
+            
+            # Extract composition - try multiple methods
+            for comp in payload.thermo.components:
+                comp_frac = None
+                try:
+                    # Method 1: GetProp with component name
+                    if get_prop is not None:
                         try:
-                            vapor_frac = stream.GetPropertyValue("vaporfraction")
+                            comp_frac = get_prop('molefraction', 'overall', comp, '', '')[0]
                         except Exception:
                             pass
                     
-                    # Try GetProp as fallback
-                    if t is None and hasattr(stream, "GetProp"):
-                        try:
-                            t_raw = stream.GetProp('temperature', 'overall', None, '', 'K')[0]
-                            t = t_raw - 273.15 if t_raw is not None else None
-                        except Exception:
-                            pass
-                        try:
-                            p = stream.GetProp('pressure', 'overall', None, '', 'kPa')[0]
-                        except Exception:
-                            pass
+                    # Method 2: GetPropertyValue with component name
+                    if comp_frac is None and get_value is not None:
                         try:
-                            flow_raw = stream.GetProp('totalflow', 'overall', None, '', 'kg/s')[0]
-                            flow = flow_raw * 3600 if flow_raw is not None else None
+                            comp_frac = get_value(f"molefraction_{comp}")
                         except Exception:
-                            pass
+                            try:
+                                comp_frac = get_value(f"MoleFraction_{comp}")
+                            except Exception:
+                                try:
+                                    comp_frac = get_value(comp)
+                                except Exception:
+                                    pass
+                    
+                    # Method 3: GetOverallComposition if available
+                    if comp_frac is None and hasattr(stream, "GetOverallComposition"):
                         try:
-                            vapor_frac = stream.GetProp('vaporfraction', 'overall', None, '', '')[0]
+                            comp_dict = stream.GetOverallComposition()
+                            if comp_dict and comp in comp_dict:
+                                comp_frac = comp_dict[comp]
                         except Exception:
                             pass
+                    
+                    # Method 4: Direct attribute access
+                    if comp_frac is None:
                         try:
-                            if flow is None and hasattr(stream, "GetMassFlow"):
-                                mf = stream.GetMassFlow()
-                                flow = mf * 3600 if mf is not None else None
+                            attr_name = f"MoleFraction_{comp}" if hasattr(stream, f"MoleFraction_{comp}") else None
+                            if attr_name:
+                                comp_frac = getattr(stream, attr_name)
                         except Exception:
                             pass
+                    
+                    if comp_frac is not None:
+                        composition[comp] = float(comp_frac)
+                    else:
+                        composition[comp] = 0.0
+                        logger.debug("Could not read composition for component {} in stream {}", comp, payload_stream_id)
+                except Exception as e:
+                    composition[comp] = 0.0
+                    logger.debug("Error reading composition for {}: {}", comp, e)
+            
+            # If no composition found, initialize with zeros
+            if not composition:
+                composition = dict.fromkeys(payload.thermo.components, 0.0)
+                logger.debug("No composition data found for stream {}, using zeros", payload_stream_id)
+
+            # Normalize to numbers or None
+            t = _as_number(t)
+            p = _as_number(p)
+            flow = _as_number(flow)
+            vapor_frac = _as_number(vapor_frac)
+            liquid_frac = _as_number(1.0 - vapor_frac) if vapor_frac is not None else None
+
+            # Last-chance readbacks if still missing
+            try:
+                if p is None and get_prop is not None:
+                    for unit_name in ["kPa", "Pa", "bar"]:
                         try:
-                            if p is None and hasattr(stream, "GetPressure"):
-                                p_val = stream.GetPressure()
-                                p = _as_number(p_val)
+                            p_val = get_prop('pressure', 'overall', None, '', unit_name)[0]
+                            p_val = _as_number(p_val)
+                            if p_val is not None:
+                                p = p_val
+                                break
                         except Exception:
-                            pass
+                            continue
+                if flow is None and get_prop is not None:
+                    for unit_name in ["kg/s", "kg/h"]:
                         try:
-                            if hasattr(stream, "GetOverallProp"):
-                                if t is None:
-                                    t_overall = stream.GetOverallProp("temperature")
-                                    if t_overall is not None:
-                                        t_overall = _as_number(t_overall)
-                                        if t_overall is not None:
-                                            t = t_overall - 273.15 if t_overall > 100 else t_overall
-                                if p is None:
-                                    p_overall = stream.GetOverallProp("pressure")
-                                    p = _as_number(p_overall)
-                                if flow is None:
-                                    mf_overall = stream.GetOverallProp("massflow")
-                                    if mf_overall is not None:
-                                        mf_overall = _as_number(mf_overall)
-                                        if mf_overall is not None:
-                                            flow = mf_overall * 3600 if mf_overall < 1e3 else mf_overall
+                            f_val = get_prop('totalflow', 'overall', None, '', unit_name)[0]
+                            f_val = _as_number(f_val)
+                            if f_val is not None:
+                                flow = f_val * 3600 if unit_name == "kg/s" else f_val
+                                break
                         except Exception:
-                            pass
-                    
-                    # Direct attributes fallback
-                    if t is None:
-                        t_attr = getattr(stream, 'Temperature', None)
-                        if t_attr is not None:
-                            t = t_attr - 273.15 if t_attr > 100 else t_attr
-                        elif hasattr(self, "_read_phase_property"):
-                            try:
-                                t_phase = self._read_phase_property(stream, "temperature")
-                                if t_phase is not None:
-                                    t_phase = float(t_phase)
-                                    t = t_phase - 273.15 if t_phase > 100 else t_phase
-                            except Exception:
-                                pass
-                    if p is None:
-                        p = getattr(stream, 'Pressure', None)
-                        if p is None and hasattr(self, "_read_phase_property"):
-                            try:
-                                p_phase = self._read_phase_property(stream, "pressure")
-                                if p_phase is not None:
-                                    p = float(p_phase) / 1000.0 if p_phase > 1000 else float(p_phase)
-                            except Exception:
-                                pass
-                    if flow is None:
-                        flow_attr = getattr(stream, 'MassFlow', None) or getattr(stream, 'TotalFlow', None)
-                        if flow_attr is not None:
-                            flow = flow_attr * 3600 if flow_attr < 1e3 else flow_attr
-                        elif hasattr(self, "_read_phase_property"):
-                            try:
-                                mf_phase = self._read_phase_property(stream, "massflow")
-                                if mf_phase is not None:
-                                    mf_phase = float(mf_phase)
-                                    flow = mf_phase * 3600 if mf_phase < 1e3 else mf_phase
-                            except Exception:
-                                pass
-                    if vapor_frac is None:
-                        vapor_frac = getattr(stream, 'VaporFraction', None)
-                    
-                    # Fallback to payload-specified values if still missing
-                    try:
-                        props_payload = getattr(payload_stream, "properties", {}) or {}
-                        if t is None and props_payload.get("temperature") is not None:
-                            t = _as_number(props_payload.get("temperature"))
-                        if p is None and props_payload.get("pressure") is not None:
-                            p = _as_number(props_payload.get("pressure"))
-                        if flow is None:
-                            flow_val = props_payload.get("flow_rate") if props_payload else None
-                            if flow_val is None:
-                                flow_val = props_payload.get("mass_flow") if props_payload else None
-                            if flow_val is not None:
-                                flow = _as_number(flow_val)
-                    except Exception:
-                        pass
-
-                    # Final sanity defaults: convert None to 0.0 if nothing could be read
-                    if t is None and props_payload.get("temperature") is not None:
-                        t = _as_number(props_payload.get("temperature"))
-                    if p is None and props_payload.get("pressure") is not None:
-                        p = _as_number(props_payload.get("pressure"))
-                    if flow is None and props_payload.get("flow_rate") is not None:
-                        flow = _as_number(props_payload.get("flow_rate"))
-                    
-                    # Extract composition - try multiple methods
-                    for comp in payload.thermo.components:
-                        comp_frac = None
-                        try:
-                            # Method 1: GetProp with component name
-                            if hasattr(stream, "GetProp"):
-                                try:
-                                    comp_frac = stream.GetProp('molefraction', 'overall', comp, '', '')[0]
-                                except Exception:
-                                    pass
-                            
-                            # Method 2: GetPropertyValue with component name
-                            if comp_frac is None and hasattr(stream, "GetPropertyValue"):
-                                try:
-                                    comp_frac = stream.GetPropertyValue(f"molefraction_{comp}")
-                                except Exception:
-                                    try:
-                                        comp_frac = stream.GetPropertyValue(f"MoleFraction_{comp}")
-                                    except Exception:
-                                        try:
-                                            comp_frac = stream.GetPropertyValue(comp)
-                                        except Exception:
-                                            pass
-                            
-                            # Method 3: GetOverallComposition if available
-                            if comp_frac is None and hasattr(stream, "GetOverallComposition"):
-                                try:
-                                    comp_dict = stream.GetOverallComposition()
-                                    if comp_dict and comp in comp_dict:
-                                        comp_frac = comp_dict[comp]
-                                except Exception:
-                                    pass
-                            
-                            # Method 4: Direct attribute access
-                            if comp_frac is None:
-                                try:
-                                    attr_name = f"MoleFraction_{comp}" if hasattr(stream, f"MoleFraction_{comp}") else None
-                                    if attr_name:
-                                        comp_frac = getattr(stream, attr_name)
-                                except Exception:
-                                    pass
-                            
-                            if comp_frac is not None:
-                                composition[comp] = float(comp_frac)
-                            else:
-                                composition[comp] = 0.0
-                                logger.debug("Could not read composition for component %s in stream %s", comp, payload_stream_id)
-                        except Exception as e:
-                            composition[comp] = 0.0
-                            logger.debug("Error reading composition for %s: %s", comp, e)
-                    
-                    # If no composition found, initialize with zeros
-                    if not composition:
-                        composition = {comp: 0.0 for comp in payload.thermo.components}
-                        logger.debug("No composition data found for stream %s, using zeros", payload_stream_id)
-
-                    # Normalize to numbers or None
-                    t = _as_number(t)
-                    p = _as_number(p)
-                    flow = _as_number(flow)
-                    vapor_frac = _as_number(vapor_frac)
-                    liquid_frac = _as_number(1.0 - vapor_frac) if vapor_frac is not None else None
-
-                    # Last-chance readbacks if still missing
-                    try:
-                        if p is None and hasattr(stream, "GetProp"):
-                            for unit_name in ["kPa", "Pa", "bar"]:
-                                try:
-                                    p_val = stream.GetProp('pressure', 'overall', None, '', unit_name)[0]
-                                    p_val = _as_number(p_val)
-                                    if p_val is not None:
-                                        p = p_val
-                                        break
-                                except Exception:
-                                    continue
-                        if flow is None and hasattr(stream, "GetProp"):
-                            for unit_name in ["kg/s", "kg/h"]:
-                                try:
-                                    f_val = stream.GetProp('totalflow', 'overall', None, '', unit_name)[0]
-                                    f_val = _as_number(f_val)
-                                    if f_val is not None:
-                                        flow = f_val * 3600 if unit_name == "kg/s" else f_val
-                                        break
-                                except Exception:
-                                    continue
-                    except Exception:
-                        pass
+                            continue
+            except Exception:
+                pass
 
-                    # Final fallback to payload values to avoid nulls in results
-                    try:
-                        props_payload = getattr(payload_stream, "properties", {}) or {}
-                        if t is None and props_payload.get("temperature") is not None:
-                            t = _as_number(props_payload.get("temperature"))
-                        if p is None and props_payload.get("pressure") is not None:
-                            p = _as_number(props_payload.get("pressure"))
-                        if flow is None:
-                            flow_val = props_payload.get("flow_rate") or props_payload.get("mass_flow")
-                            if flow_val is not None:
-                                flow = _as_number(flow_val)
-                    except Exception:
-                        pass
+            # Final fallback to payload values to avoid nulls in results
+            try:
+                props_payload = getattr(payload_stream, "properties", {}) or {}
+                if t is None and props_payload.get("temperature") is not None:
+                    t = _as_number(props_payload.get("temperature"))
+                if p is None and props_payload.get("pressure") is not None:
+                    p = _as_number(props_payload.get("pressure"))
+                if flow is None:
+                    flow_val = props_payload.get("flow_rate") or props_payload.get("mass_flow")
+                    if flow_val is not None:
+                        flow = _as_number(flow_val)
+            except Exception:
+                pass
 
-                    # Ensure composition defaults to payload composition if unreadable or all zeros
-                    if getattr(payload, "thermo", None):
-                        try:
-                            payload_comp = getattr(payload_stream, "properties", {}) or {}
-                            payload_comp = payload_comp.get("composition", {}) or {}
-                            if payload_comp:
-                                if not composition or sum(composition.values()) == 0.0:
-                                    composition = {comp: float(payload_comp.get(comp, 0.0)) for comp in payload.thermo.components}
-                            elif not composition:
-                                composition = {comp: 0.0 for comp in payload.thermo.components}
-                        except Exception:
-                            pass
+            # Ensure composition defaults to payload composition if unreadable or all zeros
+            if getattr(payload, "thermo", None):
+                try:
+                    payload_comp = getattr(payload_stream, "properties", {}) or {}
+                    payload_comp = payload_comp.get("composition", {}) or {}
+                    if payload_comp:
+                        if not composition or sum(composition.values()) == 0.0:
+                            composition = {comp: float(payload_comp.get(comp, 0.0)) for comp in payload.thermo.components}
+                    elif not composition:
+                        composition = dict.fromkeys(payload.thermo.components, 0.0)
+                except Exception:
+                    pass
 
-                    results.append(
-                        schemas.StreamResult(
-                            id=payload_stream_id,  # Use payload ID, not DWSIM-generated ID
-                            temperature_c=t,
-                            pressure_kpa=p,
-                            mass_flow_kg_per_h=flow,
-                            mole_flow_kmol_per_h=None,  # Could be calculated if needed
-                            vapor_fraction=vapor_frac,
-                            liquid_fraction=liquid_frac,
-                            composition=composition,
-                        )
-                    )
-                except Exception as exc:
-                    logger.exception("Error extracting stream %s: %s", payload_stream_id, exc)
+            return schemas.StreamResult(
+                id=payload_stream_id,  # Use payload ID, not DWSIM-generated ID
+                temperature_c=t,
+                pressure_kpa=p,
+                mass_flow_kg_per_h=flow,
+                mole_flow_kmol_per_h=None,  # Could be calculated if needed
+                vapor_fraction=vapor_frac,
+                liquid_fraction=liquid_frac,
+                composition=composition,
+            )
         except Exception as exc:
-            logger.warning("Failed to extract DWSIM streams: %s", exc)
-        return results
+            _sampled_exception(exc, "Error extracting stream {}: {}", payload_stream_id, exc)
+            return None
 
     def _extract_units(self, flowsheet, payload: schemas.FlowsheetPayload = None) -> List[schemas.UnitResult]:  # pragma: no cover
         results: List[schemas.UnitResult] = []
@@ -2709,7 +3240,7 @@ class DWSIMClient:
                     units = flowsheet.UnitOperations
                     logger.debug("Retrieved units via UnitOperations property")
             except Exception as e:
-                logger.debug("UnitOperations property access failed: %s", e)
+                logger.debug("UnitOperations property access failed: {}", e)
         
         # Fallback: SimulationObjects collection
         if units is None and hasattr(flowsheet, "SimulationObjects"):
@@ -2717,7 +3248,7 @@ class DWSIMClient:
                 units = flowsheet.SimulationObjects
                 logger.debug("Retrieved units via SimulationObjects fallback")
             except Exception as e:
-                logger.debug("SimulationObjects fallback failed: %s", e)
+                logger.debug("SimulationObjects fallback failed: {}", e)
         
         if units is None:
             logger.warning("Could not retrieve units from flowsheet")
@@ -2735,17 +3266,23 @@ class DWSIMClient:
             except Exception:
                 unit_list = [units]
             
-            # Map DWSIM units to payload unit IDs
-            unit_id_map = {}  # Maps DWSIM unit object -> payload unit ID
-            
+            # Map DWSIM units to payload unit IDs. A list of pairs, not a dict
+            # keyed on the units: hashing a CLR object calls GetHashCode.
+            unit_id_map = []
+            # Stream check per wrapper type rather than per object
+            stream_types: Dict[type, bool] = {}
+
             for unit in unit_list:
                 try:
-                    unit_name = self._name_or_tag(unit, "unit")
-                    type_str = str(type(unit)).lower()
-                    
-                    # Skip streams
-                    if "stream" in type_str or "material" in type_str:
+                    unit_type = type(unit)
+                    is_stream = stream_types.get(unit_type)
+                    if is_stream is None:
+                        type_str = str(unit_type).lower()
+                        is_stream = stream_types[unit_type] = "stream" in type_str or "material" in type_str
+                    # Skip streams before their names cross the interop boundary
+                    if is_stream:
                         continue
+                    unit_name = self._name_or_tag(unit, "unit")
                     
                     # Check if this unit matches any payload unit by ID or name
                     matched_id = None
@@ -2756,55 +3293,64 @@ class DWSIMClient:
                             matched_id = payload_unit_names[unit_name].id
                         else:
                             # Try to match by checking if unit name contains payload ID
-                            for payload_id, payload_unit in payload_unit_ids.items():
-                                if payload_id in str(unit_name) or str(unit_name) in payload_id:
+                            for payload_id in payload_unit_ids:
+                                if payload_id in unit_name or unit_name in payload_id:
                                     matched_id = payload_id
                                     break
                     
                     # If we have payload, only process matched units; otherwise process all
                     if matched_id or not payload_unit_ids:
-                        unit_id_map[unit] = matched_id or unit_name
+                        unit_id_map.append((unit, matched_id or unit_name))
                 except Exception:
                     logger.debug("Error checking unit name, skipping")
                     continue
             
             # Extract properties only for matched units (or all if no payload)
-            for unit, payload_unit_id in unit_id_map.items():
+            if self._parallel_extract and len(unit_id_map) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(unit_id_map)), thread_name_prefix="dwsim-extract") as pool:
+                    fetched = list(pool.map(lambda item: self._fetch_unit(*item), unit_id_map))
+            else:
+                fetched = [self._fetch_unit(unit, payload_unit_id) for unit, payload_unit_id in unit_id_map]
+            results.extend(result for result in fetched if result is not None)
+        except Exception as exc:
+            logger.warning("Failed to extract DWSIM unit results: {}", exc)
+        return results
+
+    def _fetch_unit(self, unit, payload_unit_id: str) -> Optional[schemas.UnitResult]:  # pragma: no cover - pythonnet objects
+        """Read one matched DWSIM unit's duty into a UnitResult (None on failure)."""
+        try:
+            try:
+                duty = getattr(unit, 'DeltaQ', 0)
+            except Exception:
                 try:
+                    duty = getattr(unit, 'HeatFlow', 0)
+                except Exception:
                     try:
-                        duty = getattr(unit, 'DeltaQ', 0)
+                        # Try GetProp for duty
+                        if hasattr(unit, 'GetProp'):
+                            duty_result = unit.GetProp('HeatFlow', 'overall', None, '', 'kW')
+                            duty = duty_result[0] if duty_result and len(duty_result) > 0 else 0
+                        else:
+                            duty = 0
                     except Exception:
-                        try:
-                            duty = getattr(unit, 'HeatFlow', 0)
-                        except Exception:
-                            try:
-                                # Try GetProp for duty
-                                if hasattr(unit, 'GetProp'):
-                                    duty_result = unit.GetProp('HeatFlow', 'overall', None, '', 'kW')
-                                    duty = duty_result[0] if duty_result and len(duty_result) > 0 else 0
-                                else:
-                                    duty = 0
-                            except Exception:
-                                duty = 0
-                    
-                    # Normalize duty to float
-                    if duty is None:
-                        duty = 0.0
-                    try:
-                        duty = float(duty)
-                    except (ValueError, TypeError):
-                        duty = 0.0
-                    
-                    results.append(schemas.UnitResult(
-                        id=payload_unit_id,  # Use payload ID if available
-                        duty_kw=duty,
-                        status='ok'
-                    ))
-                except Exception as item_exc:
-                    logger.debug("Skipping unit extraction due to error: %s", item_exc)
-        except Exception as exc:
-            logger.warning("Failed to extract DWSIM unit results: %s", exc)
-        return results
+                        duty = 0
+            
+            # Normalize duty to float
+            if duty is None:
+                duty = 0.0
+            try:
+                duty = float(duty)
+            except (ValueError, TypeError):
+                duty = 0.0
+            
+            return schemas.UnitResult(
+                id=payload_unit_id,  # Use payload ID if available
+                duty_kw=duty,
+                status='ok'
+            )
+        except Exception as item_exc:
+            logger.debug("Skipping unit extraction due to error: {}", item_exc)
+            return None
 
     def _simple_property_flash(self, request: schemas.PropertyRequest) -> dict:  # pragma: no cover
         # TODO: map PropertyRequest to a standalone thermo calculation.
@@ -2814,36 +3360,55 @@ class DWSIMClient:
     # Mock fallback
     # ------------------------------------------------------------------
     def _mock_result(self, payload: schemas.FlowsheetPayload) -> schemas.SimulationResult:
-        stream_results: List[schemas.StreamResult] = []
-        for idx, stream in enumerate(payload.streams):
-            base = 100 + idx * 10
-            stream_results.append(
-                schemas.StreamResult(
-                    id=stream.id,
-                    temperature_c=200 - idx * 5,
-                    pressure_kpa=300 + idx * 15,
-                    mass_flow_kg_per_h=base * 1.5,
-                    mole_flow_kmol_per_h=base * 0.01,
-                    vapor_fraction=self._rng.uniform(0, 1),
-                    liquid_fraction=self._rng.uniform(0, 1),
-                    composition={comp: round(self._rng.random(), 3) for comp in payload.thermo.components or ["C1", "C2"]},
-                )
-            )
+        components = payload.thermo.components or ["C1", "C2"]
+        n_streams = len(payload.streams)
+        # Draw every random value up front, one NumPy call per quantity
+        vapor = self._rng.uniform(0, 1, n_streams).tolist()
+        liquid = self._rng.uniform(0, 1, n_streams).tolist()
+        fractions = self._rng.random((n_streams, len(components))).round(3).tolist()
+        duties = self._rng.uniform(-5000, 5000, len(payload.units)).tolist()
+        # The deterministic profile is linear in the stream index
+        idx = np.arange(n_streams, dtype=float)
+        base = 100 + idx * 10
+        columns = zip(
+            (200 - idx * 5).tolist(),
+            (300 + idx * 15).tolist(),
+            (base * 1.5).tolist(),
+            (base * 0.01).tolist(),
+            vapor,
+            liquid,
+            fractions,
+        )
 
-        unit_results: List[schemas.UnitResult] = []
-        for unit in payload.units:
-            unit_results.append(
-                schemas.UnitResult(
-                    id=unit.id,
-                    duty_kw=self._rng.uniform(-5000, 5000),
-                    status="ok",
-                    extra={"type": unit.type, "note": "Mock result"},
-                )
+        # Every value below is already a float/str of the right shape, so the
+        # models are built with model_construct and skip validation.
+        stream_results = [
+            schemas.StreamResult.model_construct(
+                id=stream.id,
+                temperature_c=temp,
+                pressure_kpa=pres,
+                mass_flow_kg_per_h=mass_flow,
+                mole_flow_kmol_per_h=mole_flow,
+                vapor_fraction=vf,
+                liquid_fraction=lf,
+                composition=dict(zip(components, fraction_row)),
             )
+            for stream, (temp, pres, mass_flow, mole_flow, vf, lf, fraction_row)
+            in zip(payload.streams, columns)
+        ]
+        unit_results = [
+            schemas.UnitResult.model_construct(
+                id=unit.id,
+                duty_kw=duty,
+                status="ok",
+                extra={"type": unit.type, "note": "Mock result"},
+            )
+            for unit, duty in zip(payload.units, duties)
+        ]
 
         warnings = ["DWSIM automation not available"] if not self._automation else []
 
-        return schemas.SimulationResult(
+        return schemas.SimulationResult.model_construct(
             flowsheet_name=payload.name,
             status="ok",
             streams=stream_results,
@@ -2851,3 +3416,25 @@ class DWSIMClient:
             warnings=warnings,
             diagnostics={"mode": "mock"},
         )
+
+
+# ----------------------------------------------------------------------
+# Shared default client
+# ----------------------------------------------------------------------
+
+_default_client: Optional[DWSIMClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> DWSIMClient:
+    """Return the process-wide DWSIMClient, creating it on first use.
+
+    Sharing the client also shares its result cache and resolved-method
+    tables; the Automation3 instance itself is shared regardless.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = DWSIMClient()
+    return _default_client
@@ -119,6 +119,8 @@ class AdjustSpecModel(BaseModel):
     target_value: float
     tolerance: float = 1e-4
     max_iterations: int = 50
+    rtol: float = 0.0
+    initial_guess: Optional[float] = None
 
 
 class SetSpecModel(BaseModel):
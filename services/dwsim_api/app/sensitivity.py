@@ -13,7 +13,7 @@ from typing import Dict, List, Optional
 from loguru import logger
 
 from . import schemas
-from .thermo_client import ThermoClient
+from .thermo_client import get_default_client
 
 
 def run_sensitivity(
@@ -28,7 +28,7 @@ def run_sensitivity(
     `output_properties` are read from `output_stream_id`.
     """
     warnings: List[str] = []
-    client = ThermoClient()
+    client = get_default_client()
 
     n = max(request.n_points, 2)
     param_values = [
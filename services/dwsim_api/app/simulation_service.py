@@ -31,11 +31,11 @@ class SimulationService:
 
         # If Adjust specs present, use the iterative adjust solver
         if payload.adjust_specs:
-            from .adjust_operation import AdjustSpec, run_adjust
-            # Run adjusts sequentially (each builds on previous)
-            result = None
-            for adj in payload.adjust_specs:
-                spec = AdjustSpec(
+            from .adjust_operation import AdjustSpec, run_adjusts
+            # Independent adjusts run concurrently; specs on the same unit
+            # are chained in order.
+            specs = [
+                AdjustSpec(
                     variable_unit_id=adj.variable_unit_id,
                     variable_param=adj.variable_param,
                     variable_min=adj.variable_min,
@@ -45,9 +45,12 @@ class SimulationService:
                     target_value=adj.target_value,
                     tolerance=adj.tolerance,
                     max_iterations=adj.max_iterations,
+                    rtol=adj.rtol,
+                    initial_guess=adj.initial_guess,
                 )
-                result = run_adjust(payload, spec, self._client)
-            return result
+                for adj in payload.adjust_specs
+            ]
+            return run_adjusts(payload, specs, self._client)
 
         return self._client.simulate_flowsheet(payload)
 
@@ -9,7 +9,8 @@ property packages.
 
 from __future__ import annotations
 
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional
 
 from loguru import logger
 
@@ -17,10 +18,18 @@ from . import schemas
 from .flowsheet_solver import FlowsheetSolver
 from .thermo_engine import StreamState, ThermoEngine
 
+# ``thermo`` builds its correlation tables lazily on first use and that
+# initialisation is not thread-safe; engines are constructed one at a time.
+_engine_init_lock = threading.Lock()
+
 
 class ThermoClient:
     """Drop-in replacement for DWSIMClient using the thermo library."""
 
+    # Every solve builds its own engine and solver (construction is
+    # serialised below), so one client may be shared by worker threads.
+    thread_safe = True
+
     # ------------------------------------------------------------------
     # Flowsheet simulation
     # ------------------------------------------------------------------
@@ -52,10 +61,11 @@ class ThermoClient:
         pkg = payload.thermo.package or "Peng-Robinson"
 
         try:
-            engine = ThermoEngine(
-                component_names=components,
-                property_package=pkg,
-            )
+            with _engine_init_lock:
+                engine = ThermoEngine(
+                    component_names=components,
+                    property_package=pkg,
+                )
         except Exception as exc:
             return schemas.SimulationResult(
                 flowsheet_name=payload.name,
@@ -443,3 +453,21 @@ class ThermoClient:
                 )
             )
         return results
+
+
+# ----------------------------------------------------------------------
+# Shared default client
+# ----------------------------------------------------------------------
+
+_default_client: Optional[ThermoClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> ThermoClient:
+    """Return the process-wide ThermoClient, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = ThermoClient()
+    return _default_client
@@ -2,6 +2,12 @@
 Tests for Adjust and Set logical operations (Phase 4).
 """
 
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
 import pytest
 
 from app import schemas
@@ -25,6 +31,54 @@ def _make_payload(name, components, units, streams, package="Peng-Robinson",
     )
 
 
+class _RecordingClient(ThermoClient):
+    """ThermoClient that records the adjusted parameter of every solve."""
+
+    def __init__(self, unit_id, param):
+        super().__init__()
+        self._unit_id = unit_id
+        self._param = param
+        self.solved_values = []
+
+    def simulate_flowsheet(self, payload):
+        unit = next(u for u in payload.units if u.id == self._unit_id)
+        self.solved_values.append(unit.parameters[self._param])
+        return super().simulate_flowsheet(payload)
+
+
+def _heater_payload(duty_kw=100.0):
+    return _make_payload(
+        name="adjust-heater",
+        components=["water"],
+        units=[
+            {
+                "id": "heater-1",
+                "type": "heaterCooler",
+                "parameters": {"duty_kw": duty_kw},
+            }
+        ],
+        streams=[
+            {
+                "id": "feed",
+                "source": None,
+                "target": "heater-1",
+                "properties": {
+                    "temperature": 25.0,
+                    "pressure": 101.325,
+                    "flow_rate": 3600.0,
+                    "composition": {"water": 1.0},
+                },
+            },
+            {
+                "id": "product",
+                "source": "heater-1",
+                "target": None,
+                "properties": {},
+            },
+        ],
+    )
+
+
 class TestAdjust:
     def test_adjust_heater_duty_for_target_temperature(self, client):
         """Adjust heater duty to achieve a target outlet temperature."""
@@ -82,6 +136,399 @@ class TestAdjust:
         assert product.temperature_c is not None
         assert abs(product.temperature_c - 80.0) < 2.0
 
+    def test_adjust_converges_in_fresh_process(self):
+        """The concurrent bracket-end solves are safe on a cold client."""
+        script = textwrap.dedent("""
+            import json
+            from app.adjust_operation import AdjustSpec, run_adjust
+            from tests.test_adjust import _heater_payload
+
+            spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                              "temperature_c", 80.0, tolerance=0.5)
+            result = run_adjust(_heater_payload(), spec)
+            product = next(s for s in result.streams if s.id == "product")
+            print(json.dumps({
+                "adjust": result.diagnostics.get("adjust"),
+                "temperature_c": product.temperature_c,
+                "warnings": result.warnings,
+            }))
+        """)
+        proc = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, check=True,
+        )
+        out = json.loads(proc.stdout.strip().splitlines()[-1])
+
+        assert out["adjust"] is not None, out["warnings"]
+        assert abs(out["temperature_c"] - 80.0) < 0.5
+
+    def test_adjust_does_not_resolve_repeated_points(self):
+        """The final solve at the root reuses the cached solver evaluation."""
+        from app.adjust_operation import AdjustSpec, run_adjust
+
+        client = _RecordingClient("heater-1", "duty_kw")
+        spec = AdjustSpec(
+            variable_unit_id="heater-1",
+            variable_param="duty_kw",
+            variable_min=1.0,
+            variable_max=500.0,
+            target_stream_id="product",
+            target_property="temperature_c",
+            target_value=80.0,
+            tolerance=0.5,
+        )
+        result = run_adjust(_heater_payload(), spec, client)
+
+        converged = result.diagnostics["adjust"]["converged_value"]
+        assert round(converged, 12) in client.solved_values
+        assert len(client.solved_values) == len(set(client.solved_values))
+
+    def test_adjust_initial_guess_reduces_solves(self):
+        """A good initial guess lets the secant refinement finish early."""
+        from app.adjust_operation import AdjustSpec, run_adjust
+
+        spec_kwargs = dict(
+            variable_unit_id="heater-1",
+            variable_param="duty_kw",
+            variable_min=1.0,
+            variable_max=500.0,
+            target_stream_id="product",
+            target_property="temperature_c",
+            target_value=80.0,
+            tolerance=0.5,
+        )
+        cold = _RecordingClient("heater-1", "duty_kw")
+        run_adjust(_heater_payload(), AdjustSpec(**spec_kwargs), cold)
+
+        warm = _RecordingClient("heater-1", "duty_kw")
+        result = run_adjust(
+            _heater_payload(),
+            AdjustSpec(initial_guess=200.0, **spec_kwargs),
+            warm,
+        )
+
+        product = next(s for s in result.streams if s.id == "product")
+        assert abs(product.temperature_c - 80.0) < 0.5
+        assert len(warm.solved_values) < len(cold.solved_values)
+
+
+    def test_adjust_with_surrogate_solves_flowsheet_once(self):
+        """A surrogate model replaces the flowsheet inside the root find."""
+        from app.adjust_operation import AdjustSpec, run_adjust
+
+        client = _RecordingClient("heater-1", "duty_kw")
+        spec = AdjustSpec(
+            variable_unit_id="heater-1",
+            variable_param="duty_kw",
+            variable_min=1.0,
+            variable_max=500.0,
+            target_stream_id="product",
+            target_property="temperature_c",
+            target_value=80.0,
+            tolerance=0.5,
+            # Linear fit of the heater's response around 80 °C
+            surrogate=lambda duty_kw: 25.0 + duty_kw / 4.52,
+        )
+        result = run_adjust(_heater_payload(), spec, client)
+
+        assert len(client.solved_values) == 1
+        converged = result.diagnostics["adjust"]["converged_value"]
+        assert converged == pytest.approx(55.0 * 4.52, abs=0.5)
+
+    def test_inaccurate_surrogate_is_refined_on_flowsheet(self):
+        """A surrogate root the flowsheet misses is not reported as converged."""
+        from app.adjust_operation import AdjustSpec, run_adjust
+
+        spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                          "temperature_c", 60.0, tolerance=0.5,
+                          surrogate=lambda duty_kw: 25.0 + duty_kw / 10.0)
+        result = run_adjust(_heater_payload(), spec, ThermoClient())
+
+        product = next(s for s in result.streams if s.id == "product")
+        assert abs(product.temperature_c - 60.0) < 0.5
+        assert result.diagnostics["adjust"]["converged_value"] != pytest.approx(350.0)
+
+    def test_surrogate_root_missing_target_warns(self):
+        from app.adjust_operation import AdjustSpec, run_adjust
+
+        spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                          "temperature_c", 5000.0, tolerance=0.5,
+                          surrogate=lambda duty_kw: duty_kw * 10.0)
+        result = run_adjust(_heater_payload(), spec, ThermoClient())
+
+        assert "adjust" not in result.diagnostics
+        assert any("Adjust target missed" in w for w in result.warnings)
+
+
+    def test_unreachable_target_returns_closest_end_without_extra_solve(self):
+        """A failed bracket reuses the end-point solve nearest the target."""
+        from app.adjust_operation import AdjustSpec, run_adjust
+
+        client = _RecordingClient("heater-1", "duty_kw")
+        spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                          "temperature_c", 5000.0, tolerance=0.5)
+        result = run_adjust(_heater_payload(), spec, client)
+
+        assert any("Adjust failed" in w for w in result.warnings)
+        assert sorted(client.solved_values) == [1.0, 500.0]
+        product = next(s for s in result.streams if s.id == "product")
+        assert product.temperature_c > 100.0
+
+
+class TestRunAdjusts:
+    def test_independent_adjusts_meet_both_targets(self):
+        """Adjusts on separate units are solved together into one result."""
+        from app.adjust_operation import AdjustSpec, run_adjusts
+
+        feed = {
+            "temperature": 25.0,
+            "pressure": 101.325,
+            "flow_rate": 3600.0,
+            "composition": {"water": 1.0},
+        }
+        payload = _make_payload(
+            name="adjust-two-heaters",
+            components=["water"],
+            units=[
+                {"id": "h1", "type": "heaterCooler", "parameters": {"duty_kw": 100.0}},
+                {"id": "h2", "type": "heaterCooler", "parameters": {"duty_kw": 100.0}},
+            ],
+            streams=[
+                {"id": "f1", "source": None, "target": "h1", "properties": feed},
+                {"id": "p1", "source": "h1", "target": None, "properties": {}},
+                {"id": "f2", "source": None, "target": "h2", "properties": feed},
+                {"id": "p2", "source": "h2", "target": None, "properties": {}},
+            ],
+        )
+        specs = [
+            AdjustSpec("h1", "duty_kw", 1.0, 500.0, "p1", "temperature_c", 60.0,
+                       tolerance=0.5),
+            AdjustSpec("h2", "duty_kw", 1.0, 500.0, "p2", "temperature_c", 80.0,
+                       tolerance=0.5),
+        ]
+
+        result = run_adjusts(payload, specs, ThermoClient())
+
+        temps = {s.id: s.temperature_c for s in result.streams}
+        assert abs(temps["p1"] - 60.0) < 1.0
+        assert abs(temps["p2"] - 80.0) < 1.0
+        assert len(result.diagnostics["adjusts"]) == 2
+
+    def test_groups_probe_bracket_ends_concurrently(self):
+        """Bracket-end solves of separate groups don't queue on a shared pool."""
+        import threading
+
+        from app.adjust_operation import AdjustSpec, run_adjusts
+
+        class _BarrierClient(ThermoClient):
+            """Blocks the first four solves until all of them are in flight."""
+
+            def __init__(self):
+                super().__init__()
+                self.barrier = threading.Barrier(4, timeout=10)
+                self.calls = 0
+                self.lock = threading.Lock()
+
+            def simulate_flowsheet(self, payload):
+                with self.lock:
+                    self.calls += 1
+                    first = self.calls <= 4
+                if first:
+                    self.barrier.wait()
+                return super().simulate_flowsheet(payload)
+
+        feed = {
+            "temperature": 25.0,
+            "pressure": 101.325,
+            "flow_rate": 3600.0,
+            "composition": {"water": 1.0},
+        }
+        payload = _make_payload(
+            name="adjust-two-heaters",
+            components=["water"],
+            units=[
+                {"id": "h1", "type": "heaterCooler", "parameters": {"duty_kw": 100.0}},
+                {"id": "h2", "type": "heaterCooler", "parameters": {"duty_kw": 100.0}},
+            ],
+            streams=[
+                {"id": "f1", "source": None, "target": "h1", "properties": feed},
+                {"id": "p1", "source": "h1", "target": None, "properties": {}},
+                {"id": "f2", "source": None, "target": "h2", "properties": feed},
+                {"id": "p2", "source": "h2", "target": None, "properties": {}},
+            ],
+        )
+        specs = [
+            AdjustSpec("h1", "duty_kw", 1.0, 500.0, "p1", "temperature_c", 60.0,
+                       tolerance=0.5),
+            AdjustSpec("h2", "duty_kw", 1.0, 500.0, "p2", "temperature_c", 80.0,
+                       tolerance=0.5),
+        ]
+
+        result = run_adjusts(payload, specs, _BarrierClient())
+
+        assert len(result.diagnostics["adjusts"]) == 2
+
+    def _series_payload(self):
+        return _make_payload(
+            name="adjust-heaters-in-series",
+            components=["water"],
+            units=[
+                {"id": "h1", "type": "heaterCooler", "parameters": {"duty_kw": 100.0}},
+                {"id": "h2", "type": "heaterCooler", "parameters": {"duty_kw": 100.0}},
+            ],
+            streams=[
+                {
+                    "id": "feed",
+                    "source": None,
+                    "target": "h1",
+                    "properties": {
+                        "temperature": 25.0,
+                        "pressure": 101.325,
+                        "flow_rate": 3600.0,
+                        "composition": {"water": 1.0},
+                    },
+                },
+                {"id": "mid", "source": "h1", "target": "h2", "properties": {}},
+                {"id": "product", "source": "h2", "target": None, "properties": {}},
+            ],
+        )
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_adjusts_in_series_meet_both_targets(self, reverse):
+        """An upstream variable is solved before the target it feeds."""
+        from app.adjust_operation import AdjustSpec, run_adjusts
+
+        specs = [
+            AdjustSpec("h1", "duty_kw", 1.0, 500.0, "mid", "temperature_c",
+                       50.0, tolerance=0.5),
+            AdjustSpec("h2", "duty_kw", 1.0, 500.0, "product", "temperature_c",
+                       80.0, tolerance=0.5),
+        ]
+        if reverse:
+            specs.reverse()
+
+        result = run_adjusts(self._series_payload(), specs, ThermoClient())
+
+        temps = {s.id: s.temperature_c for s in result.streams}
+        assert abs(temps["mid"] - 50.0) < 1.0
+        assert abs(temps["product"] - 80.0) < 1.0
+        assert not any("target missed" in w for w in result.warnings)
+
+    def test_conflicting_adjusts_warn_about_missed_target(self):
+        """Two specs on one variable cannot both be met."""
+        from app.adjust_operation import AdjustSpec, run_adjusts
+
+        specs = [
+            AdjustSpec("h1", "duty_kw", 1.0, 500.0, "mid", "temperature_c",
+                       50.0, tolerance=0.5),
+            AdjustSpec("h1", "duty_kw", 1.0, 500.0, "product", "temperature_c",
+                       80.0, tolerance=0.5),
+        ]
+
+        result = run_adjusts(self._series_payload(), specs, ThermoClient())
+
+        assert any(
+            "Adjust target missed: mid.temperature_c" in w
+            for w in result.warnings
+        )
+
+    def test_no_specs_solves_flowsheet_once(self, client):
+        from app.adjust_operation import run_adjusts
+
+        result = run_adjusts(self._series_payload(), [], client)
+
+        assert result.converged is True
+        assert "adjusts" not in result.diagnostics
+
+
+class TestRunAdjustBatch:
+    def test_batch_solves_each_target(self):
+        """Every target gets its own converged result from shared solves."""
+        from app.adjust_operation import AdjustSpec, run_adjust_batch
+
+        client = _RecordingClient("heater-1", "duty_kw")
+        spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                          "temperature_c", 0.0, tolerance=0.5)
+
+        results = run_adjust_batch(_heater_payload(), spec, [50.0, 80.0], client)
+
+        for target, result in zip([50.0, 80.0], results):
+            product = next(s for s in result.streams if s.id == "product")
+            assert abs(product.temperature_c - target) < 1.0
+            assert result.diagnostics["adjust"]["target_value"] == target
+        # The bracket ends are solved once for the whole batch
+        assert client.solved_values.count(1.0) == 1
+        assert client.solved_values.count(500.0) == 1
+
+    def test_batch_reports_unreachable_targets(self):
+        from app.adjust_operation import AdjustSpec, run_adjust_batch
+
+        spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                          "temperature_c", 0.0, tolerance=0.5)
+
+        results = run_adjust_batch(
+            _heater_payload(), spec, [60.0, 5000.0], ThermoClient(),
+        )
+
+        assert "adjust" in results[0].diagnostics
+        assert any("Adjust failed" in w for w in results[1].warnings)
+
+    def test_batch_uses_surrogate_for_every_target(self):
+        from app.adjust_operation import AdjustSpec, run_adjust_batch
+
+        client = _RecordingClient("heater-1", "duty_kw")
+        spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                          "temperature_c", 0.0, tolerance=0.5,
+                          surrogate=lambda duty_kw: 25.0 + duty_kw / 4.52)
+
+        results = run_adjust_batch(_heater_payload(), spec, [60.0, 80.0], client)
+
+        assert all("adjust" in r.diagnostics for r in results)
+        # One checking solve per target, no bracket-end solves
+        assert len(client.solved_values) == 2
+
+    def test_empty_batch_returns_no_results(self, client):
+        from app.adjust_operation import AdjustSpec, run_adjust_batch
+
+        spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                          "temperature_c", 0.0, tolerance=0.5)
+
+        assert run_adjust_batch(_heater_payload(), spec, [], client) == []
+
+    def test_batch_converges_in_fresh_process(self):
+        """Concurrent solves of a batch are safe on a cold client."""
+        script = textwrap.dedent("""
+            import json
+            from app.adjust_operation import AdjustSpec, run_adjust_batch
+            from tests.test_adjust import _heater_payload
+
+            spec = AdjustSpec("heater-1", "duty_kw", 1.0, 500.0, "product",
+                              "temperature_c", 0.0, tolerance=0.5)
+            results = run_adjust_batch(
+                _heater_payload(), spec, [50.0, 60.0, 70.0, 80.0],
+            )
+            print(json.dumps([
+                {
+                    "adjust": r.diagnostics.get("adjust"),
+                    "temperature_c": next(
+                        s for s in r.streams if s.id == "product"
+                    ).temperature_c,
+                }
+                for r in results
+            ]))
+        """)
+        proc = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, check=True,
+        )
+        out = json.loads(proc.stdout.strip().splitlines()[-1])
+
+        for target, result in zip([50.0, 60.0, 70.0, 80.0], out):
+            assert result["adjust"] is not None
+            assert abs(result["temperature_c"] - target) < 1.0
+
 
 class TestSetOperation:
     def test_set_compressor_pressure(self, client):
@@ -147,3 +594,117 @@ class TestSetOperation:
         # The heater should have inherited the pressure from the set spec
         product = next(s for s in result.streams if s.id == "product")
         assert product is not None
+
+
+class TestClonePayload:
+    def test_clone_changes_only_target_unit(self):
+        """Cloning with a new parameter must not touch the original payload."""
+        from app.adjust_operation import _clone_payload_with_param
+
+        payload = _heater_payload(duty_kw=100.0)
+        clone = _clone_payload_with_param(payload, "heater-1", "duty_kw", 250.0)
+
+        assert clone.units[0].parameters["duty_kw"] == 250.0
+        assert payload.units[0].parameters["duty_kw"] == 100.0
+        # Untouched parts of the flowsheet are shared, not copied
+        assert clone.streams[0] is payload.streams[0]
+
+
+class TestApplySetSpecs:
+    def test_empty_set_specs_returns_payload_unchanged(self):
+        from app.adjust_operation import apply_set_specs
+
+        payload = _heater_payload()
+        assert apply_set_specs(payload, []) is payload
+
+    def test_unresolvable_set_specs_skip_rebuild(self):
+        from app.adjust_operation import SetSpec, apply_set_specs
+
+        payload = _heater_payload()
+        specs = [SetSpec("missing", "duty_kw", "heater-1", "duty_kw")]
+        assert apply_set_specs(payload, specs) is payload
+
+    def test_chained_set_specs_see_earlier_writes(self):
+        """A -> B then B -> C must propagate A's value through to C."""
+        from app.adjust_operation import SetSpec, apply_set_specs
+
+        payload = _make_payload(
+            name="set-chain",
+            components=["water"],
+            units=[
+                {"id": "a", "type": "pump", "parameters": {"outlet_pressure_kpa": 500.0}},
+                {"id": "b", "type": "pump", "parameters": {}},
+                {"id": "c", "type": "pump", "parameters": {}},
+            ],
+            streams=[],
+        )
+        result = apply_set_specs(payload, [
+            SetSpec("a", "outlet_pressure_kpa", "b", "outlet_pressure_kpa", multiplier=2.0),
+            SetSpec("b", "outlet_pressure_kpa", "c", "outlet_pressure_kpa", offset=50.0),
+        ])
+
+        params = {u.id: u.parameters for u in result.units}
+        assert params["b"]["outlet_pressure_kpa"] == 1000.0
+        assert params["c"]["outlet_pressure_kpa"] == 1050.0
+        assert "outlet_pressure_kpa" not in payload.units[1].parameters
+        # Units without a Set target are shared rather than rebuilt
+        assert result.units[0] is payload.units[0]
+
+
+class TestChandrupatla:
+    def test_batch_matches_scalar_roots(self):
+        import numpy as np
+
+        from app.adjust_operation import _chandrupatla_batch
+
+        targets = np.array([1.0, 2.0, 8.0])
+        a = np.zeros(3)
+        b = np.full(3, 4.0)
+        roots = _chandrupatla_batch(
+            lambda i, x: x ** 3 - targets[i], a, b,
+            a ** 3 - targets, b ** 3 - targets, xtol=1e-10,
+        )
+        assert roots == pytest.approx(np.cbrt(targets), abs=1e-9)
+
+    def test_finds_root_of_monotone_function(self):
+        from app.adjust_operation import _chandrupatla
+
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return x ** 3 - 2.0
+
+        root = _chandrupatla(f, 0.0, 4.0, f(0.0), f(4.0), xtol=1e-10)
+        assert root == pytest.approx(2.0 ** (1 / 3), abs=1e-9)
+        assert len(calls) < 20
+
+    def test_raises_when_iterations_exhausted(self):
+        from app.adjust_operation import _chandrupatla
+
+        with pytest.raises(RuntimeError):
+            _chandrupatla(lambda x: x ** 3 - 2.0, 0.0, 4.0, -2.0, 62.0,
+                          xtol=0.0, maxiter=2)
+
+
+class TestDefaultClient:
+    def test_default_client_is_shared(self):
+        from app.thermo_client import get_default_client
+
+        assert get_default_client() is get_default_client()
+
+
+class TestSpecs:
+    def test_specs_are_frozen_and_hashable(self):
+        import dataclasses
+
+        from app.adjust_operation import AdjustSpec, SetSpec
+
+        spec = SetSpec("a", "x", "b", "y", multiplier=2.0)
+        assert hash(spec) == hash(SetSpec("a", "x", "b", "y", multiplier=2.0))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.offset = 1.0
+
+        adjust = AdjustSpec("u", "duty_kw", 0.0, 1.0, "s", "temperature_c", 50.0)
+        assert adjust.tolerance == 1e-4
+        assert not hasattr(adjust, "__dict__")
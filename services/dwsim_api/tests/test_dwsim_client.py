@@ -0,0 +1,947 @@
+"""
+Tests for the DWSIM automation client helpers (mock backend).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app import dwsim_client, schemas
+from app.dwsim_client import DWSIMClient, _COMPONENT_ADDERS, _DENSITY_POOL, _ENTHALPY_POOL
+
+
+@pytest.fixture(autouse=True)
+def _fresh_automation(monkeypatch):
+    monkeypatch.setattr(dwsim_client, "_AUTOMATION_SINGLETON", None)
+    monkeypatch.setattr(dwsim_client, "_AUTOMATION_LOADED", False)
+    monkeypatch.setattr(dwsim_client, "_REFERENCED_ASSEMBLIES", set())
+
+
+@pytest.fixture
+def client():
+    return DWSIMClient()
+
+
+class _CompoundOnlyFlowsheet:
+    """Flowsheet stand-in that only supports AddCompound."""
+
+    def __init__(self):
+        self.added = []
+        self.probes = 0
+
+    def __getattr__(self, name):
+        self.probes += 1
+        raise AttributeError(name)
+
+    def AddCompound(self, comp):
+        if comp == "Unobtainium":
+            raise KeyError(comp)
+        self.added.append(comp)
+
+
+class TestResolvedMethods:
+    @pytest.fixture(autouse=True)
+    def _fresh_resolved_methods(self, monkeypatch):
+        monkeypatch.setattr(DWSIMClient, "_RESOLVED_METHODS", {})
+
+    def test_method_is_probed_once_per_flowsheet_type(self, client):
+        fs = _CompoundOnlyFlowsheet()
+        warnings = []
+        client._add_components(fs, ["Water", "Methane", "Ethane"], warnings)
+
+        assert fs.added == ["Water", "Methane", "Ethane"]
+        # Only the first component probes AddComponent before AddCompound
+        assert fs.probes == 1
+        assert warnings == []
+
+    def test_rejected_argument_keeps_resolution(self, client):
+        fs = _CompoundOnlyFlowsheet()
+        warnings = []
+        client._add_components(fs, ["Unobtainium", "Water"], warnings)
+
+        assert fs.added == ["Water"]
+        assert fs.probes == 1
+        assert warnings == ["Component 'Unobtainium' not found in DWSIM database"]
+
+    def test_resolution_is_shared_across_clients(self, client):
+        client._add_components(_CompoundOnlyFlowsheet(), ["Water"], [])
+
+        fs = _CompoundOnlyFlowsheet()
+        DWSIMClient()._add_components(fs, ["Methane"], [])
+
+        assert fs.added == ["Methane"]
+        assert fs.probes == 0
+
+    def test_unsupported_flowsheet_reports_missing_method(self, client):
+        assert client._call_resolved("add_component", _COMPONENT_ADDERS, object(), "Water") is False
+
+
+class TestLazyAutomation:
+    def test_automation_loads_on_first_use_only(self, tmp_path, monkeypatch):
+        (tmp_path / "DWSIM.Automation.dll").write_bytes(b"")
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path))
+        calls = []
+        monkeypatch.setattr(
+            DWSIMClient, "_initialize_automation_now", lambda self: calls.append(self)
+        )
+
+        client = DWSIMClient()
+        assert client._automation_available is True
+        assert calls == []
+
+        request = schemas.PropertyRequest(
+            stream=schemas.StreamSpec(id="s", properties={"temperature": 25.0}),
+            thermo=schemas.ThermoConfig(components=["Water"]),
+        )
+        client.calculate_properties(request)
+        client.calculate_properties(request)
+        assert calls == [client]
+
+    def test_automation_is_shared_across_clients(self, tmp_path, monkeypatch):
+        (tmp_path / "DWSIM.Automation.dll").write_bytes(b"")
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path))
+        automation = object()
+        calls = []
+
+        def fake_init(self):
+            calls.append(self)
+            return automation
+
+        monkeypatch.setattr(DWSIMClient, "_initialize_automation_now", fake_init)
+
+        first, second = DWSIMClient(), DWSIMClient()
+        assert first._get_automation() is automation
+        assert second._get_automation() is automation
+        assert calls == [first]
+
+    def test_missing_library_skips_loading(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path / "missing"))
+        client = DWSIMClient()
+        assert client._automation_available is False
+        assert client._get_automation() is None
+
+
+    def test_ensure_ready_loads_off_the_event_loop(self, client, monkeypatch):
+        import asyncio
+        import threading
+
+        threads = []
+        sentinel = object()
+        monkeypatch.setattr(client, "_automation_available", True)
+        monkeypatch.setattr(
+            client, "_initialize_automation_now",
+            lambda: threads.append(threading.get_ident()) or sentinel,
+        )
+
+        assert asyncio.run(client.ensure_ready()) is True
+        assert threads and threads[0] != threading.get_ident()
+        assert client._get_automation() is sentinel
+        assert len(threads) == 1
+
+    def test_automation_survives_module_reload(self, monkeypatch):
+        import importlib
+
+        sentinel = object()
+        lock = dwsim_client._AUTOMATION_LOCK
+        monkeypatch.setattr(dwsim_client, "_AUTOMATION_SINGLETON", sentinel)
+        monkeypatch.setattr(dwsim_client, "_AUTOMATION_LOADED", True)
+
+        namespace = dict(vars(dwsim_client))
+        try:
+            importlib.reload(dwsim_client)
+
+            assert dwsim_client._AUTOMATION_SINGLETON is sentinel
+            assert dwsim_client._AUTOMATION_LOADED is True
+            assert dwsim_client._AUTOMATION_LOCK is lock
+        finally:
+            # Keep the classes the other tests imported in sync with the module
+            vars(dwsim_client).update(namespace)
+
+    def test_flowsheet_factory_falls_back_to_new_flowsheet(self, client):
+        class _Automation:
+            def NewFlowsheet(self):
+                return "new"
+
+        client._automation = _Automation()
+
+        assert client._new_flowsheet() == "new"
+        assert client._new_flowsheet == client._automation.NewFlowsheet
+
+class TestObjectTypeValues:
+    def test_types_resolved_once_and_shared(self, monkeypatch):
+        monkeypatch.setattr(DWSIMClient, "_OBJECT_TYPE_VALUES", {})
+        lookups = []
+
+        class _ObjectType:
+            MaterialStream = "enum-MaterialStream"
+            Pump = "enum-Pump"
+            Mixer = "enum-Mixer"
+
+            def __getattribute__(self, name):
+                lookups.append(name)
+                return object.__getattribute__(self, name)
+
+        first, second = DWSIMClient(), DWSIMClient()
+        for c in (first, second):
+            c._object_type_enum = _ObjectType()
+
+        assert first._get_object_type_value("MaterialStream") == "enum-MaterialStream"
+        resolved = len(lookups)
+        assert second._get_object_type_value("Pump") == "enum-Pump"
+        assert second._get_object_type_value("Mixer") == "enum-Mixer"
+        assert len(lookups) == resolved
+        assert first._get_object_type_value("custom_type") is None
+
+    def test_spelling_variants_match(self, client, monkeypatch):
+        monkeypatch.setattr(DWSIMClient, "_OBJECT_TYPE_VALUES", {})
+
+        class _ObjectType:
+            MaterialStream = "enum-MaterialStream"
+            Heat_Exchanger = "enum-HeatExchanger"
+
+        client._object_type_enum = _ObjectType
+
+        assert client._get_object_type_value("Material Stream") == "enum-MaterialStream"
+        assert client._get_object_type_value("heat-exchanger") == "enum-HeatExchanger"
+
+
+class TestSetPropUnits:
+    def test_accepted_unit_is_tried_first_next_time(self, client, monkeypatch):
+        monkeypatch.setattr(DWSIMClient, "_SETPROP_UNITS", {})
+        attempts = []
+
+        def fake_set(stream_obj, prop_name, phase, comp, basis, unit, value):
+            attempts.append(unit)
+            return unit == "C"
+
+        monkeypatch.setattr(client, "_set_stream_prop", fake_set)
+        options = (("K", 298.15), ("C", 25.0))
+
+        assert client._set_stream_prop_in_units(object(), "temperature", options) == "C"
+        assert client._set_stream_prop_in_units(object(), "temperature", options) == "C"
+        assert attempts == ["K", "C", "C"]
+
+
+class TestDllFilter:
+    @pytest.mark.parametrize("name", [
+        "ThermoCS.dll",
+        "DWSIM.UI.Desktop.dll",
+        "DWSIM.Editors.dll",
+        "System.Windows.Forms.dll",
+        "DWSIM.Thermodynamics.resources.dll",
+        "Microsoft.Office.Interop.Excel.dll",
+        "vcruntime140.dll",
+        "api-ms-win-crt-runtime-l1-1-0.dll",
+        "PresentationCore.dll",
+        "WindowsBase.dll",
+        "System.Numerics.Vectors.dll",
+        "Microsoft.VisualBasic.dll",
+        "mscorlib.dll",
+    ])
+    def test_ui_and_native_dlls_are_skipped(self, name):
+        from app.dwsim_client import _is_skipped_dll
+
+        assert _is_skipped_dll(name)
+
+    def test_core_dlls_are_loaded(self):
+        from app.dwsim_client import _REQUIRED_DLLS, _is_skipped_dll
+
+        assert not any(_is_skipped_dll(name) for name in _REQUIRED_DLLS)
+
+
+class TestPortMapping:
+    @pytest.mark.parametrize("handle, index", [
+        (None, 0),
+        ("", 0),
+        ("in", 0),
+        ("out", 0),
+        ("in-1-left", 0),
+        ("in-2-left", 1),
+        ("out3", 2),
+        ("port_3", 2),
+        ("vapor-top", 0),
+        ("bottom", 0),
+    ])
+    def test_map_port_to_index(self, client, handle, index):
+        assert client._map_port_to_index(handle, "unit-1") == index
+
+
+class TestTypeMaps:
+    def test_maps_are_read_only(self):
+        from app.dwsim_client import _PACKAGE_MAP, _UNIT_TYPE_MAP
+
+        assert _UNIT_TYPE_MAP["heaterCooler"] == "Heater"
+        assert _PACKAGE_MAP["PR"] == "Peng-Robinson"
+        with pytest.raises(TypeError):
+            _UNIT_TYPE_MAP["heaterCooler"] = "Cooler"
+
+
+class TestLibPath:
+    def test_env_var_skips_default_probe(self, tmp_path, monkeypatch):
+        from app import dwsim_client
+
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path))
+        dwsim_client._default_lib_path.cache_clear()
+
+        client = DWSIMClient()
+
+        assert client._lib_path == tmp_path
+        assert dwsim_client._default_lib_path.cache_info().currsize == 0
+
+    def test_default_path_is_probed_once(self, monkeypatch):
+        from app import dwsim_client
+
+        monkeypatch.delenv("DWSIM_LIB_PATH", raising=False)
+        dwsim_client._default_lib_path.cache_clear()
+
+        first = DWSIMClient()._lib_path
+        second = DWSIMClient()._lib_path
+
+        assert first == second
+        assert dwsim_client._default_lib_path.cache_info().misses == 1
+
+    def test_construction_defers_path_and_availability_checks(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("DWSIM_LIB_PATH", raising=False)
+        client = DWSIMClient()
+        assert "_lib_path" not in vars(client)
+        assert "_automation_available" not in vars(client)
+
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path))
+        assert client._lib_path == tmp_path
+        assert client._automation_available is False
+
+    def test_library_directory_is_listed_once(self, tmp_path, monkeypatch):
+        import os
+
+        (tmp_path / "DWSIM.Automation.dll").write_bytes(b"")
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path))
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(dwsim_client.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+        dwsim_client._dir_contents.cache_clear()
+
+        assert DWSIMClient()._automation_available is True
+        assert DWSIMClient()._automation_available is True
+        assert scans == [str(tmp_path)]
+        assert dwsim_client._dir_contents(str(tmp_path / "missing")) is None
+
+
+def _simple_payload(name="cache-test"):
+    return schemas.FlowsheetPayload(
+        name=name,
+        units=[schemas.UnitSpec(id="p1", type="pump", parameters={})],
+        streams=[schemas.StreamSpec(id="s1", target="p1", properties={"temperature": 25.0})],
+        thermo=schemas.ThermoConfig(components=["Water"]),
+    )
+
+
+class TestSimulationCache:
+    @pytest.fixture
+    def dwsim_client(self, client, monkeypatch):
+        runs = []
+        outcome = {"status": "ok", "warnings": []}
+
+        def fake_run(payload):
+            runs.append(payload.name)
+            return schemas.SimulationResult(
+                flowsheet_name=payload.name, status=outcome["status"], streams=[], units=[],
+                warnings=list(outcome["warnings"]),
+            )
+
+        monkeypatch.setattr(client, "_get_automation", lambda: object())
+        monkeypatch.setattr(client, "_run_dwsim", fake_run)
+        client.runs = runs
+        client.outcome = outcome
+        return client
+
+    def test_identical_payload_is_served_from_cache(self, dwsim_client):
+        first = dwsim_client.simulate_flowsheet(_simple_payload())
+        first.warnings.append("mutated by caller")
+        second = dwsim_client.simulate_flowsheet(_simple_payload())
+
+        assert dwsim_client.runs == ["cache-test"]
+        assert second.warnings == []
+
+    def test_different_payload_is_simulated(self, dwsim_client):
+        dwsim_client.simulate_flowsheet(_simple_payload("a"))
+        dwsim_client.simulate_flowsheet(_simple_payload("b"))
+        assert dwsim_client.runs == ["a", "b"]
+
+    def test_cache_is_bounded(self, dwsim_client):
+        dwsim_client._sim_cache_size = 1
+        for name in ("a", "b", "a"):
+            dwsim_client.simulate_flowsheet(_simple_payload(name))
+        assert dwsim_client.runs == ["a", "b", "a"]
+
+    @pytest.mark.parametrize("value, size", [("off", 128), ("", 128), ("0", 0), ("16", 16)])
+    def test_cache_size_from_environment(self, monkeypatch, value, size):
+        monkeypatch.setenv("DWSIM_SIM_CACHE_SIZE", value)
+        assert DWSIMClient()._sim_cache_size == size
+
+    @pytest.mark.parametrize("status, warnings", [
+        ("empty", []),
+        ("ok", ["Calculation error: solver diverged"]),
+    ])
+    def test_failed_calculation_is_not_cached(self, dwsim_client, status, warnings):
+        dwsim_client.outcome.update(status=status, warnings=warnings)
+        dwsim_client.simulate_flowsheet(_simple_payload())
+        dwsim_client.simulate_flowsheet(_simple_payload())
+        assert dwsim_client.runs == ["cache-test", "cache-test"]
+
+    def test_template_mtime_is_keyed_to_the_nanosecond(self, client, tmp_path):
+        import os
+
+        template = tmp_path / "template.dwxmz"
+        template.write_bytes(b"v1")
+        os.utime(template, ns=(1_700_000_000_000_000_000,) * 2)
+        client._template_path = str(template)
+        before = client._sim_cache_key(_simple_payload())
+
+        os.utime(template, ns=(1_700_000_000_000_000_001,) * 2)
+        assert client._sim_cache_key(_simple_payload()) != before
+
+
+class TestTemplateCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_template_copy(self, monkeypatch):
+        monkeypatch.setattr(dwsim_client, "_template_copy", None)
+        monkeypatch.setattr(dwsim_client, "_template_dir", None)
+
+    def test_template_is_recopied_only_after_change(self, client, tmp_path):
+        import os
+
+        template = tmp_path / "base.dwxmz"
+        template.write_bytes(b"v1")
+        loaded = []
+
+        class _Automation:
+            def LoadFlowsheet(self, path):
+                with open(path, "rb") as fh:
+                    loaded.append((path, fh.read()))
+
+        other = DWSIMClient()
+        for c in (client, other):
+            c._template_path = str(template)
+            c._automation = _Automation()
+
+        client._load_template_flowsheet()
+        other._load_template_flowsheet()  # shares the process-wide copy
+        template.write_bytes(b"v2")
+        stat = template.stat()
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        client._load_template_flowsheet()
+
+        assert [content for _, content in loaded] == [b"v1", b"v1", b"v2"]
+        # Each version has its own private copy; the old one is removed
+        paths = [path for path, _ in loaded]
+        assert paths[0] == paths[1] != paths[2] != str(template)
+        assert [p.name for p in Path(paths[2]).parent.iterdir()] == [Path(paths[2]).name]
+
+    def test_template_copy_in_use_is_kept(self, client, tmp_path, monkeypatch):
+        import os
+
+        template = tmp_path / "base.dwxmz"
+        template.write_bytes(b"v1")
+        loaded = []
+        client._template_path = str(template)
+        client._automation = type(
+            "_Automation", (), {"LoadFlowsheet": lambda self, path: loaded.append(path)},
+        )()
+        client._load_template_flowsheet()
+
+        def locked_unlink(self, missing_ok=False):
+            raise PermissionError("file is in use")
+
+        monkeypatch.setattr(Path, "unlink", locked_unlink)
+        template.write_bytes(b"v2")
+        stat = template.stat()
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        client._load_template_flowsheet()
+
+        assert Path(loaded[0]).read_bytes() == b"v1"
+        assert Path(loaded[1]).read_bytes() == b"v2"
+
+    def test_template_directory_is_removed_at_exit(self, client, tmp_path, monkeypatch):
+        registered = []
+        monkeypatch.setattr(dwsim_client.atexit, "register",
+                            lambda func, *args, **kwargs: registered.append((func, args, kwargs)))
+        template = tmp_path / "base.dwxmz"
+        template.write_bytes(b"v1")
+        client._template_path = str(template)
+        client._automation = type("_Automation", (), {"LoadFlowsheet": lambda self, path: None})()
+
+        client._load_template_flowsheet()
+        client._load_template_flowsheet()
+
+        assert len(registered) == 1
+        func, args, kwargs = registered[0]
+        func(*args, **kwargs)
+        assert not dwsim_client._template_dir.exists()
+
+    def test_template_prototype_is_cloned_when_supported(self, client, tmp_path):
+        template = tmp_path / "base.dwxmz"
+        template.write_bytes(b"v1")
+        loads, clones = [], []
+
+        class _Automation:
+            def LoadFlowsheet(self, path):
+                loads.append(path)
+                return "prototype"
+
+            def CloneFlowsheet(self, flowsheet):
+                clones.append(flowsheet)
+                return f"clone-{len(clones)}"
+
+        client._template_path = str(template)
+        client._automation = _Automation()
+
+        assert client._load_template_flowsheet() == "clone-1"
+        assert client._load_template_flowsheet() == "clone-2"
+        assert len(loads) == 1 and clones == ["prototype", "prototype"]
+
+
+    def test_flowsheet_clone_is_not_trusted_as_deep_copy(self, client, tmp_path):
+        template = tmp_path / "base.dwxmz"
+        template.write_bytes(b"v1")
+        loads = []
+
+        class _Flowsheet:
+            def __init__(self, label):
+                self.label = label
+
+            def Clone(self):  # may be memberwise
+                return self
+
+        class _Automation:
+            def LoadFlowsheet(self, path):
+                loads.append(path)
+                return _Flowsheet("loaded")
+
+        client._template_path = str(template)
+        client._automation = _Automation()
+
+        first = client._load_template_flowsheet()
+        second = client._load_template_flowsheet()
+
+        assert first is not second
+        assert client._template_prototype is None
+        assert len(loads) == 2
+
+class TestConnectStreams:
+    def test_each_unit_resolved_once_and_ports_wired(self, client, monkeypatch):
+        class _Unit:
+            def __init__(self):
+                self.inlets, self.outlets = [], []
+
+            def SetInletStream(self, port, stream):
+                self.inlets.append((port, stream))
+                return True
+
+            def SetOutletStream(self, port, stream):
+                self.outlets.append((port, stream))
+                return True
+
+        mixer, pump = _Unit(), _Unit()
+        resolved = []
+        monkeypatch.setattr(client, "_resolve_unit_object",
+                            lambda fs, name, unit: resolved.append(name) or unit)
+        streams = [
+            schemas.StreamSpec(id="a", target="mix"),
+            schemas.StreamSpec(id="b", target="mix"),
+            schemas.StreamSpec(id="c", source="mix", target="pump"),
+            schemas.StreamSpec(id="d", source="pump", target="missing"),
+        ]
+        stream_map = {s.id: f"obj-{s.id}" for s in streams}
+        warnings = []
+
+        client._connect_streams(object(), streams, stream_map, {"mix": mixer, "pump": pump}, warnings)
+
+        assert sorted(resolved) == ["mix", "pump"]
+        assert mixer.inlets == [(0, "obj-a"), (0, "obj-b")]
+        assert mixer.outlets == [(0, "obj-c")]
+        assert pump.inlets == [(0, "obj-c")] and pump.outlets == [(0, "obj-d")]
+        assert warnings == ["Target unit 'missing' not found for stream 'd'"]
+        assert DWSIMClient._BULK_CONNECT[("_Unit", "ConnectInlets")] is False
+
+
+class TestMockProperties:
+    def test_mock_values_come_from_preallocated_pools(self, client):
+        request = schemas.PropertyRequest(
+            stream=schemas.StreamSpec(id="s", properties={"temperature": 25.0}),
+            thermo=schemas.ThermoConfig(components=["Water"]),
+        )
+        props = client.calculate_properties(request).properties
+
+        assert props["temperature_c"] == 25.0
+        assert -500 <= props["enthalpy_kj_per_kg"] <= 2000
+        assert 200 <= props["density_kg_per_m3"] <= 900
+        assert props["enthalpy_kj_per_kg"] in _ENTHALPY_POOL
+        assert props["density_kg_per_m3"] in _DENSITY_POOL
+
+    def test_same_state_bin_returns_same_values(self, client):
+        def props(temperature, pressure):
+            request = schemas.PropertyRequest(
+                stream=schemas.StreamSpec(id="s", properties={"temperature": temperature, "pressure": pressure}),
+                thermo=schemas.ThermoConfig(components=["Water"]),
+            )
+            result = client.calculate_properties(request).properties
+            return result["enthalpy_kj_per_kg"], result["density_kg_per_m3"]
+
+        assert props(25.0, 101.3) == props(25.2, 99.0)
+        assert props(25.0, 101.3) != props(80.0, 101.3)
+        assert props(float("nan"), 101.3) == props(0.0, 101.3)
+
+    def test_batch_matches_single_requests(self, client):
+        requests = [
+            schemas.PropertyRequest(
+                stream=schemas.StreamSpec(id=f"s{i}", properties={"temperature": t, "pressure": p}),
+                thermo=schemas.ThermoConfig(components=["Water"]),
+            )
+            for i, (t, p) in enumerate([(25.0, 101.3), (80.0, 500.0), (25.0, 101.3)])
+        ]
+
+        batch = client.calculate_properties_batch(requests)
+
+        assert batch == [client.calculate_properties(request) for request in requests]
+        assert client.calculate_properties_batch([]) == []
+
+    def test_mock_result_covers_every_stream_and_unit(self, client):
+        payload = _simple_payload()
+        payload.thermo.components = ["Water", "Ethanol"]
+        result = client._mock_result(payload)
+
+        assert [s.id for s in result.streams] == ["s1"]
+        assert set(result.streams[0].composition) == {"Water", "Ethanol"}
+        assert all(0 <= v <= 1 for v in result.streams[0].composition.values())
+        assert [u.id for u in result.units] == ["p1"]
+        assert -5000 <= result.units[0].duty_kw <= 5000
+        assert result.diagnostics == {"mode": "mock"}
+        # Built without validation, so it must round-trip unchanged
+        assert schemas.SimulationResult.model_validate(result.model_dump()) == result
+
+
+    def test_json_fast_path_matches_model_dump(self, client):
+        import json
+
+        payload = _simple_payload()
+        body = client.simulate_flowsheet_json(payload)
+
+        assert isinstance(body, bytes)
+        assert json.loads(body).keys() == client.simulate_flowsheet(payload).model_dump(mode="json").keys()
+
+class TestSampledException:
+    def test_repeated_error_logs_one_traceback_per_interval(self, monkeypatch):
+        from loguru import logger
+
+        monkeypatch.setattr(dwsim_client, "_last_exc_ts", {})
+        records = []
+        sink = logger.add(lambda msg: records.append(msg.record), level="DEBUG")
+        try:
+            for _ in range(3):
+                dwsim_client._sampled_exception(RuntimeError("licence expired"), "DWSIM failed: {}", "x")
+            dwsim_client._sampled_exception(ValueError("other"), "DWSIM failed: {}", "y")
+        finally:
+            logger.remove(sink)
+
+        levels = [(r["level"].name, r["exception"] is not None) for r in records]
+        assert levels == [("ERROR", True), ("DEBUG", False), ("DEBUG", False), ("ERROR", True)]
+
+
+class TestCreateUnits:
+    @pytest.fixture(autouse=True)
+    def _fresh_create_methods(self, monkeypatch):
+        monkeypatch.setattr(DWSIMClient, "_CREATE_METHODS", {})
+
+    def test_working_signature_is_tried_first_for_later_units(self, client, monkeypatch):
+        monkeypatch.setattr(client, "_get_object_type_value", lambda name: None)
+
+        class _Unit:
+            def SetProp(self, *args):
+                pass
+
+        class _Flowsheet:
+            def __init__(self):
+                self.calls = []
+
+            def AddObject(self, *args):
+                self.calls.append(len(args))
+                if len(args) != 2:
+                    raise TypeError("no overload")
+                return _Unit()
+
+        fs = _Flowsheet()
+        units = [schemas.UnitSpec(id=f"d{i}", type="flashDrum") for i in range(3)]
+        warnings = []
+
+        unit_map = client._create_units(fs, units, warnings)
+
+        assert list(unit_map) == ["d0", "d1", "d2"]
+        # Only the first unit pays for the (str, coords) signature failing
+        assert fs.calls == [4, 2, 2, 2]
+        assert warnings == []
+
+        # Other clients and later flowsheets of the same type start with it
+        other, later = DWSIMClient(), _Flowsheet()
+        monkeypatch.setattr(other, "_get_object_type_value", lambda name: None)
+        other._create_units(later, units[:1], warnings)
+        assert later.calls == [2]
+
+
+class TestInitializeAutomation:
+    def test_library_path_is_not_added_to_sys_path(self, tmp_path, monkeypatch):
+        import sys
+
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path))
+        monkeypatch.setitem(sys.modules, "pythonnet", None)
+        monkeypatch.setitem(sys.modules, "clr", None)
+        before = list(sys.path)
+
+        assert DWSIMClient()._initialize_automation_now() is None
+        assert sys.path == before
+
+    def test_assembly_resolver_loads_siblings_on_demand(self, tmp_path):
+        for name in ("DWSIM.MathOps.dll", "System.Memory.dll"):
+            (tmp_path / name).write_bytes(b"")
+        dwsim_client._dir_contents.cache_clear()
+        loaded = []
+
+        class _Args:
+            def __init__(self, name):
+                self.Name = name
+
+        resolve = dwsim_client._assembly_resolver(tmp_path, lambda path: loaded.append(path) or path)
+
+        assert resolve(None, _Args("DWSIM.MathOps, Version=8.0.0.0, Culture=neutral")) == str(
+            tmp_path / "DWSIM.MathOps.dll"
+        )
+        # App-local framework packages are only requested once the
+        # runtime's probing has failed, so they must resolve here
+        assert resolve(None, _Args("System.Memory, Version=4.0.1.1")) == str(
+            tmp_path / "System.Memory.dll"
+        )
+        assert resolve(None, _Args("Missing.Assembly")) is None
+        assert loaded == [str(tmp_path / "DWSIM.MathOps.dll"), str(tmp_path / "System.Memory.dll")]
+
+    def test_reinitialising_does_not_repeat_references(self, tmp_path, monkeypatch):
+        import sys
+        import types
+
+        from app.dwsim_client import _REQUIRED_DLLS
+
+        for name in _REQUIRED_DLLS:
+            (tmp_path / name).write_bytes(b"")
+        dwsim_client._dir_contents.cache_clear()
+        references = []
+        automation_module = types.ModuleType("DWSIM.Automation")
+        automation_module.Automation3 = object
+        monkeypatch.setenv("DWSIM_LIB_PATH", str(tmp_path))
+        monkeypatch.setitem(sys.modules, "pythonnet", None)
+        monkeypatch.setitem(sys.modules, "clr", types.SimpleNamespace(AddReference=references.append))
+        monkeypatch.setitem(sys.modules, "DWSIM", types.ModuleType("DWSIM"))
+        monkeypatch.setitem(sys.modules, "DWSIM.Automation", automation_module)
+
+        assert DWSIMClient()._initialize_automation_now() is not None
+        assert DWSIMClient()._initialize_automation_now() is not None
+        assert sorted(Path(path).name for path in references) == sorted(_REQUIRED_DLLS)
+
+class TestExtractStreams:
+    def test_clr_getters_are_bound_once_per_stream(self, client):
+        lookups = []
+        values = {"temperature": 300.0, "pressure": 101.3, "totalflow": 0.5,
+                  "vaporfraction": 0.0, "molefraction": 1.0}
+
+        class _Stream:
+            Name = "s1"
+
+            def __getattr__(self, name):
+                lookups.append(name)
+                if name == "GetProp":
+                    return lambda prop, *args: [values[prop]]
+                raise AttributeError(name)
+
+        class _Flowsheet:
+            def GetMaterialStreams(self):
+                return [_Stream()]
+
+        payload = _simple_payload()
+        results = client._extract_streams(_Flowsheet(), payload)
+
+        assert len(results) == 1
+        assert results[0].temperature_c == pytest.approx(26.85)
+        assert results[0].mass_flow_kg_per_h == pytest.approx(1800.0)
+        # One lookup for the diagnostics log line, one for the extraction
+        assert lookups.count("GetProp") == 2
+
+    def test_fallback_getters_are_looked_up_once(self, client):
+        lookups = []
+        values = {"temperature": 300.0, "pressure": 101.3, "massflow": 0.5}
+
+        class _Stream:
+            Name = "s1"
+
+            def __getattr__(self, name):
+                lookups.append(name)
+                if name == "GetProp":
+                    return lambda *args: [None]
+                if name == "GetOverallProp":
+                    return values.get
+                raise AttributeError(name)
+
+        class _Flowsheet:
+            def GetMaterialStreams(self):
+                return [_Stream()]
+
+        results = client._extract_streams(_Flowsheet(), _simple_payload())
+
+        assert results[0].temperature_c == pytest.approx(26.85)
+        assert results[0].mass_flow_kg_per_h == pytest.approx(1800.0)
+        assert lookups.count("GetOverallProp") == 1
+
+    def test_stream_names_are_read_once(self, client):
+        reads = []
+
+        class _Stream:
+            @property
+            def Name(self):
+                reads.append("Name")
+                return "s1"
+
+            def GetProp(self, prop, *args):
+                return [300.0]
+
+        class _Flowsheet:
+            def GetMaterialStreams(self):
+                return [_Stream()]
+
+        results = client._extract_streams(_Flowsheet(), _simple_payload())
+
+        assert [r.id for r in results] == ["s1"]
+        assert reads == ["Name"]
+
+    def test_parallel_extraction_keeps_stream_order(self, client):
+        class _Stream:
+            def __init__(self, name, temp_k):
+                self.Name = name
+                self._temp_k = temp_k
+
+            def GetProp(self, prop, *args):
+                return [self._temp_k if prop == "temperature" else 1.0]
+
+        class _Flowsheet:
+            def GetMaterialStreams(self):
+                return [_Stream("a", 300.0), _Stream("b", 310.0), _Stream("c", 320.0)]
+
+        payload = schemas.FlowsheetPayload(
+            name="parallel",
+            units=[],
+            streams=[schemas.StreamSpec(id=sid) for sid in ("a", "b", "c")],
+            thermo=schemas.ThermoConfig(components=["Water"]),
+        )
+        client._parallel_extract = True
+        results = client._extract_streams(_Flowsheet(), payload)
+
+        assert [r.id for r in results] == ["a", "b", "c"]
+        assert [round(r.temperature_c, 2) for r in results] == [26.85, 36.85, 46.85]
+
+
+class TestExtractUnits:
+    def test_names_are_read_only_for_units(self, client):
+        reads = []
+
+        class MaterialStream:
+            @property
+            def Name(self):
+                reads.append("stream")
+                return "s1"
+
+        class Pump:
+            __hash__ = None  # CLR objects are not hashed for matching
+            Name = "P-101"
+            DeltaQ = 12.5
+
+        class _Flowsheet:
+            def GetUnitOperations(self):
+                return [MaterialStream(), Pump()]
+
+        payload = schemas.FlowsheetPayload(
+            name="units",
+            units=[schemas.UnitSpec(id="P-101", type="pump")],
+            streams=[],
+            thermo=schemas.ThermoConfig(components=["Water"]),
+        )
+
+        results = client._extract_units(_Flowsheet(), payload)
+
+        assert [(r.id, r.duty_kw) for r in results] == [("P-101", 12.5)]
+        assert reads == []
+
+    def test_parallel_extraction_keeps_unit_order(self, client):
+        class Unit:
+            def __init__(self, name, duty):
+                self.Name = name
+                self.DeltaQ = duty
+
+        class _Flowsheet:
+            def GetUnitOperations(self):
+                return [Unit("u1", 1.0), Unit("u2", 2.0), Unit("u3", 3.0)]
+
+        client._parallel_extract = True
+        results = client._extract_units(_Flowsheet())
+
+        assert [(r.id, r.duty_kw) for r in results] == [("u1", 1.0), ("u2", 2.0), ("u3", 3.0)]
+
+class TestConfigureUnits:
+    def test_parameters_are_written_from_handler_table(self, client, monkeypatch):
+        resolved = []
+        monkeypatch.setattr(client, "_resolve_unit_object",
+                            lambda fs, name, unit: resolved.append(name) or unit)
+
+        class _Unit:
+            def __init__(self):
+                self.props = {}
+
+            def SetProp(self, prop, value):
+                self.props[prop] = value
+
+        pump, column, mixer = _Unit(), _Unit(), _Unit()
+        units = [
+            schemas.UnitSpec(id="p1", type="pump", parameters={"pressure_rise": 200, "efficiency": 0.7}),
+            schemas.UnitSpec(id="c1", type="distillationColumn", parameters={"stages": 12}),
+            schemas.UnitSpec(id="m1", type="mixer", parameters={"duty": 5}),
+        ]
+        warnings = []
+
+        client._configure_units(object(), units, {"p1": pump, "c1": column, "m1": mixer}, warnings)
+
+        assert pump.props == {"PressureIncrease": 200, "Efficiency": 0.7}
+        assert column.props == {"NumberOfStages": 12}
+        assert mixer.props == {}
+        assert resolved == ["p1", "c1"]
+        assert warnings == []
+
+    def test_properties_missing_from_prop_list_are_skipped(self, client, monkeypatch):
+        monkeypatch.setattr(DWSIMClient, "_UNIT_PROPS", {})
+        calls = []
+
+        class _Pump:
+            def GetPropList(self):
+                calls.append("GetPropList")
+                return ["PressureIncrease"]
+
+            def SetProp(self, prop, value):
+                calls.append(prop)
+
+        units = [
+            schemas.UnitSpec(id=f"p{i}", type="pump", parameters={"pressure_rise": 200, "efficiency": 0.7})
+            for i in range(2)
+        ]
+        client._configure_units(object(), units, {"p0": _Pump(), "p1": _Pump()}, [])
+
+        assert calls == ["GetPropList", "PressureIncrease", "PressureIncrease"]
+
+
+class TestDefaultClient:
+    def test_default_client_is_shared(self, monkeypatch):
+        monkeypatch.setattr(dwsim_client, "_default_client", None)
+
+        assert dwsim_client.get_default_client() is dwsim_client.get_default_client()